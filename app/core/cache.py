@@ -0,0 +1,133 @@
+"""Bounded in-process LRU + TTL cache for serialized API responses."""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from app.core.conditional import CachedResponse, build_response
+from app.core.config import settings
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries also expire after ``ttl_seconds``.
+
+    ``generation`` increases on every invalidation. Readers capture it before
+    loading from the database and pass it to ``set``; if a write invalidated
+    anything in between, the possibly stale value is not stored.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return a live entry without updating recency or counters."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store ``value`` unless the cache was invalidated since ``generation``."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._data[key] = (self._clock() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop ``keys`` and fence off any loads that started before this call."""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+def candidate_key(candidate_id: int) -> tuple:
+    return ("candidate", candidate_id)
+
+def resume_key(resume_id: int) -> tuple:
+    return ("resume", resume_id)
+
+response_cache = TTLCache(
+    max_entries=settings.CACHE_MAX_ENTRIES if settings.CACHE_ENABLED else 0,
+    ttl_seconds=settings.CACHE_TTL_SECONDS,
+)
+
+# Exact ``X-Total-Count`` results, per table and filter combination
+count_cache = TTLCache(max_entries=1000, ttl_seconds=settings.COUNT_CACHE_SECONDS)
+
+async def read_through(key: Hashable, load: Callable[[], Awaitable[Any]],
+                       last_modified_of: Optional[Callable[[Any], Optional[datetime]]] = None,
+                       refresh: bool = False) -> Optional[CachedResponse]:
+    """
+    Return the cached response for ``key``, loading and caching it on a miss.
+
+    ``load`` returns an ``Encoded`` value and body (or None when the entity does
+    not exist; misses for missing entities are not cached). ``last_modified_of``
+    extracts the Last-Modified timestamp from the loaded value. ``refresh``
+    skips the lookup and replaces the entry with a fresh load.
+    """
+    cached = None if refresh else response_cache.get(key)
+    if cached is not None:
+        return cached
+    generation = response_cache.generation
+    loaded = await load()
+    if loaded is None:
+        return None
+    last_modified = last_modified_of(loaded.value) if last_modified_of else None
+    cached = build_response(loaded.body, last_modified)
+    response_cache.set(key, cached, generation)
+    return cached
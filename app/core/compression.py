@@ -0,0 +1,199 @@
+"""
+Response compression negotiated from ``Accept-Encoding``.
+
+``CompressionMiddleware`` picks the best encoding both sides support (zstd, br,
+gzip; the first two only when the ``zstandard`` / ``brotli`` packages are
+installed), and compresses JSON, NDJSON and text bodies of at least
+``minimum_size`` bytes. Streaming responses are compressed chunk by chunk, each
+chunk flushed so the client can decode it right away, so nothing is buffered.
+"""
+import zlib
+from typing import Dict, Optional, Sequence
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; "br" is then never negotiated
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; "zstd" is then never negotiated
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/problem+json", "text/")
+
+# Chunks at least this large are compressed in the threadpool; zlib, brotli and
+# zstandard release the GIL, so the event loop keeps serving other requests
+OFFLOAD_BYTES = 64 * 1024
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+class BrotliCompressor:
+    def __init__(self, quality: int):
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data) + self._obj.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.process(data) + self._obj.finish()
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data) + self._obj.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._obj.compress(data) + self._obj.flush()
+
+COMPRESSORS = {"gzip": GzipCompressor}
+if brotli is not None:
+    COMPRESSORS["br"] = BrotliCompressor
+if zstandard is not None:
+    COMPRESSORS["zstd"] = ZstdCompressor
+
+def available_encodings(preference: str) -> tuple:
+    """The encodings of a comma-separated preference list that can actually be produced."""
+    names = [name.strip() for name in preference.split(",") if name.strip()]
+    unknown = [name for name in names if name not in ("gzip", "br", "zstd")]
+    if unknown:
+        raise ValueError(f"Unsupported compression encodings: {', '.join(unknown)}")
+    return tuple(name for name in names if name in COMPRESSORS)
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Best of ``available`` (in server preference order) for an ``Accept-Encoding``
+    header: the highest q-value wins, ``*`` covers unlisted codings, q=0 refuses.
+    """
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[coding] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for coding in available:
+        q = weights.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+def is_compressible(headers: Headers, status: int, minimum_size: int) -> bool:
+    if status < 200 or status in (204, 206, 304):
+        return False
+    if "content-encoding" in headers or "content-range" in headers:
+        return False
+    # Byte ranges would have to refer to the compressed representation
+    if "accept-ranges" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    if not content_type.startswith(COMPRESSIBLE_TYPES):
+        return False
+    length = headers.get("content-length")
+    return length is None or int(length) >= minimum_size
+
+async def _run(fn, data: bytes) -> bytes:
+    if len(data) >= OFFLOAD_BYTES:
+        return await run_in_threadpool(fn, data)
+    return fn(data)
+
+class CompressionMiddleware:
+    """ASGI middleware compressing eligible responses with the negotiated encoding."""
+
+    def __init__(self, app, encodings: Sequence[str], levels: Dict[str, int], minimum_size: int = 1024):
+        self.app = app
+        self.encodings = tuple(encodings)
+        self.levels = levels
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate_encoding(accept_encoding, self.encodings) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                # Held back until the first body chunk shows whether to compress
+                start_message = message
+                headers = Headers(raw=message["headers"])
+                passthrough = not is_compressible(headers, message["status"], self.minimum_size)
+                return
+            if message_type != "http.response.body" or passthrough:
+                if start_message is not None:
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start_message is not None:
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(start_message)
+                    start_message = None
+                    await send(message)
+                    return
+                compressor = COMPRESSORS[encoding](self.levels[encoding])
+                headers = MutableHeaders(raw=list(start_message["headers"]))
+                headers["content-encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    # The compressed bytes differ, so a strong validator no longer holds
+                    headers["etag"] = f"W/{etag}"
+                start_message["headers"] = headers.raw
+                if more_body:
+                    del headers["content-length"]
+                else:
+                    body = await _run(compressor.finish, body)
+                    headers["content-length"] = str(len(body))
+                    await send(start_message)
+                    start_message = None
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(start_message)
+                start_message = None
+
+            if more_body:
+                if body:
+                    await send({"type": "http.response.body", "body": await _run(compressor.compress, body),
+                                "more_body": True})
+            else:
+                await send({"type": "http.response.body", "body": await _run(compressor.finish, body)})
+
+        await self.app(scope, receive, send_compressed)
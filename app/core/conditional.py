@@ -0,0 +1,79 @@
+"""HTTP conditional request support: strong ETags, Last-Modified and 304 responses."""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple, Optional
+
+from fastapi import Request, Response, status
+
+from app import __version__
+
+class CachedResponse(NamedTuple):
+    """A serialized JSON body with its validators."""
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime] = None
+
+def make_etag(body: bytes) -> str:
+    """Strong ETag over the exact response bytes (and API version)."""
+    digest = hashlib.blake2b(body, digest_size=16, key=__version__.encode()).hexdigest()
+    return f'"{digest}"'
+
+def build_response(body: bytes, last_modified: Optional[datetime] = None) -> CachedResponse:
+    return CachedResponse(body=body, etag=make_etag(body), last_modified=last_modified)
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison as required for If-None-Match (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def not_modified_since(request: Request, last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-Modified-Since; ignored when If-None-Match is present."""
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+def only_if_modified_since(request: Request) -> bool:
+    """True when the request is conditional on a date alone."""
+    return "if-modified-since" in request.headers and "if-none-match" not in request.headers
+
+def validator_headers(etag: Optional[str], last_modified: Optional[datetime]) -> dict:
+    headers = {"Cache-Control": "no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def not_modified(etag: Optional[str] = None, last_modified: Optional[datetime] = None) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+
+def conditional_response(request: Request, cached: CachedResponse) -> Response:
+    """Return 304 if the client's validators match ``cached``, else the JSON body."""
+    if_none_match = request.headers.get("if-none-match")
+    if (if_none_match and etag_matches(if_none_match, cached.etag)) or not_modified_since(
+        request, cached.last_modified
+    ):
+        return not_modified(cached.etag, cached.last_modified)
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=validator_headers(cached.etag, cached.last_modified),
+    )
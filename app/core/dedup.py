@@ -0,0 +1,173 @@
+"""
+Fuzzy duplicate detection for candidate records.
+
+Records are grouped by blocking keys (normalized phone, phonetic name code,
+normalized email local part) and only compared within a block; inside a block
+all pairs are scored at once with NumPy over hashed character-trigram vectors.
+"""
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.core.logger import logger
+
+# Hashed trigram vector width; collisions only ever raise similarity slightly
+FEATURES = 256
+# Rows compared against a whole block per matrix product
+TILE_ROWS = 1024
+# Larger blocks (e.g. a very common surname) are skipped rather than compared n^2
+MAX_BLOCK_SIZE = 20000
+
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+    "l": "4", **dict.fromkeys("mn", "5"), "r": "6",
+}
+
+class CandidateRecord(NamedTuple):
+    candidate_id: int
+    first_name: str
+    last_name: str
+    email: str
+    phone: Optional[str]
+
+class DuplicatePair(NamedTuple):
+    candidate_id: int
+    duplicate_id: int
+    score: float
+    reasons: Tuple[str, ...]
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Digits only, without country prefix (last 10 digits); None if too short to trust."""
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-10:] if len(digits) >= 7 else None
+
+def email_local(email: str) -> str:
+    """Mailbox name with dots and +tags removed: j.doe+jobs@x.com -> jdoe."""
+    local = email.lower().split("@", 1)[0]
+    return local.split("+", 1)[0].replace(".", "")
+
+def soundex(name: str) -> str:
+    letters = re.sub(r"[^a-z]", "", name.lower())
+    if not letters:
+        return ""
+    code = letters[0].upper()
+    previous = SOUNDEX_CODES.get(letters[0], "")
+    for char in letters[1:]:
+        digit = SOUNDEX_CODES.get(char, "")
+        if digit and digit != previous:
+            code += digit
+        if char not in "hw":
+            previous = digit
+    return (code + "000")[:4]
+
+def _keys(record: CandidateRecord, phone: Optional[str], local: str) -> List[tuple]:
+    keys = [("name", soundex(record.last_name) + record.first_name[:1].lower())]
+    if phone:
+        keys.append(("phone", phone))
+    if len(local) >= 4:
+        keys.append(("email", local))
+    return keys
+
+def blocking_keys(record: CandidateRecord) -> List[tuple]:
+    """Keys a record is grouped under; records are only compared within a group."""
+    return _keys(record, normalize_phone(record.phone), email_local(record.email))
+
+def _trigrams(value: str) -> List[int]:
+    # crc32 rather than hash(): str hashes are salted per process, which would
+    # make collisions (and scores near the threshold) vary between runs
+    padded = f"  {value.lower()} "
+    return [zlib.crc32(padded[i:i + 3].encode()) % FEATURES for i in range(len(padded) - 2)]
+
+class TrigramIndex:
+    """Hashed trigrams of many values, computed once and gathered into vectors per block."""
+
+    def __init__(self, values: Sequence[str]):
+        lengths, cols = [], []
+        for value in values:
+            grams = _trigrams(value)
+            lengths.append(len(grams))
+            cols.extend(grams)
+        self.cols = np.asarray(cols, dtype=np.int16)
+        self.offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+
+    def vectors(self, members: np.ndarray) -> np.ndarray:
+        """L2-normalized hashed trigram counts, one row per member index."""
+        starts = self.offsets[members]
+        lengths = self.offsets[members + 1] - starts
+        rows = np.repeat(np.arange(len(members)), lengths)
+        # Position of every trigram of every member within self.cols
+        shift = starts - (np.cumsum(lengths) - lengths)
+        positions = np.arange(lengths.sum()) + np.repeat(shift, lengths)
+        matrix = np.zeros((len(members), FEATURES), dtype=np.float32)
+        np.add.at(matrix, (rows, self.cols[positions]), 1.0)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-9)
+
+class _Features:
+    """Per-record comparison features, derived once for the whole run."""
+
+    def __init__(self, records: Sequence[CandidateRecord]):
+        self.email_locals = [email_local(record.email) for record in records]
+        self.phones = np.array([normalize_phone(record.phone) or "" for record in records])
+        self.names = TrigramIndex([f"{record.first_name} {record.last_name}" for record in records])
+        self.emails = TrigramIndex(self.email_locals)
+
+def _score_block(features: _Features, members: np.ndarray, threshold: float):
+    """Yield (i, j, score, name_sim, email_sim, same_phone) for pairs in one block."""
+    names = features.names.vectors(members)
+    emails = features.emails.vectors(members)
+    phones = features.phones[members]
+    has_phone = phones != ""
+
+    for start in range(0, len(members), TILE_ROWS):
+        stop = min(start + TILE_ROWS, len(members))
+        name_sim = names[start:stop] @ names.T
+        email_sim = emails[start:stop] @ emails.T
+        both_phones = has_phone[start:stop, None] & has_phone[None, :]
+        same_phone = both_phones & (phones[start:stop, None] == phones[None, :])
+        # A shared phone is strong evidence on its own; two different phones count against
+        score = np.where(
+            same_phone,
+            0.6 + 0.3 * name_sim + 0.1 * email_sim,
+            np.where(both_phones, 0.6 * name_sim + 0.2 * email_sim, 0.7 * name_sim + 0.3 * email_sim),
+        )
+        # Each unordered pair once: only columns to the right of the row's own
+        upper = np.arange(len(members))[None, :] > np.arange(start, stop)[:, None]
+        score = np.where(upper, score, 0.0)
+        for a, b in zip(*np.nonzero(score >= threshold)):
+            yield (members[start + a], members[b], float(score[a, b]),
+                   float(name_sim[a, b]), float(email_sim[a, b]), bool(same_phone[a, b]))
+
+def find_duplicate_pairs(records: Sequence[CandidateRecord], threshold: float = 0.8) -> List[DuplicatePair]:
+    """
+    Score candidate pairs that share a blocking key; return those at or above
+    ``threshold`` (0-1), each pair once with ``candidate_id < duplicate_id``.
+    """
+    features = _Features(records)
+    blocks: Dict[tuple, List[int]] = defaultdict(list)
+    for index, record in enumerate(records):
+        for key in _keys(record, features.phones[index], features.email_locals[index]):
+            blocks[key].append(index)
+
+    best: Dict[Tuple[int, int], DuplicatePair] = {}
+    for key, members in blocks.items():
+        if len(members) < 2:
+            continue
+        if len(members) > MAX_BLOCK_SIZE:
+            logger.warning("Skipping duplicate-detection block %s with %s candidates", key, len(members))
+            continue
+        for i, j, score, name_sim, email_sim, same_phone in _score_block(features, np.array(members), threshold):
+            a, b = sorted((records[i].candidate_id, records[j].candidate_id))
+            if a == b:
+                continue
+            reasons = tuple(reason for reason, matched in (
+                ("phone", same_phone), ("name", name_sim >= 0.75), ("email", email_sim >= 0.75)
+            ) if matched)
+            current = best.get((a, b))
+            if current is None or score > current.score:
+                best[(a, b)] = DuplicatePair(a, b, round(score, 4), reasons)
+    return sorted(best.values(), key=lambda pair: (-pair.score, pair.candidate_id, pair.duplicate_id))
@@ -31,3 +31,52 @@ class DatabaseConnectionError(HTTPException):
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Could not connect to the database."
         )
+
+class InvalidCursorError(HTTPException):
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid pagination cursor: {cursor}"
+        )
+
+class ResumeFileNotFoundError(HTTPException):
+    def __init__(self, resume_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Resume with ID {resume_id} has no stored file."
+        )
+
+class UnsupportedUploadTypeError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send the file as multipart/form-data in a part named 'file'."
+        )
+
+class UploadTooLargeError(HTTPException):
+    def __init__(self, max_bytes: int):
+        super().__init__(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"Uploaded file exceeds the {max_bytes} byte limit."
+        )
+
+class InvalidUploadError(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
+class InvalidFieldSelectionError(HTTPException):
+    def __init__(self, parameter: str, unknown: list[str], allowed: list[str]):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown {parameter}: {', '.join(unknown)}. Allowed: {', '.join(allowed)}."
+        )
+
+class InvalidIdListError(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
@@ -0,0 +1,61 @@
+"""Encoders for streaming NDJSON and CSV exports."""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import AsyncIterator, Callable, Iterable, List, Optional
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_ndjson(records: Iterable[dict]) -> bytes:
+    """One JSON document per line."""
+    return "".join(
+        json.dumps(record, default=_json_default, separators=(",", ":")) + "\n" for record in records
+    ).encode()
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def encode_csv(records: Iterable[dict], fieldnames: List[str], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    if header:
+        writer.writeheader()
+    writer.writerows({key: _csv_value(value) for key, value in record.items()} for record in records)
+    return buffer.getvalue().encode()
+
+async def encode_stream(partitions: AsyncIterator[list], to_records: Callable[[list], List[dict]],
+                        export_format: str, fieldnames: List[str],
+                        flush: Optional[Callable[[], List[dict]]] = None) -> AsyncIterator[bytes]:
+    """
+    Turn streamed row partitions into encoded body chunks, one chunk per partition.
+
+    ``to_records`` shapes a partition into dicts; ``flush`` returns any records
+    still buffered once the rows run out.
+    """
+    if export_format == "csv":
+        yield encode_csv([], fieldnames, header=True)
+
+    def encode(records):
+        return encode_csv(records, fieldnames) if export_format == "csv" else encode_ndjson(records)
+
+    async for partition in partitions:
+        records = to_records(partition)
+        if records:
+            yield encode(records)
+    if flush is not None:
+        records = flush()
+        if records:
+            yield encode(records)
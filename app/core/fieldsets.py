@@ -0,0 +1,49 @@
+"""Sparse fieldsets (``?fields=``) and embedded relations (``?include=``) for read endpoints."""
+from typing import NamedTuple, Optional
+
+from app.core.exceptions import InvalidFieldSelectionError
+
+class Fieldset(NamedTuple):
+    """
+    What a read returns: ``columns`` to SELECT (None means all of them) and the
+    relations to embed. ``names`` is the matching field subset for the
+    serializer, or None for the schema's full representation.
+    """
+    columns: Optional[tuple]
+    include: frozenset
+    names: Optional[frozenset]
+
+def _split(value: str) -> list:
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+def parse_fieldset(fields: str | None, include: str | None, schema: type,
+                   key: str, relations: tuple) -> Fieldset:
+    """
+    Validate ``fields``/``include`` query values against ``schema``.
+
+    Without either parameter every column and relation is returned. ``fields``
+    selects columns (``key`` is always kept so responses stay addressable and
+    pageable) and may also name relations; ``include`` lists the relations to
+    embed and defaults to none once ``fields`` is given.
+    """
+    all_columns = tuple(name for name in schema.model_fields if name not in relations)
+    if fields is None:
+        columns = None
+        embedded = set(relations) if include is None else set()
+    else:
+        requested = _split(fields)
+        unknown = [name for name in requested if name not in schema.model_fields]
+        if unknown:
+            raise InvalidFieldSelectionError("fields", unknown, list(schema.model_fields))
+        columns = tuple(name for name in all_columns if name in requested or name == key)
+        embedded = {name for name in requested if name in relations}
+    if include is not None:
+        requested = _split(include)
+        unknown = [name for name in requested if name not in relations]
+        if unknown:
+            raise InvalidFieldSelectionError("include", unknown, list(relations))
+        embedded.update(requested)
+
+    if columns is None and embedded == set(relations):
+        return Fieldset(None, frozenset(embedded), None)
+    return Fieldset(columns, frozenset(embedded), frozenset((columns or all_columns) + tuple(embedded)))
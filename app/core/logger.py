@@ -1,32 +1,137 @@
+"""
+Application logging.
+
+Request threads only put records on a bounded queue; a ``QueueListener``
+thread formats them (JSON lines by default) and writes them to stdout and the
+log file. Pass arguments %-style (``logger.info("Fetched %s", x)``) so the
+message is only built on the listener thread, and use ``read_logger`` for
+per-request info logs on read endpoints: it keeps a sampled fraction.
+"""
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import random
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
-logs_dir = Path("logs")
-logs_dir.mkdir(exist_ok=True)
-
-# Configure logging
-def setup_logger():
-    logger = logging.getLogger("candidate-resume-api")
-    logger.setLevel(logging.INFO)
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(console_format)
-    
-    # File handler
-    file_handler = logging.FileHandler('logs/app.log')
-    file_handler.setLevel(logging.INFO)
-    file_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(file_format)
-    
-    # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    
+from app.core.config import settings
+
+LOGGER_NAME = "candidate-resume-api"
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+RESERVED_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message, ``extra`` fields and traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueue records without formatting them on the calling thread.
+
+    When the queue is full the record is dropped and counted rather than
+    blocking the request.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so msg/args can stay unformatted;
+        # only tracebacks are rendered now, while their frames still exist
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class SampledLogger:
+    """
+    Passes on roughly ``rate`` of its info/debug calls; warnings and errors are
+    never sampled. Kept records carry ``sample_rate`` so counts can be scaled.
+    """
+
+    def __init__(self, target: logging.Logger, rate: float):
+        self.logger = target
+        self.rate = rate
+
+    def _keep(self) -> bool:
+        return self.rate >= 1 or random.random() < self.rate
+
+    def _options(self, kwargs: dict, sampled: bool) -> dict:
+        # Report the caller's line, and keep any extra fields the caller passed
+        kwargs.setdefault("stacklevel", 2)
+        if sampled:
+            kwargs["extra"] = {**(kwargs.get("extra") or {}), "sample_rate": self.rate}
+        return kwargs
+
+    def debug(self, msg, *args, **kwargs) -> None:
+        if self._keep():
+            self.logger.debug(msg, *args, **self._options(kwargs, sampled=True))
+
+    def info(self, msg, *args, **kwargs) -> None:
+        if self._keep():
+            self.logger.info(msg, *args, **self._options(kwargs, sampled=True))
+
+    def warning(self, msg, *args, **kwargs) -> None:
+        self.logger.warning(msg, *args, **self._options(kwargs, sampled=False))
+
+    def error(self, msg, *args, **kwargs) -> None:
+        self.logger.error(msg, *args, **self._options(kwargs, sampled=False))
+
+def build_handlers() -> list:
+    """The handlers that actually write: stdout and, unless LOG_FILE is empty, the log file."""
+    formatter = JsonFormatter() if settings.LOG_FORMAT == "json" else logging.Formatter(TEXT_FORMAT)
+    handlers = [logging.StreamHandler(sys.stdout)]
+    if settings.LOG_FILE:
+        Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(settings.LOG_FILE))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    return handlers
+
+# Running listener, stopped (and drained) at interpreter exit
+listener = None
+
+def setup_logger() -> logging.Logger:
+    global listener
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    handlers = build_handlers()
+    if settings.LOG_QUEUE_ENABLED:
+        queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+        listener = logging.handlers.QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handlers = [queue_handler]
+    for handler in handlers:
+        logger.addHandler(handler)
     return logger
 
 logger = setup_logger()
+read_logger = SampledLogger(logger, settings.LOG_READ_SAMPLE_RATE)
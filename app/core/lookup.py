@@ -0,0 +1,28 @@
+"""Batch lookups by ID (``?ids=`` on the list endpoints)."""
+from fastapi import Query, Request
+
+from app.core.config import settings
+from app.core.exceptions import InvalidIdListError
+
+IDS_QUERY = Query(None, description="Comma-separated IDs to look up instead of listing a page; "
+                                    "results follow request order, with a not_found marker for missing IDs.")
+
+def parse_ids(request: Request, exclusive: tuple) -> list[int]:
+    """
+    The requested IDs, in request order (duplicates kept), from ``ids=1,2,3``
+    and/or repeated ``ids`` parameters.
+
+    At most ``BATCH_MAX_IDS`` are accepted, and none of the ``exclusive`` query
+    parameters (pagination, filters) may be combined with a lookup.
+    """
+    conflicting = [name for name in exclusive if name in request.query_params]
+    if conflicting:
+        raise InvalidIdListError(f"ids cannot be combined with {', '.join(conflicting)}.")
+    values = [value.strip() for param in request.query_params.getlist("ids")
+              for value in param.split(",") if value.strip()]
+    if len(values) > settings.BATCH_MAX_IDS:
+        raise InvalidIdListError(f"At most {settings.BATCH_MAX_IDS} ids can be looked up per request.")
+    try:
+        return [int(value) for value in values]
+    except ValueError as e:
+        raise InvalidIdListError("ids must be comma-separated integers.") from e
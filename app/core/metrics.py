@@ -0,0 +1,207 @@
+"""
+In-process request and database metrics in Prometheus text format.
+
+Collectors are plain counters behind one uncontended lock each, so recording
+a request costs a few microseconds; labels are limited to method, route
+template and status to keep cardinality bounded.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import event
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Route label for requests that matched no route (404s), so scanners can't explode cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram (Prometheus-style cumulative buckets)."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def values(self) -> Tuple[list, float]:
+        """Cumulative ``(upper bound, count)`` pairs ending with ``+Inf``, and the sum."""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for bound, count in zip(self.buckets + ("+Inf",), counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative, total
+
+    def snapshot(self) -> dict:
+        cumulative, total = self.values()
+        return {
+            "buckets": {str(bound): count for bound, count in cumulative},
+            "count": cumulative[-1][1],
+            "sum": round(total, 3),
+        }
+
+class Gauge:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def add(self, amount: int) -> None:
+        with self._lock:
+            self.value += amount
+
+class LabeledHistograms:
+    """One histogram per label-value tuple, created on first use."""
+
+    def __init__(self, name: str, help_text: str, labelnames: Tuple[str, ...], buckets):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._children: Dict[tuple, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values) -> Histogram:
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, Histogram(self.buckets))
+        return child
+
+    def render(self, lines: list) -> None:
+        lines.append(f"# HELP {self.name} {self.help_text}")
+        lines.append(f"# TYPE {self.name} histogram")
+        for values, child in sorted(self._children.items()):
+            label_text = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values))
+            render_histogram(lines, self.name, child, label_text)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def render_histogram(lines: list, name: str, histogram: Histogram, label_text: str = "") -> None:
+    prefix = f"{label_text}," if label_text else ""
+    cumulative, total = histogram.values()
+    for bound, count in cumulative:
+        lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {count}')
+    suffix = f"{{{label_text}}}" if label_text else ""
+    lines.append(f"{name}_sum{suffix} {_number(total)}")
+    lines.append(f"{name}_count{suffix} {cumulative[-1][1]}")
+
+def render_sample(lines: list, name: str, kind: str, help_text: str, samples: list) -> None:
+    """Append a counter/gauge family; ``samples`` is a list of ``(label_text, value)``."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for label_text, value in samples:
+        labels = f"{{{label_text}}}" if label_text else ""
+        lines.append(f"{name}{labels} {_number(value)}")
+
+class RequestStats:
+    """Database work done on behalf of the current request."""
+
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+# Set per request by MetricsMiddleware; threadpool calls run in a copy of the
+# context, so the same RequestStats object is updated from worker threads.
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+request_latency = LabeledHistograms(
+    "http_request_duration_seconds", "Time from request start to the last response byte.",
+    ("method", "route", "status"), LATENCY_BUCKETS,
+)
+request_db_seconds = LabeledHistograms(
+    "http_request_db_seconds", "Time spent executing SQL statements per request.",
+    ("method", "route"), LATENCY_BUCKETS,
+)
+request_db_statements = LabeledHistograms(
+    "http_request_db_statements", "SQL statements executed per request.",
+    ("method", "route"), STATEMENT_BUCKETS,
+)
+requests_in_flight = Gauge()
+
+def observe_request(method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    request_latency.labels(method, route, status).observe(seconds)
+    request_db_seconds.labels(method, route).observe(stats.db_seconds)
+    request_db_statements.labels(method, route).observe(stats.statements)
+
+def render_request_metrics(lines: list) -> None:
+    render_sample(lines, "http_requests_in_flight", "gauge", "Requests currently being served.",
+                  [("", requests_in_flight.value)])
+    for family in (request_latency, request_db_seconds, request_db_statements):
+        family.render(lines)
+
+def route_template(scope) -> str:
+    """Path template of the matched route (e.g. ``/candidates/{candidate_id}``), not the raw path."""
+    route = scope.get("route")
+    if route is None:
+        return UNMATCHED_ROUTE
+    # Routes of included routers keep their router-relative path; FastAPI
+    # records the prefixed template on the effective route context
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    return getattr(context, "path_format", None) or route.path
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status, in-flight count and per-request DB work."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        requests_in_flight.add(1)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            requests_in_flight.add(-1)
+            current_request.reset(token)
+            observe_request(scope["method"], route_template(scope), status, elapsed, stats)
+
+def instrument_engine(target_engine) -> None:
+    """Add each statement's execution time to the current request's RequestStats."""
+
+    # retval=True skips SQLAlchemy's adapter wrapper; the start time rides on the execution context
+    @event.listens_for(target_engine, "before_cursor_execute", retval=True)
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+        return statement, parameters
+
+    @event.listens_for(target_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = current_request.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += time.perf_counter() - context._metrics_started
@@ -0,0 +1,41 @@
+"""Opaque keyset pagination cursors."""
+import base64
+import binascii
+import json
+
+from fastapi import Query, Request, Response
+
+from app.core.exceptions import InvalidCursorError
+
+TOTAL_COUNT_QUERY = Query(None, description="Add an X-Total-Count header: an exact (briefly cached) COUNT, "
+                                            "or a constant-time estimate from planner statistics.")
+
+def encode_cursor(last_id: int) -> str:
+    """Encode the last seen primary key of a page as an opaque cursor."""
+    raw = json.dumps({"after": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a cursor produced by ``encode_cursor`` back to the primary key."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded.encode()))["after"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(cursor) from e
+    if not isinstance(value, int):
+        raise InvalidCursorError(cursor)
+    return value
+
+def set_next_page_headers(request: Request, response: Response, items: list, limit: int, key: str) -> None:
+    """
+    Advertise the next page via ``Link: <...>; rel="next"`` and ``X-Next-Cursor``.
+
+    A next page is only advertised when the current page is full; the link drops
+    ``skip`` so clients switch to keyset paging from whichever page they are on.
+    """
+    if not items or len(items) < limit:
+        return
+    cursor = encode_cursor(getattr(items[-1], key))
+    next_url = request.url.remove_query_params("skip").include_query_params(after=cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
+    response.headers["X-Next-Cursor"] = cursor
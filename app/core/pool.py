@@ -0,0 +1,184 @@
+"""Connection pool configuration and live pool metrics."""
+import threading
+import time
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.metrics import Histogram, render_histogram, render_sample
+
+# Pre-ping strategies (settings.DB_POOL_PRE_PING)
+PING_ALWAYS = "always"
+PING_IDLE = "idle"
+PING_NEVER = "never"
+PING_STRATEGIES = (PING_ALWAYS, PING_IDLE, PING_NEVER)
+
+# Checkout wait histogram bucket upper bounds, in milliseconds
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+class PoolMetrics:
+    """Counters fed by pool events, plus the time callers waited for a connection."""
+
+    def __init__(self):
+        self.checkout_wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.pings = 0
+        self.ping_failures = 0
+        self._lock = threading.Lock()
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+class TimedPoolMixin:
+    """Times ``_do_get`` (the blocking wait on a full pool) into ``metrics``."""
+
+    def __init__(self, *args, metrics: PoolMetrics = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.count("checkout_timeouts")
+            raise
+        finally:
+            self.metrics.checkout_wait_ms.observe((time.perf_counter() - start) * 1000)
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a fresh pool; keep counting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+TIMED_POOLS = {QueuePool: TimedQueuePool, AsyncAdaptedQueuePool: TimedAsyncAdaptedQueuePool}
+
+def engine_options(url: str) -> dict:
+    """
+    ``create_engine`` pool keyword arguments from settings.
+
+    Size, overflow, timeout and recycle only apply to queue pools; other pools
+    (e.g. SQLite ``:memory:``) keep the dialect's default.
+    """
+    if settings.DB_POOL_PRE_PING not in PING_STRATEGIES:
+        raise ValueError(f"DB_POOL_PRE_PING must be one of {', '.join(PING_STRATEGIES)}")
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING == PING_ALWAYS}
+    parsed = make_url(url)
+    timed_pool = TIMED_POOLS.get(parsed.get_dialect().get_pool_class(parsed))
+    if timed_pool is not None:
+        options.update(
+            poolclass=timed_pool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return options
+
+def instrument_pool(target_engine) -> None:
+    """Attach metric listeners and, for the ``idle`` strategy, ping stale connections on checkout."""
+    pool = target_engine.pool
+    if not isinstance(pool, TimedPoolMixin):
+        return
+    metrics = pool.metrics
+    ping_idle = settings.DB_POOL_PRE_PING == PING_IDLE
+
+    @event.listens_for(target_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.count("connects")
+
+    @event.listens_for(target_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.count("checkouts")
+        checked_in_at = connection_record.info.pop("checked_in_at", None)
+        if not ping_idle or checked_in_at is None:
+            return
+        if time.monotonic() - checked_in_at < settings.DB_POOL_PING_IDLE_SECONDS:
+            return
+        metrics.count("pings")
+        try:
+            alive = target_engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            logger.warning("Pooled connection failed its idle ping: %s", e)
+            alive = False
+        if not alive:
+            metrics.count("ping_failures")
+            # The pool discards this connection and retries the checkout with a new one
+            raise exc.DisconnectionError()
+
+    @event.listens_for(target_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(target_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.count("invalidations")
+
+def pool_status(target_engine) -> dict:
+    """Live occupancy and accumulated metrics for ``target_engine``'s pool."""
+    pool = target_engine.pool
+    status = {"pool_class": type(pool).__name__, "pre_ping": settings.DB_POOL_PRE_PING}
+    if not isinstance(pool, TimedPoolMixin):
+        return status
+    metrics = pool.metrics
+    status.update(
+        size=pool.size(),
+        max_overflow=pool._max_overflow,
+        timeout_seconds=pool.timeout(),
+        checked_out=pool.checkedout(),
+        idle=pool.checkedin(),
+        overflow=max(pool.overflow(), 0),
+        checkouts=metrics.checkouts,
+        checkout_timeouts=metrics.checkout_timeouts,
+        connects=metrics.connects,
+        invalidations=metrics.invalidations,
+        idle_pings=metrics.pings,
+        idle_ping_failures=metrics.ping_failures,
+        checkout_wait_ms=metrics.checkout_wait_ms.snapshot(),
+    )
+    return status
+
+POOL_GAUGES = (
+    ("db_pool_checked_out", "checked_out", "Connections currently checked out."),
+    ("db_pool_idle", "idle", "Idle connections in the pool."),
+    ("db_pool_overflow", "overflow", "Connections open beyond the pool size."),
+)
+POOL_COUNTERS = (
+    ("db_pool_checkouts_total", "checkouts", "Connection checkouts."),
+    ("db_pool_checkout_timeouts_total", "checkout_timeouts", "Checkouts that timed out waiting for a connection."),
+    ("db_pool_connects_total", "connects", "New database connections opened."),
+    ("db_pool_invalidations_total", "invalidations", "Connections invalidated (e.g. after a disconnect)."),
+)
+
+def render_pool_metrics(lines: list, engines: dict) -> None:
+    """Append Prometheus series for the pools of ``engines`` (label value -> engine)."""
+    pools = {label: target.pool for label, target in engines.items()
+             if isinstance(target.pool, TimedPoolMixin)}
+    statuses = {label: pool_status(engines[label]) for label in pools}
+    for name, key, help_text in POOL_GAUGES:
+        render_sample(lines, name, "gauge", help_text,
+                      [(f'engine="{label}"', status[key]) for label, status in statuses.items()])
+    for name, key, help_text in POOL_COUNTERS:
+        render_sample(lines, name, "counter", help_text,
+                      [(f'engine="{label}"', status[key]) for label, status in statuses.items()])
+    # Same histogram as /health/db, so its buckets stay in milliseconds
+    lines.append("# HELP db_pool_checkout_wait_milliseconds Time spent waiting for a pooled connection.")
+    lines.append("# TYPE db_pool_checkout_wait_milliseconds histogram")
+    for label, pool in pools.items():
+        render_histogram(lines, "db_pool_checkout_wait_milliseconds", pool.metrics.checkout_wait_ms,
+                         f'engine="{label}"')
@@ -0,0 +1,193 @@
+"""
+Read-replica routing.
+
+Sessions for safe requests (GET/HEAD/OPTIONS) are bound to a replica chosen
+round-robin or by fewest checked-out connections; everything else uses the
+primary. After a client writes, ``ReadYourWritesMiddleware`` sets a short-lived
+cookie and that client's reads go to the primary until it expires, so it
+never sees a replica that has not caught up with its own write.
+
+A background thread pings every replica (and on PostgreSQL checks replay
+lag); a replica that fails, lags too far or raises a disconnect error mid-query
+leaves the rotation until a check passes again. With no healthy replica reads
+fall back to the primary.
+"""
+import itertools
+import threading
+import time
+from typing import List, Optional
+
+from sqlalchemy import event, text
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+
+from app.core.logger import logger
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+PRIMARY_COOKIE = "db_primary_until"
+
+# Routing strategies (settings.DB_REPLICA_STRATEGY)
+ROUND_ROBIN = "round_robin"
+LEAST_CONNECTIONS = "least_connections"
+STRATEGIES = (ROUND_ROBIN, LEAST_CONNECTIONS)
+
+# Seconds the replica is behind the primary; 0 when it has replayed everything it received
+PG_REPLICATION_LAG = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+class Replica:
+    """A replica's engines (sync, and async in async mode) and its health."""
+
+    def __init__(self, name: str, sync_engine, async_engine=None):
+        self.name = name
+        self.engine = sync_engine
+        self.async_engine = async_engine
+        self.healthy = True
+        self.lag_seconds: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.failures = 0
+        for target in self.engines():
+            self._watch_disconnects(target)
+
+    def engines(self) -> list:
+        return [self.engine] + ([self.async_engine.sync_engine] if self.async_engine is not None else [])
+
+    def checked_out(self) -> int:
+        return sum(target.pool.checkedout() for target in self.engines() if hasattr(target.pool, "checkedout"))
+
+    def mark_down(self, reason: str) -> None:
+        if self.healthy:
+            logger.warning("Replica %s taken out of rotation: %s", self.name, reason)
+        self.healthy = False
+        self.failures += 1
+        self.last_error = reason
+
+    def _watch_disconnects(self, target) -> None:
+        @event.listens_for(target, "handle_error")
+        def _on_error(context):
+            if context.is_disconnect:
+                self.mark_down(f"disconnect: {context.original_exception}")
+
+    def check(self, max_lag_seconds: float) -> bool:
+        """Ping the replica (and measure replay lag on PostgreSQL); update and return ``healthy``."""
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                if self.engine.dialect.name == "postgresql":
+                    self.lag_seconds = float(conn.execute(PG_REPLICATION_LAG).scalar() or 0)
+        except Exception as e:
+            self.mark_down(str(e))
+            return False
+        if max_lag_seconds > 0 and self.lag_seconds is not None and self.lag_seconds > max_lag_seconds:
+            self.mark_down(f"replication lag {self.lag_seconds:.1f}s exceeds {max_lag_seconds}s")
+            return False
+        if not self.healthy:
+            logger.info("Replica %s back in rotation", self.name)
+        self.healthy = True
+        self.last_error = None
+        return True
+
+    def status(self) -> dict:
+        return {
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
+class ReplicaSet:
+    """The configured replicas and the policy for picking one per request."""
+
+    def __init__(self, replicas: List[Replica], strategy: str = ROUND_ROBIN,
+                 sticky_seconds: float = 5.0, max_lag_seconds: float = 0.0):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"DB_REPLICA_STRATEGY must be one of {', '.join(STRATEGIES)}")
+        self.replicas = replicas
+        self.strategy = strategy
+        self.sticky_seconds = sticky_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._turn = itertools.count()
+        self._stop = threading.Event()
+
+    def __bool__(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Replica]:
+        """A healthy replica, or None when reads must go to the primary."""
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return None
+        start = next(self._turn) % len(healthy)
+        if self.strategy == LEAST_CONNECTIONS:
+            # Rotating the starting point spreads ties instead of always picking the first
+            rotated = healthy[start:] + healthy[:start]
+            return min(rotated, key=Replica.checked_out)
+        return healthy[start]
+
+    def is_sticky(self, connection: HTTPConnection) -> bool:
+        """Whether the client wrote within its read-your-writes window, so it reads from the primary."""
+        if not self.replicas:
+            return False
+        until = connection.cookies.get(PRIMARY_COOKIE)
+        if not until:
+            return False
+        try:
+            return float(until) > time.time()
+        except ValueError:
+            return False
+
+    def for_request(self, connection: HTTPConnection) -> Optional[Replica]:
+        """The replica to bind the request's session to; None for the primary."""
+        if not self.replicas or connection.scope.get("method") not in SAFE_METHODS:
+            return None
+        if self.is_sticky(connection):
+            return None
+        return self.choose()
+
+    def check_all(self) -> None:
+        for replica in self.replicas:
+            replica.check(self.max_lag_seconds)
+
+    def start_health_checks(self, interval: float) -> None:
+        """Check every replica each ``interval`` seconds on a daemon thread."""
+        def run():
+            while not self._stop.wait(interval):
+                self.check_all()
+
+        threading.Thread(target=run, name="replica-health", daemon=True).start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def status(self) -> dict:
+        return {replica.name: replica.status() for replica in self.replicas}
+
+class ReadYourWritesMiddleware:
+    """
+    Mark clients that just wrote: a successful unsafe request gets a cookie
+    sending that client's reads to the primary for ``sticky_seconds``.
+    """
+
+    def __init__(self, app, sticky_seconds: float):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.sticky_seconds
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{PRIMARY_COOKIE}={until:.3f}; Max-Age={int(self.sticky_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,123 @@
+"""
+JSON encoding of response bodies.
+
+The default path validates ORM objects into their Pydantic schema and dumps
+them with a cached ``TypeAdapter``. With ``FAST_JSON_RESPONSES`` enabled, ORM
+objects are instead read straight into plain dicts by a per-schema function
+compiled from the schema's fields and encoded with orjson. The data was
+validated on the way in, so re-validating every row on the way out only
+costs CPU. Both paths produce the same bytes.
+
+A field subset (sparse fieldsets) always takes the compiled path: the ORM
+objects only have the selected columns loaded, and validating them into the
+full schema would lazy-load the rest.
+"""
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, FrozenSet, List, NamedTuple, Optional, Union, get_args, get_origin
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; pydantic-core's encoder is the fallback
+    orjson = None
+
+class Encoded(NamedTuple):
+    """A result (validated models, or ORM objects on the fast path) and its JSON body."""
+    value: Any
+    body: bytes
+
+def dumps(data: Any) -> bytes:
+    """Encode plain Python data (dicts, lists, datetimes, ...) the way Pydantic would."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z)
+    return to_json(data)
+
+def _nested_model(annotation):
+    """``(model, is_list)`` when a field holds a Pydantic model or a list of them, else None."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin in (list, List) and args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return args[0], True
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) == 1:
+            return _nested_model(members[0])
+    return None
+
+def _field_getter(name: str, annotation) -> Callable[[Any], Any]:
+    get = attrgetter(name)
+    nested = _nested_model(annotation)
+    if nested is None:
+        return get
+    model, is_list = nested
+    to_dict = row_serializer(model)
+    if is_list:
+        return lambda obj: [to_dict(item) for item in get(obj)]
+    return lambda obj: None if (value := get(obj)) is None else to_dict(value)
+
+@lru_cache(maxsize=None)
+def row_serializer(schema: type, fields: Optional[FrozenSet[str]] = None) -> Callable[[Any], dict]:
+    """
+    Compile ``schema``'s fields (or just ``fields``, in schema order) into a
+    function mapping an ORM object to a plain dict.
+    """
+    getters = [(name, _field_getter(name, field.annotation)) for name, field in schema.model_fields.items()
+               if fields is None or name in fields]
+
+    def to_dict(obj) -> dict:
+        return {key: get(obj) for key, get in getters}
+
+    return to_dict
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: type) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+def encode(schema: type, result, fields: Optional[FrozenSet[str]] = None) -> Encoded:
+    """
+    JSON body of ``result`` (an object or a list of them) as ``schema``, limited
+    to ``fields`` when given.
+
+    Runs wherever the ORM objects were loaded (e.g. inside ``run_db``), since
+    reading relationships may hit the database.
+    """
+    is_list = isinstance(result, list)
+    if settings.FAST_JSON_RESPONSES or fields is not None:
+        to_dict = row_serializer(schema, fields)
+        return Encoded(result, dumps([to_dict(item) for item in result] if is_list else to_dict(result)))
+    if is_list:
+        models = [schema.model_validate(item) for item in result]
+        return Encoded(models, list_adapter(schema).dump_json(models))
+    model = schema.model_validate(result)
+    return Encoded(model, model.model_dump_json().encode())
+
+def encode_lookup(schema: type, result: list, fields: Optional[FrozenSet[str]] = None, *,
+                  ids: List[int], key: str) -> Encoded:
+    """
+    JSON list with one entry per requested ID, in request order: the matching
+    object from ``result`` as ``schema``, or ``{key: id, "not_found": true}``.
+    ``value`` holds the objects that were found.
+    """
+    if settings.FAST_JSON_RESPONSES or fields is not None:
+        to_dict = row_serializer(schema, fields)
+        entries = {getattr(item, key): to_dict(item) for item in result}
+        value, dump = result, dumps
+    else:
+        value = [schema.model_validate(item) for item in result]
+        entries = {getattr(model, key): model for model in value}
+        dump = to_json
+    return Encoded(value, dump([entries[item_id] if item_id in entries else {key: item_id, "not_found": True}
+                                for item_id in ids]))
+
+class FastJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson (when installed) instead of the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,94 @@
+"""Content-addressed local blob store for resume files."""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from app.core.config import settings
+
+# file_url value for a stored blob: blob://sha256/<hex digest>
+BLOB_URL_PREFIX = "blob://sha256/"
+
+class StoredBlob(NamedTuple):
+    digest: str
+    size: int
+
+class BlobWriter:
+    """
+    Incrementally write and hash one blob.
+
+    Bytes go to a temporary file inside the store; ``commit`` moves it to its
+    content address, so a half-written upload is never visible.
+    """
+
+    def __init__(self, store: "BlobStore", max_bytes: Optional[int] = None):
+        self._store = store
+        self._max_bytes = max_bytes
+        self._hash = hashlib.sha256()
+        self.size = 0
+        fd, self._tmp_path = tempfile.mkstemp(dir=store.tmp_dir, prefix="upload-")
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, data: bytes) -> None:
+        self.size += len(data)
+        if self._max_bytes is not None and self.size > self._max_bytes:
+            raise OverflowError(f"Blob exceeds {self._max_bytes} bytes")
+        self._hash.update(data)
+        self._file.write(data)
+
+    def commit(self) -> StoredBlob:
+        self._file.close()
+        digest = self._hash.hexdigest()
+        target = self._store.path_for(digest)
+        if target.exists():
+            # Same bytes already stored
+            os.unlink(self._tmp_path)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, target)
+        return StoredBlob(digest=digest, size=self.size)
+
+    def abort(self) -> None:
+        self._file.close()
+        try:
+            os.unlink(self._tmp_path)
+        except FileNotFoundError:
+            pass
+
+class BlobStore:
+    """Blobs live at ``<root>/<aa>/<bb>/<sha256>``; identical bytes are stored once."""
+
+    def __init__(self, root: str):
+        self.root = Path(root)
+
+    @property
+    def tmp_dir(self) -> Path:
+        path = self.root / "tmp"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def path_for(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def exists(self, digest: str) -> bool:
+        return self.path_for(digest).is_file()
+
+    def writer(self, max_bytes: Optional[int] = None) -> BlobWriter:
+        return BlobWriter(self, max_bytes)
+
+    @staticmethod
+    def url_for(digest: str) -> str:
+        return f"{BLOB_URL_PREFIX}{digest}"
+
+    @staticmethod
+    def digest_from_url(file_url: Optional[str]) -> Optional[str]:
+        """The digest if ``file_url`` points into the store, else None."""
+        if not file_url or not file_url.startswith(BLOB_URL_PREFIX):
+            return None
+        digest = file_url[len(BLOB_URL_PREFIX):]
+        if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+            return None
+        return digest
+
+blob_store = BlobStore(settings.RESUME_STORAGE_DIR)
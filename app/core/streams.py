@@ -0,0 +1,62 @@
+"""Bridge an async request body to blocking readers running in the threadpool."""
+import io
+import queue
+from typing import AsyncIterator
+
+from starlette.concurrency import run_in_threadpool
+
+class RequestBodyReader(io.RawIOBase):
+    """
+    Blocking, file-like view of request body chunks fed from the event loop.
+
+    At most ``max_chunks`` chunks are buffered, so a slow consumer applies
+    backpressure to the upload instead of the body piling up in memory.
+    """
+
+    def __init__(self, max_chunks: int = 8):
+        super().__init__()
+        self._queue: "queue.Queue[bytes | None]" = queue.Queue(maxsize=max_chunks)
+        self._buffer = b""
+        self._eof = False
+        self._consumer_closed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        while not self._buffer and not self._eof:
+            chunk = self._queue.get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer = chunk
+        count = min(len(target), len(self._buffer))
+        target[:count] = self._buffer[:count]
+        self._buffer = self._buffer[count:]
+        return count
+
+    def close(self) -> None:
+        self._consumer_closed = True
+        super().close()
+
+    def _put(self, chunk) -> bool:
+        while True:
+            try:
+                self._queue.put(chunk, timeout=0.1)
+                return True
+            except queue.Full:
+                if self._consumer_closed:
+                    return False
+
+    async def feed(self, chunks: AsyncIterator[bytes]) -> None:
+        """Hand body chunks to the reader; stops early if the consumer went away."""
+        try:
+            async for chunk in chunks:
+                if chunk and not await run_in_threadpool(self._put, chunk):
+                    return
+        finally:
+            if not self._consumer_closed:
+                await run_in_threadpool(self._put, None)
+
+def text_reader(raw: RequestBodyReader) -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BufferedReader(raw), encoding="utf-8-sig", newline="")
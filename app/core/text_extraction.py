@@ -0,0 +1,75 @@
+"""
+Plain-text extraction from resume files (PDF, DOCX, TXT).
+
+Functions here are self-contained so they can run in worker processes;
+they never touch the database or application settings.
+"""
+import re
+import zipfile
+from typing import NamedTuple, Optional
+from xml.etree import ElementTree
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # PDF extraction is optional
+    PdfReader = None
+
+DONE = "done"
+FAILED = "failed"
+UNSUPPORTED = "unsupported"
+
+WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+class Extraction(NamedTuple):
+    status: str
+    text: Optional[str] = None
+    error: Optional[str] = None
+
+def detect_format(head: bytes) -> Optional[str]:
+    """Identify the file type from its leading bytes."""
+    if head.startswith(b"%PDF-"):
+        return "pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return "docx"
+    if b"\x00" not in head:
+        return "txt"
+    return None
+
+def _pdf_text(path: str) -> str:
+    if PdfReader is None:
+        raise RuntimeError("PDF support requires the 'pypdf' package")
+    reader = PdfReader(path)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+def _docx_text(path: str) -> str:
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{WORD_NS}p"):
+        paragraphs.append("".join(node.text or "" for node in paragraph.iter(f"{WORD_NS}t")))
+    return "\n".join(paragraphs)
+
+def _txt_text(path: str) -> str:
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+EXTRACTORS = {"pdf": _pdf_text, "docx": _docx_text, "txt": _txt_text}
+
+def normalize_whitespace(text: str) -> str:
+    text = text.replace("\x00", "")
+    text = re.sub(r"[ \t\r\f\v]+", " ", text)
+    return re.sub(r"\n\s*\n+", "\n\n", text).strip()
+
+def extract_file(path: Optional[str]) -> Extraction:
+    """Extract the text of the file at ``path``; errors are returned, not raised."""
+    if path is None:
+        return Extraction(UNSUPPORTED, error="file_url does not reference a local file")
+    try:
+        with open(path, "rb") as f:
+            head = f.read(512)
+        file_format = detect_format(head)
+        if file_format is None:
+            return Extraction(UNSUPPORTED, error="Unrecognized file format")
+        return Extraction(DONE, text=normalize_whitespace(EXTRACTORS[file_format](path)))
+    except Exception as e:
+        return Extraction(FAILED, error=f"{type(e).__name__}: {e}"[:500])
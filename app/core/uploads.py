@@ -0,0 +1,123 @@
+"""Streaming multipart/form-data uploads straight into the blob store."""
+import asyncio
+import io
+from typing import NamedTuple, Optional
+
+from fastapi import Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.concurrency import run_in_threadpool
+
+from app.core.exceptions import InvalidUploadError, UnsupportedUploadTypeError, UploadTooLargeError
+from app.core.storage import BlobStore, StoredBlob
+from app.core.streams import RequestBodyReader
+
+# Bytes read from the body per parser step
+READ_SIZE = 64 * 1024
+
+class UploadedFile(NamedTuple):
+    blob: StoredBlob
+    filename: Optional[str]
+    content_type: Optional[str]
+
+def multipart_boundary(request: Request) -> bytes:
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise UnsupportedUploadTypeError()
+    return boundary
+
+def receive_file(raw: io.RawIOBase, boundary: bytes, store: BlobStore, field: str = "file",
+                 max_bytes: Optional[int] = None) -> Optional[UploadedFile]:
+    """
+    Parse a multipart body from ``raw`` and write the ``field`` part into ``store``.
+
+    Part data is hashed and written as it arrives; other parts are skipped.
+    Returns None if the body has no such part.
+    """
+    state = {"headers": {}, "name": b"", "value": b"", "writer": None, "part": None, "result": None}
+
+    def on_part_begin():
+        state["headers"] = {}
+
+    def on_header_field(data, start, end):
+        state["name"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        state["value"] += data[start:end]
+
+    def on_header_end():
+        state["headers"][state["name"].lower()] = state["value"]
+        state["name"] = state["value"] = b""
+
+    def on_headers_finished():
+        _, params = parse_options_header(state["headers"].get(b"content-disposition", b""))
+        if params.get(b"name") == field.encode() and state["result"] is None:
+            filename = params.get(b"filename")
+            content_type = state["headers"].get(b"content-type")
+            state["part"] = (
+                filename.decode("utf-8", "replace") if filename else None,
+                content_type.decode("latin-1") if content_type else None,
+            )
+            state["writer"] = store.writer(max_bytes)
+
+    def on_part_data(data, start, end):
+        if state["writer"] is not None:
+            state["writer"].write(data[start:end])
+
+    def on_part_end():
+        writer = state["writer"]
+        if writer is not None:
+            state["writer"] = None
+            state["result"] = UploadedFile(writer.commit(), *state["part"])
+
+    parser = MultipartParser(boundary, callbacks={
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end,
+    })
+    try:
+        while chunk := raw.read(READ_SIZE):
+            parser.write(chunk)
+        parser.finalize()
+        if state["writer"] is not None:
+            # The body ended (client disconnect, missing closing boundary) inside the part
+            raise MultipartParseError("body ended before the file part was complete")
+    finally:
+        if state["writer"] is not None:
+            state["writer"].abort()
+    return state["result"]
+
+async def store_upload(request: Request, store: BlobStore, max_bytes: int, field: str = "file") -> UploadedFile:
+    """
+    Stream a multipart upload into ``store`` without holding it in memory.
+
+    The body flows through a small bounded queue to a threadpool worker that
+    parses, hashes and writes it, so disk I/O never runs on the event loop.
+    """
+    boundary = multipart_boundary(request)
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes + READ_SIZE:
+        raise UploadTooLargeError(max_bytes)
+
+    raw = RequestBodyReader()
+
+    def consume():
+        with raw:
+            return receive_file(raw, boundary, store, field, max_bytes)
+
+    consumer = asyncio.ensure_future(run_in_threadpool(consume))
+    await raw.feed(request.stream())
+    try:
+        uploaded = await consumer
+    except OverflowError as e:
+        raise UploadTooLargeError(max_bytes) from e
+    except MultipartParseError as e:
+        raise InvalidUploadError(f"Malformed multipart body: {e}") from e
+    if uploaded is None:
+        raise InvalidUploadError(f"No '{field}' file part in the upload.")
+    return uploaded
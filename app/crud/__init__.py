@@ -4,9 +4,12 @@ from app.crud.candidate import (
     get_candidate_by_email,
     get_candidates,
     create_candidate,
+    create_candidates_bulk,
     delete_candidate
 )
 
+from app.crud.search import search_candidates
+
 from app.crud.resume import (
     get_resume,
     get_resumes,
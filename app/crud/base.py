@@ -1,11 +1,38 @@
 """Base CRUD operations."""
+from sqlalchemy import any_, literal
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from fastapi import HTTPException
 from typing import TypeVar, Generic, Type, List, Optional
 from pydantic import BaseModel
 
 from app.core.logger import logger
 
+def dialect_insert(db, target):
+    """
+    Return an ``INSERT`` construct for the session's dialect.
+
+    ``db`` may be a Session or a Connection; ``target`` may be a Table or an ORM
+    model (for ORM-enabled ``RETURNING``). The PostgreSQL and SQLite variants both
+    support ``ON CONFLICT`` clauses, which the generic ``sqlalchemy.insert`` does not.
+    """
+    bind = db.get_bind() if isinstance(db, Session) else db
+    if bind.dialect.name == "sqlite":
+        return sqlite_insert(target)
+    return pg_insert(target)
+
+def id_in(db, column, ids: list):
+    """
+    ``column = ANY(:ids)`` on PostgreSQL: the IDs travel as one array parameter,
+    so every lookup has the same statement text (and cached plan) whatever the
+    number of IDs. Other dialects get a plain ``IN``.
+    """
+    bind = db.get_bind() if isinstance(db, Session) else db
+    if bind.dialect.name == "postgresql":
+        return column == any_(literal(list(ids), ARRAY(column.type)))
+    return column.in_(ids)
+
 # Define generic types for SQLAlchemy models and Pydantic schemas
 ModelType = TypeVar("ModelType")
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -32,7 +59,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             The record if found, None otherwise
         """
-        logger.debug(f"Getting {self.model.__name__} with id {id}")
+        logger.debug("Getting %s with id %s", self.model.__name__, id)
         return db.query(self.model).filter(self.model.id == id).first()
     
     def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
@@ -47,7 +74,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         Returns:
             List of records
         """
-        logger.debug(f"Getting multiple {self.model.__name__} records (skip={skip}, limit={limit})")
+        logger.debug("Getting multiple %s records (skip=%s, limit=%s)", self.model.__name__, skip, limit)
         return db.query(self.model).offset(skip).limit(limit).all()
     
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
@@ -66,7 +93,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
-        logger.info(f"Created {self.model.__name__} with id {getattr(db_obj, 'id', None)}")
+        logger.info("Created %s with id %s", self.model.__name__, getattr(db_obj, 'id', None))
         return db_obj
     
     def remove(self, db: Session, *, id: int) -> None:
@@ -85,5 +112,5 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             raise HTTPException(status_code=404, detail=f"{self.model.__name__} not found")
         db.delete(obj)
         db.commit()
-        logger.info(f"Deleted {self.model.__name__} with id {id}")
+        logger.info("Deleted %s with id %s", self.model.__name__, id)
         return None
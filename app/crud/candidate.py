@@ -1,92 +1,224 @@
 """CRUD operations for candidates."""
 
-from sqlalchemy.orm import Session
+from sqlalchemy import update
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.exc import IntegrityError
 from fastapi import status
 
 from app.models.candidate import Candidate
 from app.schemas import CandidateCreate, CandidateUpdate
 from app.core.exceptions import CandidateNotFoundError, EmailAlreadyExistsError
+from app.core.cache import response_cache, candidate_key, resume_key
 from app.core.logger import logger
+from app.crud.base import dialect_insert, id_in
+from app.crud.search import apply_candidate_filters
 
-def get_candidate(db: Session, candidate_id: int):
-    """Get a candidate by ID."""
-    candidate = db.query(Candidate).filter(Candidate.candidate_id == candidate_id).first()
+def candidate_load_options(columns: tuple | None = None, include_resumes: bool = True) -> list:
+    """
+    Loader options projecting the SELECT onto ``columns`` (all when None) and
+    batch-loading resumes only when they are embedded in the response.
+    """
+    options = []
+    if columns is not None:
+        options.append(load_only(*(getattr(Candidate, name) for name in columns)))
+    if include_resumes:
+        options.append(selectinload(Candidate.resumes))
+    return options
+
+def get_candidate(db: Session, candidate_id: int, columns: tuple | None = None, include_resumes: bool = True):
+    """Get a candidate by ID, eager-loading its resumes unless ``include_resumes`` is off."""
+    candidate = (
+        db.query(Candidate)
+        .options(*candidate_load_options(columns, include_resumes))
+        .filter(Candidate.candidate_id == candidate_id)
+        .first()
+    )
     if not candidate:
-        logger.warning(f"Candidate with ID {candidate_id} not found")
+        logger.warning("Candidate with ID %s not found", candidate_id)
     return candidate
 
 def get_candidate_by_email(db: Session, email: str):
     """Get a candidate by email."""
     return db.query(Candidate).filter(Candidate.email == email).first()
 
-def get_candidates(db: Session, skip: int = 0, limit: int = 100):
-    """Get multiple candidates with pagination."""
-    logger.debug(f"Fetching candidates (skip={skip}, limit={limit})")
-    return db.query(Candidate).offset(skip).limit(limit).all()
+def get_candidates(db: Session, skip: int = 0, limit: int = 100, after: int | None = None,
+                   first_name: str | None = None, last_name: str | None = None,
+                   email: str | None = None, phone: str | None = None,
+                   columns: tuple | None = None, include_resumes: bool = True):
+    """
+    Get multiple candidates with pagination.
+    Resumes for the whole page are fetched with one batched SELECT ... IN query
+    rather than one lazy load per candidate.
+
+    ``after`` switches to keyset pagination: only candidates with an ID greater
+    than it are returned, so deep pages cost the same as the first one.
+    The name/email/phone arguments are case-insensitive substring filters.
+    ``columns`` and ``include_resumes`` narrow what is loaded (sparse fieldsets).
+    """
+    logger.debug("Fetching candidates (skip=%s, limit=%s, after=%s)", skip, limit, after)
+    query = db.query(Candidate).options(*candidate_load_options(columns, include_resumes))
+    query = apply_candidate_filters(
+        query, db.get_bind().dialect.name,
+        first_name=first_name, last_name=last_name, email=email, phone=phone,
+    )
+    if after is not None:
+        query = query.filter(Candidate.candidate_id > after)
+    return query.order_by(Candidate.candidate_id).offset(skip).limit(limit).all()
+
+def get_candidates_by_ids(db: Session, ids: list[int], columns: tuple | None = None,
+                          include_resumes: bool = True):
+    """
+    Get the candidates among ``ids`` (in no particular order; missing IDs are
+    simply absent) with one ``candidate_id = ANY(...)`` query, plus one batched
+    resume query when ``include_resumes`` is on.
+    """
+    logger.debug("Looking up %s candidates by ID", len(ids))
+    return (
+        db.query(Candidate)
+        .options(*candidate_load_options(columns, include_resumes))
+        .filter(id_in(db, Candidate.candidate_id, ids))
+        .all()
+    )
 
 def create_candidate(db: Session, candidate: CandidateCreate):
     """
     Create a new candidate in the database.
-    Handles duplicate emails gracefully.
+
+    Uses a single ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING`` so the
+    duplicate check and the insert are one atomic round trip; an empty result
+    means the email is taken.
     """
+    stmt = (
+        dialect_insert(db, Candidate)
+        .values(**candidate.model_dump())
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(Candidate)
+    )
     try:
-        # Check if email already exists
-        existing_candidate = db.query(Candidate).filter(
-            Candidate.email == candidate.email
-        ).first()
-        
-        if existing_candidate:
-            logger.warning(f"Attempt to create candidate with duplicate email: {candidate.email}")
-            raise EmailAlreadyExistsError(email=candidate.email)
-        
-        # Create new candidate
-        db_candidate = Candidate(**candidate.model_dump())  # Updated from .dict()
-        db.add(db_candidate)
+        db_candidate = db.scalars(stmt).first()
         db.commit()
-        db.refresh(db_candidate)
-        logger.info(f"Created candidate with ID {db_candidate.candidate_id}")
-        return db_candidate
-    
-    except IntegrityError as e:
+    except Exception:
         db.rollback()
-        # Catch any other integrity errors (like unique constraint violations)
-        if "duplicate key" in str(e).lower() and "email" in str(e).lower():
-            logger.warning(f"Database integrity error for email: {candidate.email}")
-            raise EmailAlreadyExistsError(email=candidate.email) from e
         raise
 
+    if db_candidate is None:
+        logger.warning("Attempt to create candidate with duplicate email: %s", candidate.email)
+        raise EmailAlreadyExistsError(email=candidate.email)
+
+    # A brand-new candidate has no resumes; avoid a lazy load when serializing.
+    set_committed_value(db_candidate, "resumes", [])
+    logger.info("Created candidate with ID %s", db_candidate.candidate_id)
+    return db_candidate
+
+def create_candidates_bulk(db: Session, candidates: list[CandidateCreate], chunk_size: int = 1000):
+    """
+    Create many candidates with set-based inserts, one transaction per chunk.
+
+    Each chunk is a single ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING``
+    statement, so existing emails are reported instead of aborting the batch.
+    Emails repeated within the request are conflicts after their first occurrence.
+    Returns one result dict per input item, in request order.
+    """
+    results = [None] * len(candidates)
+    pending = []
+    first_index = {}
+    for index, candidate in enumerate(candidates):
+        if candidate.email in first_index:
+            results[index] = _bulk_conflict(index, candidate.email)
+        else:
+            first_index[candidate.email] = index
+            pending.append((index, candidate))
+
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        stmt = (
+            dialect_insert(db, Candidate.__table__)
+            .values([candidate.model_dump() for _, candidate in chunk])
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(Candidate.candidate_id, Candidate.email)
+        )
+        try:
+            created = {row.email: row.candidate_id for row in db.execute(stmt)}
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        for index, candidate in chunk:
+            if candidate.email in created:
+                results[index] = {
+                    "index": index,
+                    "email": candidate.email,
+                    "status": "created",
+                    "candidate_id": created[candidate.email],
+                }
+            else:
+                results[index] = _bulk_conflict(index, candidate.email)
+
+    created_count = sum(1 for result in results if result["status"] == "created")
+    logger.info("Bulk created %s candidates, %s conflicts", created_count, len(results) - created_count)
+    return results
+
+def _bulk_conflict(index: int, email: str):
+    return {"index": index, "email": email, "status": "conflict", "detail": "Email already registered."}
+
 def delete_candidate(db: Session, candidate_id: int):
     """Delete a candidate by ID."""
     candidate = get_candidate(db, candidate_id)
     if not candidate:
         raise CandidateNotFoundError(candidate_id)
     
+    resume_ids = [resume.resume_id for resume in candidate.resumes]
     db.delete(candidate)
     db.commit()
-    logger.info(f"Deleted candidate with ID {candidate_id}")
+    # Resumes go with the candidate (cascade), so drop their cached responses too
+    response_cache.invalidate(candidate_key(candidate_id), *(resume_key(rid) for rid in resume_ids))
+    logger.info("Deleted candidate with ID %s", candidate_id)
     return None
 
 def update_candidate(db: Session, candidate_id: int, candidate: CandidateUpdate):
-    """Update an existing candidate."""
-    db_candidate = get_candidate(db, candidate_id)
-    if not db_candidate:
-        raise CandidateNotFoundError(candidate_id)
-    
+    """
+    Update an existing candidate.
+
+    The row is written with one ``UPDATE ... RETURNING`` (no read first): an
+    empty result means the candidate does not exist, and a clash with another
+    candidate's email is detected from the unique constraint. Resumes are then
+    loaded for the response in one batched query. An update with no fields
+    only reads the candidate.
+    """
     update_data = candidate.model_dump(exclude_unset=True)
-    
-    # Handle email uniqueness
-    if "email" in update_data and update_data["email"] != db_candidate.email:
-        existing = get_candidate_by_email(db, update_data["email"])
-        if existing:
-            logger.warning(f"Attempt to update candidate with duplicate email: {update_data['email']}")
-            raise EmailAlreadyExistsError(email=update_data["email"])
-    
-    for key, value in update_data.items():
-        setattr(db_candidate, key, value)
-    
-    db.add(db_candidate)
-    db.commit()
-    db.refresh(db_candidate)
-    logger.info(f"Updated candidate with ID {db_candidate.candidate_id}")
+    if not update_data:
+        db_candidate = get_candidate(db, candidate_id)
+        if not db_candidate:
+            raise CandidateNotFoundError(candidate_id)
+        return db_candidate
+
+    stmt = (
+        update(Candidate)
+        .where(Candidate.candidate_id == candidate_id)
+        .values(**update_data)
+        .returning(Candidate)
+        .options(selectinload(Candidate.resumes))
+        .execution_options(populate_existing=True)
+    )
+    try:
+        db_candidate = db.scalars(stmt).one_or_none()
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "email" in update_data and _is_email_conflict(e):
+            logger.warning("Attempt to update candidate with duplicate email: %s", update_data['email'])
+            raise EmailAlreadyExistsError(email=update_data["email"]) from e
+        raise
+    if db_candidate is None:
+        logger.warning("Candidate with ID %s not found", candidate_id)
+        raise CandidateNotFoundError(candidate_id)
+
+    response_cache.invalidate(candidate_key(candidate_id))
+    logger.info("Updated candidate with ID %s", db_candidate.candidate_id)
     return db_candidate
+
+def _is_email_conflict(error: IntegrityError) -> bool:
+    """Whether an IntegrityError is a unique violation on the email column."""
+    message = str(error.orig).lower()
+    return "email" in message and ("duplicate" in message or "unique" in message)
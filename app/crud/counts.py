@@ -0,0 +1,82 @@
+"""
+Total row counts for the list endpoints (``X-Total-Count``).
+
+``exact`` runs ``COUNT(*)`` with the request's filters and caches the result
+for ``COUNT_CACHE_SECONDS``. ``estimated`` never touches the table on
+PostgreSQL: an unfiltered total comes from ``pg_class`` statistics and a
+filtered one from the planner's row estimate (``EXPLAIN``), both constant
+time whatever the table size. Other databases have no such statistics, so
+there ``estimated`` is the exact count.
+"""
+import json
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.cache import count_cache
+from app.models.candidate import Candidate
+from app.models.resume import Resume
+from app.crud.search import apply_candidate_filters
+
+EXACT = "exact"
+ESTIMATED = "estimated"
+
+# Rows in the table now: the tuple density seen by the last ANALYZE times the
+# current number of pages, as the planner computes it. NULL until analyzed.
+PG_ESTIMATED_ROWS = text(
+    "SELECT CASE WHEN reltuples < 0 THEN NULL WHEN relpages = 0 THEN reltuples "
+    "ELSE reltuples / relpages * (pg_relation_size(oid) / current_setting('block_size')::int) END "
+    "FROM pg_class WHERE oid = CAST(:table AS regclass)"
+)
+
+class Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON)`` of a statement: its plan, without running it."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+def planner_rows(db: Session, stmt) -> int:
+    """The number of rows the PostgreSQL planner expects ``stmt`` to return."""
+    plan = db.execute(Explain(stmt)).scalar()
+    if isinstance(plan, str):  # asyncpg returns json columns undecoded
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+def count_rows(db: Session, model, stmt, mode: str, key: tuple, filtered: bool) -> int:
+    """
+    Total rows of ``stmt`` (a SELECT of ``model`` with the request's filters).
+    ``key`` identifies the table and filters in the exact-count cache.
+    """
+    if mode == ESTIMATED and db.get_bind().dialect.name == "postgresql":
+        estimate = None
+        if not filtered:
+            estimate = db.execute(PG_ESTIMATED_ROWS, {"table": model.__tablename__}).scalar()
+        if estimate is None:
+            estimate = planner_rows(db, stmt)
+        return int(estimate)
+    total = count_cache.get(key)
+    if total is None:
+        total = db.execute(stmt.with_only_columns(func.count(), maintain_column_froms=True)).scalar_one()
+        count_cache.set(key, total)
+    return total
+
+def count_candidates(db: Session, mode: str, first_name: str | None = None, last_name: str | None = None,
+                     email: str | None = None, phone: str | None = None) -> int:
+    """Total candidates matching the list endpoint's filters."""
+    stmt = apply_candidate_filters(
+        select(Candidate.candidate_id), db.get_bind().dialect.name,
+        first_name=first_name, last_name=last_name, email=email, phone=phone,
+    )
+    filters = (first_name, last_name, email, phone)
+    return count_rows(db, Candidate, stmt, mode, key=("candidates",) + filters, filtered=any(filters))
+
+def count_resumes(db: Session, mode: str) -> int:
+    """Total resumes."""
+    return count_rows(db, Resume, select(Resume.resume_id), mode, key=("resumes",), filtered=False)
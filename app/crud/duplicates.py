@@ -0,0 +1,97 @@
+"""Batch duplicate-candidate detection and lookup of its results."""
+import time
+from typing import Optional
+
+from sqlalchemy import case, delete, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.dedup import CandidateRecord, find_duplicate_pairs
+from app.core.logger import logger
+from app.crud.base import id_in
+from app.models.candidate import Candidate
+from app.models.candidate_duplicate import CandidateDuplicate
+
+def load_candidate_records(db: Session, batch_size: int = 50000) -> list:
+    """Every candidate's matching fields, fetched in server-side cursor batches."""
+    stmt = select(
+        Candidate.candidate_id, Candidate.first_name, Candidate.last_name, Candidate.email, Candidate.phone
+    ).execution_options(yield_per=batch_size)
+    return [CandidateRecord(*row) for row in db.execute(stmt)]
+
+def lock_live_candidates(db: Session, candidate_ids: set) -> set:
+    """
+    The IDs among ``candidate_ids`` that still exist. On PostgreSQL their rows
+    are locked (``FOR KEY SHARE``) until commit, so they cannot be deleted
+    between this check and the insert of their pairs.
+    """
+    stmt = (
+        select(Candidate.candidate_id)
+        .where(id_in(db, Candidate.candidate_id, list(candidate_ids)))
+        .with_for_update(read=True, key_share=True)
+    )
+    return set(db.scalars(stmt))
+
+def detect_duplicates(db: Session, threshold: float = 0.8, batch_size: int = 10000) -> dict:
+    """
+    Run a full duplicate-detection pass and replace the stored pairs with its
+    result in one transaction, so readers never see a half-written set.
+    """
+    started = time.perf_counter()
+    records = load_candidate_records(db)
+    loaded = time.perf_counter()
+    pairs = find_duplicate_pairs(records, threshold)
+    scored = time.perf_counter()
+
+    db.execute(delete(CandidateDuplicate))
+    stored = 0
+    for start in range(0, len(pairs), batch_size):
+        batch = pairs[start:start + batch_size]
+        live = lock_live_candidates(db, {id_ for p in batch for id_ in (p.candidate_id, p.duplicate_id)})
+        rows = [
+            {"candidate_id": p.candidate_id, "duplicate_id": p.duplicate_id,
+             "score": p.score, "reasons": ",".join(p.reasons)}
+            for p in batch if p.candidate_id in live and p.duplicate_id in live
+        ]
+        if rows:
+            db.execute(insert(CandidateDuplicate), rows)
+        stored += len(rows)
+    db.commit()
+
+    report = {
+        "candidates": len(records),
+        "pairs": stored,
+        # Pairs whose candidate was deleted while the job was scoring
+        "stale_pairs": len(pairs) - stored,
+        "load_seconds": round(loaded - started, 3),
+        "score_seconds": round(scored - loaded, 3),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info("Duplicate detection finished: %s", report)
+    return report
+
+def get_possible_duplicates(db: Session, candidate_id: int, min_score: float = 0.0,
+                            limit: int = 20) -> Optional[list]:
+    """Stored duplicate pairs involving ``candidate_id``, best first; None if it doesn't exist."""
+    if db.get(Candidate, candidate_id) is None:
+        return None
+    other_id = case(
+        (CandidateDuplicate.candidate_id == candidate_id, CandidateDuplicate.duplicate_id),
+        else_=CandidateDuplicate.candidate_id,
+    )
+    rows = db.execute(
+        select(Candidate, CandidateDuplicate.score, CandidateDuplicate.reasons, CandidateDuplicate.detected_at)
+        .join(Candidate, Candidate.candidate_id == other_id)
+        .where(or_(CandidateDuplicate.candidate_id == candidate_id, CandidateDuplicate.duplicate_id == candidate_id))
+        .where(CandidateDuplicate.score >= min_score)
+        .order_by(CandidateDuplicate.score.desc(), Candidate.candidate_id)
+        .limit(limit)
+    ).all()
+    return [
+        {
+            "candidate": candidate,
+            "score": score,
+            "reasons": reasons.split(",") if reasons else [],
+            "detected_at": detected_at,
+        }
+        for candidate, score, reasons, detected_at in rows
+    ]
@@ -0,0 +1,67 @@
+"""Queries and row shaping for streaming exports."""
+from sqlalchemy import select
+
+from app.models.candidate import Candidate
+from app.models.resume import Resume
+
+CANDIDATE_FIELDS = ["candidate_id", "first_name", "last_name", "email", "phone", "created_at", "updated_at"]
+RESUME_FIELDS = ["resume_id", "candidate_id", "title", "file_url", "uploaded_at", "updated_at"]
+# Resume column -> label used when resumes are joined onto candidate rows
+JOINED_RESUME_LABELS = {
+    "resume_id": "resume_id",
+    "title": "resume_title",
+    "file_url": "resume_file_url",
+    "uploaded_at": "resume_uploaded_at",
+    "updated_at": "resume_updated_at",
+}
+
+def candidate_export_query(include_resumes: bool = False):
+    """All candidates in ID order, optionally LEFT JOINed to their resumes."""
+    columns = [getattr(Candidate, name) for name in CANDIDATE_FIELDS]
+    if not include_resumes:
+        return select(*columns).order_by(Candidate.candidate_id)
+    resume_columns = [getattr(Resume, name).label(label) for name, label in JOINED_RESUME_LABELS.items()]
+    return (
+        select(*columns, *resume_columns)
+        .outerjoin(Resume, Resume.candidate_id == Candidate.candidate_id)
+        .order_by(Candidate.candidate_id, Resume.resume_id)
+    )
+
+def resume_export_query():
+    """All resumes in ID order."""
+    return select(*(getattr(Resume, name) for name in RESUME_FIELDS)).order_by(Resume.resume_id)
+
+class CandidateResumeGrouper:
+    """
+    Fold joined candidate/resume rows (ordered by candidate) into one record per
+    candidate with a nested ``resumes`` list. Only the current candidate is held
+    in memory; state carries across streamed partitions.
+    """
+
+    def __init__(self):
+        self._current = None
+
+    def feed(self, rows):
+        """Consume a partition of rows, returning the candidates completed by it."""
+        completed = []
+        for row in rows:
+            mapping = row._mapping
+            candidate_id = mapping["candidate_id"]
+            if self._current is None or self._current["candidate_id"] != candidate_id:
+                if self._current is not None:
+                    completed.append(self._current)
+                self._current = {name: mapping[name] for name in CANDIDATE_FIELDS}
+                self._current["resumes"] = []
+            if mapping["resume_id"] is not None:
+                resume = {name: mapping[label] for name, label in JOINED_RESUME_LABELS.items()}
+                resume["candidate_id"] = candidate_id
+                self._current["resumes"].append(resume)
+        return completed
+
+    def flush(self):
+        """Return the last, still-open candidate (if any)."""
+        current, self._current = self._current, None
+        return [current] if current is not None else []
+
+def rows_to_dicts(rows):
+    return [dict(row._mapping) for row in rows]
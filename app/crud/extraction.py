@@ -0,0 +1,210 @@
+"""Incremental resume text extraction, parsed in a process pool."""
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlparse
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.storage import BlobStore, blob_store
+from app.core.text_extraction import DONE, Extraction, extract_file
+from app.crud.base import dialect_insert
+from app.models.resume import Resume
+from app.models.resume_text import ResumeText
+
+PENDING = "pending"
+
+def resume_source():
+    """What a resume's text derives from: its content hash, else its file_url."""
+    return func.coalesce(Resume.content_hash, Resume.file_url)
+
+def local_path(file_url: str) -> Optional[str]:
+    """
+    Filesystem path behind ``file_url``, or None when it must not be read.
+
+    Blob-store URLs are always allowed. ``file_url`` is client-supplied, so a
+    file:// URL or plain path is only followed when it resolves (symlinks and
+    ``..`` included) inside ``TEXT_EXTRACTION_LOCAL_ROOT``.
+    """
+    digest = BlobStore.digest_from_url(file_url)
+    if digest is not None:
+        return str(blob_store.path_for(digest))
+    parsed = urlparse(file_url)
+    if parsed.scheme == "file":
+        path = unquote(parsed.path)
+    elif parsed.scheme == "":
+        path = file_url
+    else:
+        return None
+    if not settings.TEXT_EXTRACTION_LOCAL_ROOT:
+        return None
+    resolved = Path(path).resolve()
+    if not resolved.is_relative_to(Path(settings.TEXT_EXTRACTION_LOCAL_ROOT).resolve()):
+        logger.warning("Not extracting %s: outside TEXT_EXTRACTION_LOCAL_ROOT", file_url)
+        return None
+    return str(resolved)
+
+def pending_extractions(db: Session, limit: int, after: int = 0) -> list:
+    """Resumes never extracted, or whose file changed since, in resume_id order."""
+    source = resume_source()
+    stmt = (
+        select(Resume.resume_id, Resume.file_url, Resume.content_hash, source.label("source"))
+        .outerjoin(ResumeText, ResumeText.resume_id == Resume.resume_id)
+        .where(or_(ResumeText.resume_id.is_(None), ResumeText.source != source))
+        .where(Resume.resume_id > after)
+        .order_by(Resume.resume_id)
+        .limit(limit)
+    )
+    return db.execute(stmt).all()
+
+def extracted_by_hash(db: Session, content_hashes: set) -> dict:
+    """Finished extractions for identical content, keyed by content hash."""
+    if not content_hashes:
+        return {}
+    rows = db.execute(
+        select(ResumeText.source, func.min(ResumeText.text))
+        .where(ResumeText.source.in_(content_hashes), ResumeText.status == DONE)
+        .group_by(ResumeText.source)
+    ).all()
+    return {source: Extraction(DONE, text=text) for source, text in rows}
+
+def save_extractions(db: Session, results: list) -> None:
+    """Upsert ``(resume_id, source, Extraction)`` results."""
+    if not results:
+        return
+    rows = [
+        {
+            "resume_id": resume_id,
+            "source": source,
+            "status": extraction.status,
+            "text": extraction.text,
+            "char_count": len(extraction.text) if extraction.text is not None else None,
+            "error": extraction.error,
+        }
+        for resume_id, source, extraction in results
+    ]
+    stmt = dialect_insert(db, ResumeText).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["resume_id"],
+        set_={
+            "source": stmt.excluded.source,
+            "status": stmt.excluded.status,
+            "text": stmt.excluded.text,
+            "char_count": stmt.excluded.char_count,
+            "error": stmt.excluded.error,
+            "extracted_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+    db.commit()
+
+def get_resume_text(db: Session, resume_id: int) -> Optional[dict]:
+    """Extraction status (and text) for a resume; None if the resume doesn't exist."""
+    row = db.execute(
+        select(resume_source(), ResumeText)
+        .select_from(Resume)
+        .outerjoin(ResumeText, ResumeText.resume_id == Resume.resume_id)
+        .where(Resume.resume_id == resume_id)
+    ).first()
+    if row is None:
+        return None
+    source, extracted = row
+    if extracted is None or extracted.source != source:
+        return {"resume_id": resume_id, "status": PENDING}
+    return {
+        "resume_id": resume_id,
+        "status": extracted.status,
+        "char_count": extracted.char_count,
+        "error": extracted.error,
+        "extracted_at": extracted.extracted_at,
+        "text": extracted.text,
+    }
+
+class ExtractionReport:
+    """Running totals for one extraction run."""
+
+    def __init__(self):
+        self.processed = 0
+        self.reused = 0
+        self.by_status = {}
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    def add(self, extraction: Extraction) -> None:
+        self.processed += 1
+        self.by_status[extraction.status] = self.by_status.get(extraction.status, 0) + 1
+
+    @property
+    def files_per_sec(self) -> float:
+        return round(self.processed / self.seconds, 1) if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "reused": self.reused,
+            "statuses": self.by_status,
+            "seconds": round(self.seconds, 3),
+            "files_per_sec": self.files_per_sec,
+        }
+
+def _submit(db: Session, executor: Executor, jobs: list, report: ExtractionReport):
+    """Start parsing one batch; identical content already extracted is reused instead."""
+    known = extracted_by_hash(db, {job.content_hash for job in jobs if job.content_hash})
+    futures = {}
+    results = []
+    for job in jobs:
+        if job.content_hash in known:
+            results.append((job.resume_id, job.source, known[job.content_hash]))
+            report.reused += 1
+        elif job.content_hash and job.content_hash in futures:
+            # Same blob earlier in this batch: parse it once
+            futures[job.content_hash][1].append((job.resume_id, job.source))
+        else:
+            key = job.content_hash or ("resume", job.resume_id)
+            futures[key] = (executor.submit(extract_file, local_path(job.file_url)), [(job.resume_id, job.source)])
+    return results, list(futures.values())
+
+def extract_pending(db: Session, executor: Executor, batch_size: int = 200,
+                    max_in_flight: int = 2) -> ExtractionReport:
+    """
+    Extract text for every unprocessed or changed resume.
+
+    Batches are read by keyset and parsed in ``executor`` (a process pool), with
+    up to ``max_in_flight`` batches outstanding so the pool stays busy while
+    the previous batch is written back.
+    """
+    report = ExtractionReport()
+    in_flight = deque()
+    after = 0
+    exhausted = False
+    while True:
+        while not exhausted and len(in_flight) < max_in_flight:
+            jobs = pending_extractions(db, batch_size, after)
+            if not jobs:
+                exhausted = True
+                break
+            after = jobs[-1].resume_id
+            in_flight.append(_submit(db, executor, jobs, report))
+        if not in_flight:
+            break
+        results, pending = in_flight.popleft()
+        for future, targets in pending:
+            extraction = future.result()
+            for resume_id, source in targets:
+                results.append((resume_id, source, extraction))
+        for _, _, extraction in results:
+            report.add(extraction)
+        save_extractions(db, results)
+    report.seconds = time.perf_counter() - report.started
+    logger.info("Text extraction finished: %s", report.to_dict())
+    return report
+
+def extraction_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Process pool for CPU-bound parsing, one worker per core by default."""
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
@@ -0,0 +1,297 @@
+"""Chunked CSV/NDJSON import of candidates and resumes through a staging table."""
+import abc
+import csv
+import io
+import json
+import time
+from typing import Callable, Iterator, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import Column, Integer, MetaData, String, Table, exists, func, select, true
+
+from app.core.cache import response_cache, candidate_key
+from app.core.database import engine
+from app.core.logger import logger
+from app.crud.base import dialect_insert
+from app.models.candidate import Candidate
+from app.models.resume import Resume
+from app.schemas import CandidateCreate, ResumeCreate
+
+# Staging tables are per-connection temporary tables, never part of the app schema
+staging_metadata = MetaData()
+
+candidate_staging = Table(
+    "candidate_import_staging",
+    staging_metadata,
+    Column("line_no", Integer),
+    Column("first_name", String),
+    Column("last_name", String),
+    Column("email", String),
+    Column("phone", String),
+    prefixes=["TEMPORARY"],
+)
+
+resume_staging = Table(
+    "resume_import_staging",
+    staging_metadata,
+    Column("line_no", Integer),
+    Column("candidate_id", Integer),
+    Column("title", String),
+    Column("file_url", String),
+    prefixes=["TEMPORARY"],
+)
+
+RejectCallback = Callable[[int, str, Optional[dict]], None]
+
+class ImportReport:
+    """Running totals for one import."""
+
+    def __init__(self):
+        self.received = 0
+        self.created = 0
+        self.updated = 0
+        self.rejected = 0
+        self.started = time.perf_counter()
+        self.seconds = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return round(self.received / self.seconds, 1) if self.seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "received": self.received,
+            "created": self.created,
+            "updated": self.updated,
+            "rejected": self.rejected,
+            "seconds": round(self.seconds, 3),
+            "rows_per_sec": self.rows_per_sec,
+        }
+
+def iter_records(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[dict]]]:
+    """Yield ``(line_no, record)`` from a CSV (with header) or NDJSON text stream."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            record.pop(None, None)  # surplus columns
+            yield reader.line_num, {key: (value if value != "" else None) for key, value in record.items()}
+        return
+    for line_no, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, None
+            continue
+        yield line_no, record if isinstance(record, dict) else None
+
+def copy_csv_line(values: list) -> str:
+    """
+    One ``COPY ... (FORMAT csv)`` line. NULL is the unquoted empty field and every
+    other value is quoted, so no text (``\\N``, ``""``, tabs, newlines,
+    backslashes) can be read back as NULL or split the row.
+    """
+    return ",".join(
+        "" if value is None else '"' + str(value).replace('"', '""') + '"' for value in values
+    ) + "\n"
+
+def _copy_rows(conn, table: Table, rows: list) -> None:
+    """Load ``rows`` into a staging table: COPY on psycopg/psycopg2, executemany elsewhere."""
+    if not rows:
+        return
+    columns = [column.name for column in table.columns]
+    driver = conn.dialect.driver
+    if driver not in ("psycopg2", "psycopg"):
+        conn.execute(table.insert(), rows)
+        return
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(copy_csv_line([row[name] for name in columns]))
+    copy_sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if driver == "psycopg2":
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+        else:
+            with cursor.copy(copy_sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+class _Importer(abc.ABC):
+    """Shared chunking, validation and rejection bookkeeping."""
+
+    schema = None
+    staging: Table = None
+
+    def __init__(self, conn, chunk_size: int, on_reject: Optional[RejectCallback]):
+        self.conn = conn
+        self.chunk_size = chunk_size
+        self.on_reject = on_reject
+        self.report = ImportReport()
+
+    def reject(self, line_no: int, reason: str, record: Optional[dict]) -> None:
+        self.report.rejected += 1
+        if self.on_reject is not None:
+            self.on_reject(line_no, reason, record)
+
+    def run(self, records: Iterator[Tuple[int, Optional[dict]]]) -> ImportReport:
+        self.staging.create(self.conn, checkfirst=True)
+        self.conn.commit()
+        try:
+            chunk = []
+            for line_no, record in records:
+                self.report.received += 1
+                chunk.append((line_no, record))
+                if len(chunk) >= self.chunk_size:
+                    self._process(chunk)
+                    chunk = []
+            if chunk:
+                self._process(chunk)
+        finally:
+            self.conn.rollback()
+            self.staging.drop(self.conn, checkfirst=True)
+            self.conn.commit()
+        self.report.seconds = time.perf_counter() - self.report.started
+        return self.report
+
+    def _process(self, chunk: list) -> None:
+        rows = []
+        for line_no, record in chunk:
+            if record is None:
+                self.reject(line_no, "Malformed row.", None)
+                continue
+            try:
+                item = self.schema.model_validate(record)
+            except ValidationError as e:
+                reason = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+                self.reject(line_no, reason, record)
+                continue
+            rows.append((line_no, item, record))
+
+        with self.conn.begin():
+            self._merge(rows)
+            self.conn.execute(self.staging.delete())
+        self.report.seconds = time.perf_counter() - self.report.started
+        logger.info(
+            "Import progress: %s rows, %s rejected, %s rows/sec",
+            self.report.received, self.report.rejected, self.report.rows_per_sec,
+        )
+
+    @abc.abstractmethod
+    def _merge(self, rows: list) -> None:
+        """Write a chunk of validated ``(line_no, item, record)`` rows."""
+
+class CandidateImporter(_Importer):
+    """
+    Merge candidates on email. ``on_conflict="skip"`` rejects rows whose email is
+    already registered; ``"update"`` overwrites the existing candidate's fields.
+    """
+
+    schema = CandidateCreate
+    staging = candidate_staging
+
+    def __init__(self, conn, chunk_size: int, on_reject: Optional[RejectCallback], on_conflict: str = "skip"):
+        super().__init__(conn, chunk_size, on_reject)
+        self.on_conflict = on_conflict
+
+    def _merge(self, rows: list) -> None:
+        staged = {}
+        for line_no, item, record in rows:
+            if item.email in staged:
+                self.reject(line_no, "Duplicate email in file.", record)
+                continue
+            staged[item.email] = (line_no, item, record)
+        _copy_rows(self.conn, self.staging, [
+            {"line_no": line_no, **item.model_dump()} for line_no, item, _ in staged.values()
+        ])
+
+        candidates = Candidate.__table__
+        existing = set()
+        if self.on_conflict == "update":
+            existing = set(self.conn.scalars(
+                select(candidates.c.email).where(candidates.c.email.in_(select(self.staging.c.email)))
+            ))
+
+        columns = ["first_name", "last_name", "email", "phone"]
+        stmt = dialect_insert(self.conn, candidates).from_select(
+            columns,
+            select(*(self.staging.c[name] for name in columns)).where(true()).order_by(self.staging.c.line_no),
+        )
+        if self.on_conflict == "update":
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["email"],
+                set_={
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                    "phone": stmt.excluded.phone,
+                    "updated_at": func.now(),
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["email"])
+        written = dict(self.conn.execute(stmt.returning(candidates.c.email, candidates.c.candidate_id)).all())
+
+        updated_ids = []
+        for email, (line_no, item, record) in staged.items():
+            if email not in written:
+                self.reject(line_no, "Email already registered.", record)
+            elif email in existing:
+                self.report.updated += 1
+                updated_ids.append(written[email])
+            else:
+                self.report.created += 1
+        if updated_ids:
+            response_cache.invalidate(*(candidate_key(candidate_id) for candidate_id in updated_ids))
+
+class ResumeImporter(_Importer):
+    """Insert resumes; rows pointing at a missing candidate are rejected."""
+
+    schema = ResumeCreate
+    staging = resume_staging
+
+    def _merge(self, rows: list) -> None:
+        _copy_rows(self.conn, self.staging, [
+            {"line_no": line_no, **item.model_dump()} for line_no, item, _ in rows
+        ])
+        candidates = Candidate.__table__
+        has_candidate = exists().where(candidates.c.candidate_id == self.staging.c.candidate_id)
+        missing = set(self.conn.scalars(select(self.staging.c.line_no).where(~has_candidate)))
+
+        columns = ["candidate_id", "title", "file_url"]
+        stmt = dialect_insert(self.conn, Resume.__table__).from_select(
+            columns,
+            select(*(self.staging.c[name] for name in columns)).where(has_candidate).order_by(self.staging.c.line_no),
+        )
+        parent_ids = set(self.conn.scalars(stmt.returning(Resume.__table__.c.candidate_id)))
+
+        for line_no, item, record in rows:
+            if line_no in missing:
+                self.reject(line_no, f"Candidate with ID {item.candidate_id} not found.", record)
+            else:
+                self.report.created += 1
+        if parent_ids:
+            response_cache.invalidate(*(candidate_key(candidate_id) for candidate_id in parent_ids))
+
+IMPORTERS = {
+    "candidates": CandidateImporter,
+    "resumes": ResumeImporter,
+}
+
+def import_stream(kind: str, stream: TextIO, fmt: str, chunk_size: int = 5000,
+                  on_reject: Optional[RejectCallback] = None, **options) -> ImportReport:
+    """
+    Import ``kind`` ("candidates" or "resumes") from a text stream.
+
+    Rows are parsed lazily and processed ``chunk_size`` at a time (validate,
+    stage, merge, commit), so memory is bounded by the chunk, not the file.
+    Always runs on the sync engine so PostgreSQL COPY is available.
+    """
+    with engine.connect() as conn:
+        importer = IMPORTERS[kind](conn, chunk_size, on_reject, **options)
+        report = importer.run(iter_records(stream, fmt))
+    logger.info("Imported %s: %s", kind, report.to_dict())
+    return report
@@ -1,36 +1,68 @@
 """CRUD operations for resumes."""
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.resume import Resume
+from app.models.resume_blob import ResumeBlob
 from app.schemas import ResumeCreate, ResumeUpdate
 from app.core.exceptions import ResumeNotFoundError, CandidateNotFoundError
-from app.crud.candidate import get_candidate
+from app.core.cache import response_cache, candidate_key, resume_key
 from app.core.logger import logger
+from app.core.storage import BlobStore
+from app.crud.base import dialect_insert, id_in
 
 def get_resume(db: Session, resume_id: int):
     """Get a resume by ID."""
     resume = db.query(Resume).filter(Resume.resume_id == resume_id).first()
     if not resume:
-        logger.warning(f"Resume with ID {resume_id} not found")
+        logger.warning("Resume with ID %s not found", resume_id)
     return resume
 
-def get_resumes(db: Session, skip: int = 0, limit: int = 100):
-    """Get multiple resumes with pagination."""
-    logger.debug(f"Fetching resumes (skip={skip}, limit={limit})")
-    return db.query(Resume).offset(skip).limit(limit).all()
+def get_resume_last_modified(db: Session, resume_id: int):
+    """Cheap timestamp lookup for conditional GETs; None if the resume doesn't exist."""
+    return (
+        db.query(func.coalesce(Resume.updated_at, Resume.uploaded_at))
+        .filter(Resume.resume_id == resume_id)
+        .scalar()
+    )
+
+def get_resumes(db: Session, skip: int = 0, limit: int = 100, after: int | None = None):
+    """
+    Get multiple resumes with pagination.
+    ``after`` switches to keyset pagination on resume_id.
+    """
+    logger.debug("Fetching resumes (skip=%s, limit=%s, after=%s)", skip, limit, after)
+    query = db.query(Resume)
+    if after is not None:
+        query = query.filter(Resume.resume_id > after)
+    return query.order_by(Resume.resume_id).offset(skip).limit(limit).all()
+
+def get_resumes_by_ids(db: Session, ids: list[int]):
+    """Get the resumes among ``ids`` with one ``resume_id = ANY(...)`` query; missing IDs are absent."""
+    logger.debug("Looking up %s resumes by ID", len(ids))
+    return db.query(Resume).filter(id_in(db, Resume.resume_id, ids)).all()
 
 def create_resume(db: Session, resume: ResumeCreate):
-    """Create a new resume."""
-    candidate = get_candidate(db, resume.candidate_id)
-    if not candidate:
-        logger.warning(f"Attempt to create resume for non-existent candidate ID: {resume.candidate_id}")
-        raise CandidateNotFoundError(resume.candidate_id)
-    
-    db_resume = Resume(**resume.dict())
-    db.add(db_resume)
-    db.commit()
-    db.refresh(db_resume)
-    logger.info(f"Created resume with ID {db_resume.resume_id} for candidate {resume.candidate_id}")
+    """
+    Create a new resume.
+
+    One ``INSERT ... RETURNING``; a missing candidate is detected from the
+    foreign key violation rather than a lookup before the insert.
+    """
+    stmt = insert(Resume).values(**resume.model_dump()).returning(Resume)
+    try:
+        db_resume = db.scalars(stmt).one()
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if "foreign key" in str(e.orig).lower():
+            logger.warning("Attempt to create resume for non-existent candidate ID: %s", resume.candidate_id)
+            raise CandidateNotFoundError(resume.candidate_id) from e
+        raise
+    # The parent candidate's response embeds its resumes
+    response_cache.invalidate(candidate_key(resume.candidate_id))
+    logger.info("Created resume with ID %s for candidate %s", db_resume.resume_id, resume.candidate_id)
     return db_resume
 
 def update_resume(db: Session, resume_id: int, resume: ResumeUpdate):
@@ -40,6 +72,9 @@ def update_resume(db: Session, resume_id: int, resume: ResumeUpdate):
         raise ResumeNotFoundError(resume_id)
     
     update_data = resume.model_dump(exclude_unset=True)
+    if update_data.get("file_url", db_resume.file_url) != db_resume.file_url:
+        # The uploaded file no longer backs this resume
+        update_data.update(content_hash=None, file_name=None, content_type=None, file_size=None)
     
     for key, value in update_data.items():
         setattr(db_resume, key, value)
@@ -47,9 +82,66 @@ def update_resume(db: Session, resume_id: int, resume: ResumeUpdate):
     db.add(db_resume)
     db.commit()
     db.refresh(db_resume)
-    logger.info(f"Updated resume with ID {db_resume.resume_id}")
+    response_cache.invalidate(resume_key(resume_id), candidate_key(db_resume.candidate_id))
+    logger.info("Updated resume with ID %s", db_resume.resume_id)
     return db_resume
 
+def get_blob(db: Session, digest: str):
+    """Get a stored blob by content digest."""
+    return db.get(ResumeBlob, digest)
+
+def attach_resume_file(db: Session, resume_id: int, digest: str, size: int,
+                       file_name: str | None, content_type: str | None):
+    """
+    Point a resume at a stored blob with one ``UPDATE ... RETURNING``.
+
+    The blob is registered in the same transaction; a digest that is already
+    known keeps its existing row, so identical files are recorded once.
+    """
+    db.execute(
+        dialect_insert(db, ResumeBlob)
+        .values(digest=digest, size=size, content_type=content_type)
+        .on_conflict_do_nothing(index_elements=["digest"])
+    )
+    stmt = (
+        update(Resume)
+        .where(Resume.resume_id == resume_id)
+        .values(file_url=BlobStore.url_for(digest), content_hash=digest, file_name=file_name,
+                content_type=content_type, file_size=size, updated_at=func.now())
+        .returning(Resume)
+        .execution_options(populate_existing=True)
+    )
+    db_resume = db.scalars(stmt).one_or_none()
+    if db_resume is None:
+        db.rollback()
+        raise ResumeNotFoundError(resume_id)
+    db.commit()
+    response_cache.invalidate(resume_key(resume_id), candidate_key(db_resume.candidate_id))
+    logger.info("Attached blob %s (%s bytes) to resume %s", digest, size, resume_id)
+    return db_resume
+
+def get_storage_stats(db: Session) -> dict:
+    """Logical bytes referenced by resumes versus bytes actually stored."""
+    resume_files, logical_bytes = db.query(
+        func.count(Resume.resume_id), func.coalesce(func.sum(ResumeBlob.size), 0)
+    ).join(ResumeBlob, Resume.content_hash == ResumeBlob.digest).one()
+    blobs, stored_bytes = db.query(
+        func.count(ResumeBlob.digest), func.coalesce(func.sum(ResumeBlob.size), 0)
+    ).one()
+    referenced_bytes = (
+        db.query(func.coalesce(func.sum(ResumeBlob.size), 0))
+        .filter(ResumeBlob.digest.in_(select(Resume.content_hash).where(Resume.content_hash.isnot(None))))
+        .scalar()
+    )
+    return {
+        "resume_files": resume_files,
+        "blobs": blobs,
+        "logical_bytes": logical_bytes,
+        "stored_bytes": stored_bytes,
+        "saved_bytes": logical_bytes - referenced_bytes,
+        "dedup_ratio": round(logical_bytes / referenced_bytes, 3) if referenced_bytes else 1.0,
+    }
+
 def delete_resume(db: Session, resume_id: int):
     """Delete a resume by ID."""
     resume = get_resume(db, resume_id)
@@ -58,5 +150,6 @@ def delete_resume(db: Session, resume_id: int):
     
     db.delete(resume)
     db.commit()
-    logger.info(f"Deleted resume with ID {resume_id}")
+    response_cache.invalidate(resume_key(resume_id), candidate_key(resume.candidate_id))
+    logger.info("Deleted resume with ID %s", resume_id)
     return None
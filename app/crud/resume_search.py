@@ -0,0 +1,134 @@
+"""Keyword search over extracted resume text (PostgreSQL full-text search)."""
+import re
+
+from sqlalchemy import and_, case, func, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from app.core.logger import logger
+from app.core.text_extraction import DONE
+from app.models.candidate import Candidate
+from app.models.resume import Resume
+from app.models.resume_text import TEXT_SEARCH_CONFIG, ResumeText
+
+HEADLINE_OPTIONS = "MaxWords=30, MinWords=10, MaxFragments=2"
+SNIPPET_CHARS = 160
+
+# Generated tsvector column, only present on PostgreSQL (see app/models/resume_text.py)
+search_vector = literal_column("resume_texts.search_vector", TSVECTOR)
+
+TOKEN_PATTERN = re.compile(r'(-?)"([^"]*)"|(\S+)')
+
+def parse_search_query(q: str) -> list:
+    """
+    Parse web-search syntax into OR-ed groups of AND-ed ``(negated, term)`` pairs.
+
+    Mirrors ``websearch_to_tsquery``: words are AND-ed, ``OR`` separates
+    alternatives, a leading ``-`` negates and "quoted text" is a phrase.
+    """
+    groups, current = [], []
+    for match in TOKEN_PATTERN.finditer(q):
+        negated, phrase, word = match.groups()
+        if word is not None:
+            if word.upper() == "OR":
+                if current:
+                    groups.append(current)
+                current = []
+                continue
+            if word.upper() == "AND":
+                continue
+            negated, term = word.startswith("-"), word.lstrip("-")
+        else:
+            negated, term = bool(negated), phrase
+        term = term.strip().lower()
+        if term:
+            current.append((negated, term))
+    if current:
+        groups.append(current)
+    # A group of only negations would match almost everything
+    return [group for group in groups if any(not negated for negated, _ in group)]
+
+def _snippet(text: str, terms: list) -> str:
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms if term in lowered]
+    start = max(min(positions, default=0) - SNIPPET_CHARS // 4, 0)
+    return text[start:start + SNIPPET_CHARS].strip()
+
+def _hit(row, rank, snippet) -> dict:
+    return {
+        "resume_id": row.resume_id,
+        "candidate_id": row.candidate_id,
+        "title": row.title,
+        "rank": float(rank or 0),
+        "snippet": snippet,
+        "candidate": {
+            "candidate_id": row.candidate_id,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "email": row.email,
+        },
+    }
+
+def _hit_columns():
+    return (Resume.resume_id, Resume.candidate_id, Resume.title,
+            Candidate.first_name, Candidate.last_name, Candidate.email)
+
+def _search_postgresql(db: Session, q: str, skip: int, limit: int) -> list:
+    """GIN-indexed ``@@`` match ranked by cover density; headlines only for the page."""
+    tsquery = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, q)
+    rank = func.ts_rank_cd(search_vector, tsquery)
+    page = (
+        select(ResumeText.resume_id, rank.label("rank"))
+        .where(search_vector.op("@@")(tsquery), ResumeText.status == DONE)
+        .order_by(rank.desc(), ResumeText.resume_id)
+        .offset(skip)
+        .limit(limit)
+        .subquery()
+    )
+    headline = func.ts_headline(TEXT_SEARCH_CONFIG, ResumeText.text, tsquery, HEADLINE_OPTIONS)
+    stmt = (
+        select(*_hit_columns(), page.c.rank, headline.label("snippet"))
+        .join(page, page.c.resume_id == Resume.resume_id)
+        .join(ResumeText, ResumeText.resume_id == Resume.resume_id)
+        .join(Candidate, Candidate.candidate_id == Resume.candidate_id)
+        .order_by(page.c.rank.desc(), Resume.resume_id)
+    )
+    return [_hit(row, row.rank, row.snippet) for row in db.execute(stmt)]
+
+def _search_fallback(db: Session, q: str, skip: int, limit: int) -> list:
+    """Unindexed substring matching for databases without full-text search."""
+    groups = parse_search_query(q)
+    if not groups:
+        return []
+    text = func.lower(ResumeText.text)
+    condition = or_(*[
+        and_(*[~text.contains(term, autoescape=True) if negated else text.contains(term, autoescape=True)
+               for negated, term in group])
+        for group in groups
+    ])
+    positive = sorted({term for group in groups for negated, term in group if not negated})
+    rank = sum(
+        (case((text.contains(term, autoescape=True), literal(1.0)), else_=literal(0.0)) for term in positive),
+        literal(0.0),
+    )
+    stmt = (
+        select(*_hit_columns(), rank.label("rank"), ResumeText.text)
+        .join(ResumeText, ResumeText.resume_id == Resume.resume_id)
+        .join(Candidate, Candidate.candidate_id == Resume.candidate_id)
+        .where(condition, ResumeText.status == DONE)
+        .order_by(rank.desc(), Resume.resume_id)
+        .offset(skip)
+        .limit(limit)
+    )
+    return [_hit(row, row.rank, _snippet(row.text or "", positive)) for row in db.execute(stmt)]
+
+def search_resumes(db: Session, q: str, skip: int = 0, limit: int = 20) -> list:
+    """
+    Find resumes whose extracted text matches ``q`` (web-search syntax: words
+    are AND-ed, ``OR``, ``-word``, "phrase"), best matches first, each joined
+    with its candidate.
+    """
+    logger.debug("Searching resumes (q=%r, skip=%s, limit=%s)", q, skip, limit)
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgresql(db, q, skip, limit)
+    return _search_fallback(db, q, skip, limit)
@@ -0,0 +1,98 @@
+"""Candidate search and list filters backed by pg_trgm indexes on PostgreSQL."""
+import re
+
+from sqlalchemy import case, func, literal, literal_column, or_
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.candidate import Candidate
+from app.core.logger import logger
+
+# Minimum digits before a query is also matched against phone numbers
+MIN_PHONE_DIGITS = 3
+
+def phone_digits(dialect_name: str):
+    """SQL expression for the candidate's phone with formatting stripped."""
+    if dialect_name == "postgresql":
+        # Literals, not bind parameters, so it matches the phone trigram index expression
+        return func.regexp_replace(Candidate.phone, literal_column("'[^0-9]'"),
+                                   literal_column("''"), literal_column("'g'"))
+    expression = Candidate.phone
+    for char in (" ", "-", "(", ")", "+", "."):
+        expression = func.replace(expression, char, "")
+    return expression
+
+def full_name():
+    """
+    ``(first_name || ' ' || last_name)``, spelled exactly like the trigram index
+    expression (a literal space, not a bind parameter) and parenthesized, since
+    PostgreSQL's ``%`` operator binds tighter than ``||``.
+    """
+    return (Candidate.first_name + literal_column("' '") + Candidate.last_name).self_group()
+
+def apply_candidate_filters(query, dialect_name: str, first_name=None, last_name=None, email=None, phone=None):
+    """Case-insensitive substring filters; each is served by a trigram index on PostgreSQL."""
+    if first_name:
+        query = query.filter(Candidate.first_name.icontains(first_name, autoescape=True))
+    if last_name:
+        query = query.filter(Candidate.last_name.icontains(last_name, autoescape=True))
+    if email:
+        query = query.filter(Candidate.email.icontains(email, autoescape=True))
+    if phone:
+        digits = re.sub(r"\D", "", phone)
+        if digits:
+            query = query.filter(phone_digits(dialect_name).contains(digits, autoescape=True))
+    return query
+
+def _trigram_rank(q: str, digits: str):
+    """PostgreSQL: match on trigram similarity or substring, rank by best similarity."""
+    fields = [Candidate.first_name, Candidate.last_name, Candidate.email, full_name()]
+    conditions = []
+    for field in fields:
+        conditions.append(field.op("%", is_comparison=True)(q))
+        conditions.append(field.icontains(q, autoescape=True))
+    scores = [func.similarity(field, q) for field in fields]
+    if digits:
+        phone = phone_digits("postgresql")
+        conditions.append(phone.contains(digits, autoescape=True))
+        scores.append(func.similarity(phone, digits))
+    return or_(*conditions), func.greatest(*scores)
+
+def _substring_rank(q: str, digits: str, dialect_name: str):
+    """Other databases: substring match, ranked exact > prefix > contains."""
+    fields = [Candidate.first_name, Candidate.last_name, Candidate.email, full_name()]
+    conditions = [field.icontains(q, autoescape=True) for field in fields]
+    lowered = q.lower()
+    score = case(
+        *[(func.lower(field) == lowered, literal(1.0)) for field in fields],
+        *[(func.lower(field).startswith(lowered, autoescape=True), literal(0.75)) for field in fields],
+        else_=literal(0.5),
+    )
+    if digits:
+        conditions.append(phone_digits(dialect_name).contains(digits, autoescape=True))
+    return or_(*conditions), score
+
+def search_candidates(db: Session, q: str, skip: int = 0, limit: int = 20):
+    """
+    Search candidates by partial or misspelled name, email or phone.
+
+    Results are ordered by relevance (trigram similarity on PostgreSQL), then ID.
+    """
+    q = q.strip()
+    digits = re.sub(r"\D", "", q)
+    digits = digits if len(digits) >= MIN_PHONE_DIGITS else ""
+    dialect_name = db.get_bind().dialect.name
+    logger.debug("Searching candidates (q=%r, skip=%s, limit=%s)", q, skip, limit)
+
+    if dialect_name == "postgresql":
+        condition, score = _trigram_rank(q, digits)
+    else:
+        condition, score = _substring_rank(q, digits, dialect_name)
+    return (
+        db.query(Candidate)
+        .options(selectinload(Candidate.resumes))
+        .filter(condition)
+        .order_by(score.desc(), Candidate.candidate_id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
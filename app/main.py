@@ -1,8 +1,16 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.routers import candidates, resumes
+from app.core.cache import response_cache
+from app.core.compression import CompressionMiddleware, available_encodings
+from app.core.config import settings
+from app.core.database import async_engine, engine, replicas
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware, render_request_metrics
+from app.core.pool import pool_status, render_pool_metrics
+from app.core.replicas import ReadYourWritesMiddleware
+from app.core.serialization import FastJSONResponse
 from app.core.logger import logger
 from app.core.exceptions import (
     EmailAlreadyExistsError,
@@ -22,7 +30,8 @@ app = FastAPI(
         {"name": "Health", "description": "API health check endpoints"},
         {"name": "Root", "description": "API information endpoint"},
     ],
-    swagger_ui_parameters={"defaultModelsExpandDepth": -1}
+    swagger_ui_parameters={"defaultModelsExpandDepth": -1},
+    default_response_class=FastJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse,
 )
 
 # Add CORS middleware
@@ -32,22 +41,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Link", "X-Next-Cursor", "X-Total-Count", "ETag", "Last-Modified"],
 )
 
+# Clients that wrote get a cookie pinning their reads to the primary for a few seconds
+if replicas:
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=replicas.sticky_seconds)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        encodings=available_encodings(settings.COMPRESSION_ENCODINGS),
+        levels={
+            "gzip": settings.COMPRESSION_GZIP_LEVEL,
+            "br": settings.COMPRESSION_BROTLI_QUALITY,
+            "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+        },
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+    )
+
+# Outermost, so timings cover CORS handling and exception responses too
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Add global exception handlers
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    logger.error(f"Unhandled exception: {exc}")
+    logger.error("Unhandled exception: %s", exc)
     return JSONResponse(status_code=500, content={"detail": "Internal Server Error"})
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
-    logger.warning(f"HTTP exception: {exc.status_code} - {exc.detail}")
+    logger.warning("HTTP exception: %s - %s", exc.status_code, exc.detail)
     return JSONResponse(status_code=exc.status_code, content={"detail": exc.detail})
 
 @app.exception_handler(EmailAlreadyExistsError)
 async def email_exists_exception_handler(request: Request, exc: EmailAlreadyExistsError):
-    logger.warning(f"Duplicate email attempt: {exc.detail.get('email')}")
+    logger.warning("Duplicate email attempt: %s", exc.detail.get('email'))
     return JSONResponse(
         status_code=exc.status_code,
         content=exc.detail,
@@ -63,6 +93,40 @@ def health_check():
     """Health check endpoint."""
     return {"status": "ok"}
 
+@app.get("/health/cache", tags=["Health"])
+def cache_stats():
+    """Hit, miss and eviction counters for the in-process response cache."""
+    return response_cache.stats()
+
+def db_engines() -> dict:
+    engines = {"sync": engine}
+    if async_engine is not None:
+        engines["async"] = async_engine.sync_engine
+    for replica in replicas.replicas:
+        engines[replica.name] = replica.engine
+        if replica.async_engine is not None:
+            engines[f"{replica.name}-async"] = replica.async_engine.sync_engine
+    return engines
+
+@app.get("/health/db", tags=["Health"])
+def db_pool_stats():
+    """
+    Connection pool occupancy, checkout counters and checkout wait-time histogram
+    per engine; replica engines also report health and replication lag.
+    """
+    stats = {label: pool_status(target) for label, target in db_engines().items()}
+    for name, health in replicas.status().items():
+        stats[name].update(health)
+    return stats
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def metrics():
+    """Prometheus metrics: per-route latency, per-request DB time and statements, pool state."""
+    lines = []
+    render_request_metrics(lines)
+    render_pool_metrics(lines, db_engines())
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
+
 @app.get("/", tags=["Root"])
 def root():
     """
@@ -1,3 +1,6 @@
 """Models package initialization."""
 from app.models.candidate import Candidate
 from app.models.resume import Resume
+from app.models.resume_blob import ResumeBlob
+from app.models.resume_text import ResumeText
+from app.models.candidate_duplicate import CandidateDuplicate
@@ -1,5 +1,5 @@
 """Candidate model definition."""
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -17,3 +17,24 @@ class Candidate(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     resumes = relationship("Resume", back_populates="candidate", cascade="all, delete-orphan")
+
+
+# Trigram (pg_trgm) GIN indexes backing /candidates/search and the list filters.
+# PostgreSQL only; other databases fall back to unindexed substring matching.
+TRIGRAM_INDEX_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_candidates_first_name_trgm ON candidates USING gin (first_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_candidates_last_name_trgm ON candidates USING gin (last_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_candidates_email_trgm ON candidates USING gin (email gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_candidates_full_name_trgm ON candidates "
+    "USING gin ((first_name || ' ' || last_name) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_candidates_phone_digits_trgm ON candidates "
+    "USING gin ((regexp_replace(phone, '[^0-9]', '', 'g')) gin_trgm_ops)",
+]
+
+event.listen(
+    Candidate.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for statement in TRIGRAM_INDEX_DDL:
+    event.listen(Candidate.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
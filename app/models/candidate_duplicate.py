@@ -0,0 +1,18 @@
+"""Possible duplicate candidate pairs found by the duplicate-detection job."""
+from sqlalchemy import Column, Float, Integer, String, DateTime, ForeignKey
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+class CandidateDuplicate(Base):
+    __tablename__ = "candidate_duplicates"
+
+    # Each pair is stored once, with candidate_id < duplicate_id
+    candidate_id = Column(Integer, ForeignKey("candidates.candidate_id", ondelete="CASCADE"), primary_key=True)
+    duplicate_id = Column(
+        Integer, ForeignKey("candidates.candidate_id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+    score = Column(Float, nullable=False)
+    # Comma-separated signals that matched: phone, name, email
+    reasons = Column(String, nullable=False, default="")
+    detected_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,5 +1,5 @@
 """Resume model definition."""
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -12,6 +12,13 @@ class Resume(Base):
     candidate_id = Column(Integer, ForeignKey("candidates.candidate_id", ondelete="CASCADE"), nullable=False)
     title = Column(String, nullable=False)
     file_url = Column(String, nullable=False)
+    # Set when the file itself is uploaded to the blob store
+    file_name = Column(String, nullable=True)
+    content_type = Column(String, nullable=True)
+    file_size = Column(BigInteger, nullable=True)
+    # Digest of the uploaded content; resumes with identical files share one blob
+    content_hash = Column(String(64), ForeignKey("resume_blobs.digest"), nullable=True, index=True)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     candidate = relationship("Candidate", back_populates="resumes")
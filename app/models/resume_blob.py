@@ -0,0 +1,14 @@
+"""Resume blob model: one row per distinct stored file."""
+from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+class ResumeBlob(Base):
+    __tablename__ = "resume_blobs"
+
+    # SHA-256 of the file content, hex encoded; also its address in the blob store
+    digest = Column(String(64), primary_key=True)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
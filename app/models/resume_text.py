@@ -0,0 +1,31 @@
+"""Extracted resume text model."""
+from sqlalchemy import Column, Integer, String, Text, DateTime, DDL, ForeignKey, event
+from sqlalchemy.sql import func
+
+from app.models.base import Base
+
+class ResumeText(Base):
+    __tablename__ = "resume_texts"
+
+    resume_id = Column(Integer, ForeignKey("resumes.resume_id", ondelete="CASCADE"), primary_key=True)
+    # content_hash (or file_url) the text was extracted from; a mismatch means it is stale
+    source = Column(String, nullable=False, index=True)
+    status = Column(String(16), nullable=False)
+    text = Column(Text, nullable=True)
+    char_count = Column(Integer, nullable=True)
+    error = Column(String, nullable=True)
+    extracted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+# Full-text search backing /resumes/search (PostgreSQL only). The tsvector is a
+# stored generated column, so it is maintained by every insert/update of text,
+# and is deliberately left unmapped: other databases don't have the type.
+TEXT_SEARCH_CONFIG = "english"
+SEARCH_VECTOR_DDL = [
+    "ALTER TABLE resume_texts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    f"GENERATED ALWAYS AS (to_tsvector('{TEXT_SEARCH_CONFIG}'::regconfig, coalesce(text, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_resume_texts_search_vector ON resume_texts USING gin (search_vector)",
+]
+
+for statement in SEARCH_VECTOR_DDL:
+    event.listen(ResumeText.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -1,71 +1,277 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, Response, status, HTTPException
+from fastapi.responses import StreamingResponse
+from functools import partial
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Union
 
 from app import schemas
-from app.crud.candidate import get_candidate, get_candidates, create_candidate, delete_candidate, update_candidate
-from app.core.database import get_db
+from app.crud.candidate import (
+    get_candidate,
+    get_candidates,
+    get_candidates_by_ids,
+    create_candidate,
+    create_candidates_bulk,
+    delete_candidate,
+    update_candidate,
+)
+from app.crud.counts import count_candidates
+from app.crud.duplicates import get_possible_duplicates
+from app.crud.search import search_candidates
+from app.core.config import settings
+from app.core.cache import candidate_key, read_through
+from app.core.conditional import build_response, conditional_response
+from app.core.database import get_db, replicas, run_db, stream_partitions
+from app.core.export import MEDIA_TYPES, encode_stream
+from app.crud.export import (
+    CANDIDATE_FIELDS,
+    JOINED_RESUME_LABELS,
+    CandidateResumeGrouper,
+    candidate_export_query,
+    rows_to_dicts,
+)
 from app.core.exceptions import CandidateNotFoundError, EmailAlreadyExistsError
-from app.core.logger import logger
+from app.core.fieldsets import parse_fieldset
+from app.core.logger import logger, read_logger
+from app.core.lookup import IDS_QUERY, parse_ids
+from app.core.pagination import TOTAL_COUNT_QUERY, decode_cursor, set_next_page_headers
+from app.core.serialization import encode_lookup
+from app.routers.imports import IMPORT_BODY, run_import
 
 router = APIRouter()
 
+NOT_MODIFIED = {304: {"description": "Not Modified (ETag / If-None-Match matched)"}}
+
+FIELDS_QUERY = Query(None, description="Comma-separated candidate fields to return; "
+                                       "candidate_id is always included.")
+INCLUDE_QUERY = Query(None, description="Comma-separated relations to embed (resumes). "
+                                        "Defaults to all without fields, none with fields.")
+
+def candidate_fieldset(fields: str | None, include: str | None):
+    return parse_fieldset(fields, include, schemas.Candidate, key="candidate_id", relations=("resumes",))
+
+# Query parameters of the list endpoint that have no meaning for an ``ids`` lookup
+LIST_ONLY_PARAMS = ("skip", "limit", "after", "first_name", "last_name", "email", "phone", "count")
+
+EXPORT_RESPONSES = {
+    200: {
+        "description": "Streamed export",
+        "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+    }
+}
+
 @router.post("/", response_model=schemas.Candidate, status_code=status.HTTP_201_CREATED)
-def create_candidate_endpoint(candidate: schemas.CandidateCreate, 
+async def create_candidate_endpoint(candidate: schemas.CandidateCreate, 
                      db: Session = Depends(get_db)):
     """Create a new candidate."""
     try:
-        logger.info(f"Creating new candidate with email: {candidate.email}")
-        return create_candidate(db=db, candidate=candidate)
+        logger.info("Creating new candidate with email: %s", candidate.email)
+        return await run_db(db, create_candidate, candidate=candidate, schema=schemas.Candidate)
     except EmailAlreadyExistsError as e:
         # Let the global exception handler deal with this
         raise
     except Exception as e:
-        logger.error(f"Unexpected error creating candidate: {str(e)}")
+        logger.error("Unexpected error creating candidate: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred."
         ) from e
 
-@router.get("/", response_model=List[schemas.Candidate])
-def read_candidates(skip: int = 0, 
-                    limit: int = 100, 
-                    db: Session = Depends(get_db)):
-    """Get all candidates with pagination."""
-    candidates = get_candidates(db, skip=skip, limit=limit)
-    logger.info(f"Retrieved {len(candidates)} candidates")
-    return candidates
-
-@router.get("/{candidate_id}", response_model=schemas.Candidate)
-def read_candidate(candidate_id: int, 
-                   db: Session = Depends(get_db)):
-    """Get a specific candidate by ID."""
-    logger.info(f"Fetching candidate with ID: {candidate_id}")
-    db_candidate = get_candidate(db, candidate_id)
-    if db_candidate is None:
+@router.post("/bulk", response_model=schemas.CandidateBulkResult)
+async def create_candidates_bulk_endpoint(candidates: List[schemas.CandidateCreate],
+                                          db: Session = Depends(get_db)):
+    """
+    Create many candidates in one request.
+
+    Rows are inserted with set-based statements in chunks of ``BULK_CHUNK_SIZE``.
+    Each item gets a result in request order: the new ``candidate_id``, or a
+    ``conflict`` when the email is already registered.
+    """
+    if len(candidates) > settings.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=f"At most {settings.BULK_MAX_ITEMS} candidates can be created per request."
+        )
+    logger.info("Bulk creating %s candidates", len(candidates))
+    results = await run_db(db, create_candidates_bulk, candidates, chunk_size=settings.BULK_CHUNK_SIZE)
+    created = sum(1 for result in results if result["status"] == "created")
+    return {"created": created, "conflicts": len(results) - created, "results": results}
+
+@router.post("/import", response_model=schemas.ImportResult, openapi_extra=IMPORT_BODY)
+async def import_candidates_endpoint(request: Request,
+                                     import_format: Literal["csv", "ndjson"] | None = Query(None, alias="format"),
+                                     on_conflict: Literal["skip", "update"] = "skip"):
+    """
+    Import candidates from a CSV (with header) or NDJSON request body.
+
+    The body is streamed and processed in chunks of ``IMPORT_CHUNK_SIZE`` rows:
+    each row is validated against ``CandidateCreate``, loaded into a staging
+    table (COPY on PostgreSQL) and merged into ``candidates`` on email. Rows with
+    an already registered email are rejected (``on_conflict=skip``) or overwrite
+    the existing candidate (``on_conflict=update``). Rejected rows are listed in
+    ``errors`` (up to ``IMPORT_MAX_REPORTED_ERRORS``).
+    """
+    return await run_import(request, "candidates", import_format, on_conflict=on_conflict)
+
+@router.get("/", response_model=List[Union[schemas.CandidateFields, schemas.CandidateNotFound]],
+            responses=NOT_MODIFIED)
+async def read_candidates(request: Request,
+                          skip: int = 0, 
+                          limit: int = 100, 
+                          after: str | None = None,
+                          first_name: str | None = None,
+                          last_name: str | None = None,
+                          email: str | None = None,
+                          phone: str | None = None,
+                          fields: str | None = FIELDS_QUERY,
+                          include: str | None = INCLUDE_QUERY,
+                          ids: str | None = IDS_QUERY,
+                          count: Literal["exact", "estimated"] | None = TOTAL_COUNT_QUERY,
+                          db: Session = Depends(get_db)):
+    """
+    Get all candidates with pagination, or look up specific ones with ``ids``.
+
+    Pass the opaque ``after`` cursor from the previous page's ``X-Next-Cursor``
+    (or ``Link: rel="next"``) header for keyset pagination; ``skip`` still works.
+    Responses carry a strong ETag; a matching ``If-None-Match`` gets 304.
+    ``first_name``, ``last_name``, ``email`` and ``phone`` filter by
+    case-insensitive substring (phone ignores formatting).
+    ``fields`` and ``include`` select what is returned, and only that is read
+    from the database (e.g. ``fields=candidate_id,email`` skips the resume query).
+    ``count`` adds the total number of matching candidates as ``X-Total-Count``
+    (see app/crud/counts.py).
+
+    ``ids=3,1,2`` (up to ``BATCH_MAX_IDS``) replaces paging and filtering: the
+    candidates are read with one query (plus one for all their resumes) and
+    returned in request order, a missing ID yielding
+    ``{"candidate_id": ..., "not_found": true}`` rather than a 404.
+    """
+    fieldset = candidate_fieldset(fields, include)
+    if ids is not None:
+        requested = parse_ids(request, exclusive=LIST_ONLY_PARAMS)
+        candidates, body = await run_db(db, get_candidates_by_ids, list(dict.fromkeys(requested)),
+                                        columns=fieldset.columns, include_resumes="resumes" in fieldset.include,
+                                        schema=schemas.Candidate, fields=fieldset.names,
+                                        encode=partial(encode_lookup, ids=requested, key="candidate_id"))
+        read_logger.info("Looked up %s candidates, %s found", len(requested), len(candidates))
+        return conditional_response(request, build_response(body))
+    after_id = decode_cursor(after) if after else None
+    candidates, body = await run_db(db, get_candidates, skip=skip, limit=limit, after=after_id,
+                                    first_name=first_name, last_name=last_name, email=email, phone=phone,
+                                    columns=fieldset.columns, include_resumes="resumes" in fieldset.include,
+                                    schema=schemas.Candidate, encode=True, fields=fieldset.names)
+    response = conditional_response(request, build_response(body))
+    set_next_page_headers(request, response, candidates, limit, key="candidate_id")
+    if count is not None:
+        total = await run_db(db, count_candidates, count,
+                             first_name=first_name, last_name=last_name, email=email, phone=phone)
+        response.headers["X-Total-Count"] = str(total)
+    read_logger.info("Retrieved %s candidates", len(candidates))
+    return response
+
+@router.get("/search", response_model=List[schemas.Candidate])
+async def search_candidates_endpoint(q: str = Query(..., min_length=1, max_length=100),
+                                     skip: int = Query(0, ge=0),
+                                     limit: int = Query(20, ge=1, le=100),
+                                     db: Session = Depends(get_db)):
+    """
+    Search candidates by partial or misspelled first name, last name, full name,
+    email or phone number. Results are ranked by trigram similarity and paged.
+    """
+    candidates, body = await run_db(db, search_candidates, q, skip=skip, limit=limit,
+                                    schema=schemas.Candidate, encode=True)
+    read_logger.info("Search returned %s candidates", len(candidates))
+    return Response(content=body, media_type="application/json")
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+async def export_candidates(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+                            include_resumes: bool = False):
+    """
+    Stream every candidate as NDJSON or CSV.
+
+    Rows are read through a server-side cursor in batches of ``EXPORT_BATCH_SIZE``
+    and written as they arrive, so memory use does not grow with the table.
+    With ``include_resumes`` NDJSON nests each candidate's resumes; CSV emits one
+    row per candidate/resume pair.
+    """
+    logger.info("Exporting candidates as %s (include_resumes=%s)", export_format, include_resumes)
+    partitions = stream_partitions(candidate_export_query(include_resumes), settings.EXPORT_BATCH_SIZE)
+    if include_resumes and export_format == "ndjson":
+        grouper = CandidateResumeGrouper()
+        body = encode_stream(partitions, grouper.feed, export_format, [], flush=grouper.flush)
+    else:
+        fieldnames = CANDIDATE_FIELDS + (list(JOINED_RESUME_LABELS.values()) if include_resumes else [])
+        body = encode_stream(partitions, rows_to_dicts, export_format, fieldnames)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="candidates.{export_format}"'},
+    )
+
+@router.get("/{candidate_id}", response_model=schemas.CandidateFields, responses=NOT_MODIFIED)
+async def read_candidate(candidate_id: int, 
+                         request: Request,
+                         fields: str | None = FIELDS_QUERY,
+                         include: str | None = INCLUDE_QUERY,
+                         db: Session = Depends(get_db)):
+    """
+    Get a specific candidate by ID. Supports ETag / If-None-Match.
+
+    ``fields`` and ``include`` work as on the list endpoint; such partial
+    representations are read from the database rather than the response cache.
+    """
+    read_logger.info("Fetching candidate with ID: %s", candidate_id)
+    fieldset = candidate_fieldset(fields, include)
+    if fieldset.names is None:
+        cached = await read_through(
+            candidate_key(candidate_id),
+            lambda: run_db(db, get_candidate, candidate_id, schema=schemas.Candidate, encode=True),
+            # A client that just wrote reads from the primary; don't serve it a replica-filled entry
+            refresh=replicas.is_sticky(request),
+        )
+    else:
+        result = await run_db(db, get_candidate, candidate_id, columns=fieldset.columns,
+                              include_resumes="resumes" in fieldset.include,
+                              schema=schemas.Candidate, encode=True, fields=fieldset.names)
+        cached = None if result is None else build_response(result.body)
+    if cached is None:
+        raise CandidateNotFoundError(candidate_id)
+    return conditional_response(request, cached)
+
+@router.get("/{candidate_id}/possible-duplicates", response_model=List[schemas.CandidateDuplicateMatch])
+async def read_possible_duplicates(candidate_id: int,
+                                   min_score: float = Query(0.0, ge=0.0, le=1.0),
+                                   limit: int = Query(20, ge=1, le=100),
+                                   db: Session = Depends(get_db)):
+    """
+    Candidates that are likely the same person (matching phone, similar name or
+    email), scored 0-1 by the last run of the duplicate-detection job.
+    """
+    matches = await run_db(db, get_possible_duplicates, candidate_id, min_score=min_score, limit=limit,
+                           schema=schemas.CandidateDuplicateMatch)
+    if matches is None:
         raise CandidateNotFoundError(candidate_id)
-    return db_candidate
+    return matches
 
 @router.delete("/{candidate_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_candidate_endpoint(candidate_id: int, 
+async def delete_candidate_endpoint(candidate_id: int, 
                      db: Session = Depends(get_db)):
     """Delete a candidate by ID."""
-    logger.info(f"Deleting candidate with ID: {candidate_id}")
-    delete_candidate(db, candidate_id)
+    logger.info("Deleting candidate with ID: %s", candidate_id)
+    await run_db(db, delete_candidate, candidate_id)
     return
 
 @router.put("/{candidate_id}", response_model=schemas.Candidate)
-def update_candidate_endpoint(candidate_id: int, candidate: schemas.CandidateUpdate, db: Session = Depends(get_db)):
+async def update_candidate_endpoint(candidate_id: int, candidate: schemas.CandidateUpdate, db: Session = Depends(get_db)):
     """Update candidate details."""
     try:
-        logger.info(f"Updating candidate ID: {candidate_id}")
-        return update_candidate(db, candidate_id, candidate)
+        logger.info("Updating candidate ID: %s", candidate_id)
+        return await run_db(db, update_candidate, candidate_id, candidate, schema=schemas.Candidate)
     except CandidateNotFoundError:
         raise
     except EmailAlreadyExistsError as e:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error updating candidate {candidate_id}: {str(e)}")
+        logger.error("Unexpected error updating candidate %s: %s", candidate_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while updating the candidate."
@@ -0,0 +1,62 @@
+"""Shared request handling for the streaming import endpoints."""
+import asyncio
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.streams import RequestBodyReader, text_reader
+from app.crud.importer import import_stream
+
+IMPORT_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "text/csv": {"schema": {"type": "string", "format": "binary"}},
+            "application/x-ndjson": {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+def resolve_format(request: Request, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    content_type = request.headers.get("content-type", "")
+    if "csv" in content_type:
+        return "csv"
+    if "ndjson" in content_type or "json" in content_type:
+        return "ndjson"
+    raise HTTPException(
+        status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        detail="Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson."
+    )
+
+async def run_import(request: Request, kind: str, fmt: Optional[str], **options) -> dict:
+    """
+    Stream the request body into the chunked importer running in the threadpool.
+
+    The body is never held whole: chunks flow through a small bounded queue and
+    rows are processed ``IMPORT_CHUNK_SIZE`` at a time.
+    """
+    fmt = resolve_format(request, fmt)
+    errors = []
+
+    def on_reject(line_no, reason, record):
+        if len(errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            errors.append({"line": line_no, "reason": reason, "record": record})
+
+    raw = RequestBodyReader()
+
+    def consume():
+        with text_reader(raw) as stream:
+            return import_stream(kind, stream, fmt, settings.IMPORT_CHUNK_SIZE, on_reject, **options)
+
+    logger.info("Importing %s from %s upload", kind, fmt)
+    consumer = asyncio.ensure_future(run_in_threadpool(consume))
+    await raw.feed(request.stream())
+    report = (await consumer).to_dict()
+    report["errors"] = errors
+    report["errors_truncated"] = report["rejected"] > len(errors)
+    return report
@@ -1,46 +1,258 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
+from functools import partial
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Literal, Union
 
 from app import schemas
-from app.crud.resume import get_resume, get_resumes, create_resume, delete_resume, update_resume
-from app.core.database import get_db
-from app.core.exceptions import ResumeNotFoundError
-from app.core.logger import logger
+from app.crud.resume import (
+    get_resume,
+    get_resume_last_modified,
+    get_resumes,
+    get_resumes_by_ids,
+    create_resume,
+    delete_resume,
+    update_resume,
+    attach_resume_file,
+    get_blob,
+    get_storage_stats,
+)
+from app.core.cache import read_through, response_cache, resume_key
+from app.core.conditional import (
+    build_response,
+    conditional_response,
+    etag_matches,
+    not_modified,
+    not_modified_since,
+    only_if_modified_since,
+)
+from app.core.config import settings
+from app.core.database import get_db, replicas, run_db, stream_partitions
+from app.core.export import MEDIA_TYPES, encode_stream
+from app.crud.counts import count_resumes
+from app.crud.extraction import get_resume_text
+from app.crud.resume_search import search_resumes
+from app.crud.export import RESUME_FIELDS, resume_export_query, rows_to_dicts
+from app.core.exceptions import InvalidUploadError, ResumeFileNotFoundError, ResumeNotFoundError
+from app.core.logger import logger, read_logger
+from app.core.lookup import IDS_QUERY, parse_ids
+from app.core.pagination import TOTAL_COUNT_QUERY, decode_cursor, set_next_page_headers
+from app.core.serialization import encode_lookup
+from app.core.storage import blob_store
+from app.core.uploads import store_upload
+from app.routers.imports import IMPORT_BODY, run_import
 
 router = APIRouter()
 
+
+NOT_MODIFIED = {304: {"description": "Not Modified (ETag / If-None-Match or If-Modified-Since matched)"}}
+
+EXPORT_RESPONSES = {
+    200: {
+        "description": "Streamed export",
+        "content": {media_type: {} for media_type in MEDIA_TYPES.values()},
+    }
+}
+
+UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+FILE_RESPONSES = {
+    200: {"description": "The stored file (206 for Range requests)", "content": {"application/octet-stream": {}}},
+    304: {"description": "Not Modified (ETag / If-None-Match matched)"},
+}
+
+def resume_last_modified(resume: schemas.Resume):
+    return resume.updated_at or resume.uploaded_at
+
 @router.post("/", response_model=schemas.Resume, status_code=status.HTTP_201_CREATED)
-def create_resume_endpoint(resume: schemas.ResumeCreate, db: Session = Depends(get_db)):
+async def create_resume_endpoint(resume: schemas.ResumeCreate, db: Session = Depends(get_db)):
     """Create a new resume."""
-    logger.info(f"Creating new resume for candidate ID: {resume.candidate_id}")
-    return create_resume(db, resume)
-
-@router.get("/", response_model=List[schemas.Resume])
-def read_resumes(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all resumes with pagination."""
-    resumes = get_resumes(db, skip=skip, limit=limit)
-    logger.info(f"Retrieved {len(resumes)} resumes")
-    return resumes
-
-@router.get("/{resume_id}", response_model=schemas.Resume)
-def read_resume(resume_id: int, db: Session = Depends(get_db)):
-    """Get a specific resume by ID."""
-    logger.info(f"Fetching resume with ID: {resume_id}")
-    db_resume = get_resume(db, resume_id)
-    if db_resume is None:
+    logger.info("Creating new resume for candidate ID: %s", resume.candidate_id)
+    return await run_db(db, create_resume, resume, schema=schemas.Resume)
+
+@router.post("/import", response_model=schemas.ImportResult, openapi_extra=IMPORT_BODY)
+async def import_resumes_endpoint(request: Request,
+                                  import_format: Literal["csv", "ndjson"] | None = Query(None, alias="format")):
+    """
+    Import resumes from a CSV (with header) or NDJSON request body, streamed and
+    processed in chunks. Rows are validated against ``ResumeCreate``; rows whose
+    candidate does not exist are rejected and listed in ``errors``.
+    """
+    return await run_import(request, "resumes", import_format)
+
+@router.get("/", response_model=List[Union[schemas.Resume, schemas.ResumeNotFound]], responses=NOT_MODIFIED)
+async def read_resumes(request: Request, skip: int = 0, limit: int = 100,
+                       after: str | None = None, ids: str | None = IDS_QUERY,
+                       count: Literal["exact", "estimated"] | None = TOTAL_COUNT_QUERY,
+                       db: Session = Depends(get_db)):
+    """
+    Get all resumes with pagination; ``after`` takes the cursor from ``X-Next-Cursor``.
+    ``count`` adds the total number of resumes as ``X-Total-Count``.
+
+    ``ids=3,1,2`` looks up those resumes with one query instead, in request
+    order, a missing ID yielding ``{"resume_id": ..., "not_found": true}``.
+    """
+    if ids is not None:
+        requested = parse_ids(request, exclusive=("skip", "limit", "after", "count"))
+        resumes, body = await run_db(db, get_resumes_by_ids, list(dict.fromkeys(requested)),
+                                     schema=schemas.Resume,
+                                     encode=partial(encode_lookup, ids=requested, key="resume_id"))
+        read_logger.info("Looked up %s resumes, %s found", len(requested), len(resumes))
+        return conditional_response(request, build_response(body))
+    after_id = decode_cursor(after) if after else None
+    resumes, body = await run_db(db, get_resumes, skip=skip, limit=limit, after=after_id,
+                                 schema=schemas.Resume, encode=True)
+    response = conditional_response(request, build_response(body))
+    set_next_page_headers(request, response, resumes, limit, key="resume_id")
+    if count is not None:
+        response.headers["X-Total-Count"] = str(await run_db(db, count_resumes, count))
+    read_logger.info("Retrieved %s resumes", len(resumes))
+    return response
+
+@router.get("/search", response_model=List[schemas.ResumeSearchHit])
+async def search_resumes_endpoint(q: str = Query(..., min_length=1, max_length=200),
+                                  skip: int = Query(0, ge=0),
+                                  limit: int = Query(20, ge=1, le=100),
+                                  db: Session = Depends(get_db)):
+    """
+    Keyword search over extracted resume text. Words are AND-ed; use ``OR``,
+    ``-word`` to exclude and "quoted phrases". Best matches first, each with
+    its candidate.
+    """
+    hits = await run_db(db, search_resumes, q, skip=skip, limit=limit, schema=schemas.ResumeSearchHit)
+    read_logger.info("Resume search returned %s hits", len(hits))
+    return hits
+
+@router.get("/export", response_class=StreamingResponse, responses=EXPORT_RESPONSES)
+async def export_resumes(export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format")):
+    """Stream every resume as NDJSON or CSV through a server-side cursor."""
+    logger.info("Exporting resumes as %s", export_format)
+    partitions = stream_partitions(resume_export_query(), settings.EXPORT_BATCH_SIZE)
+    return StreamingResponse(
+        encode_stream(partitions, rows_to_dicts, export_format, RESUME_FIELDS),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="resumes.{export_format}"'},
+    )
+
+@router.get("/storage", response_model=schemas.ResumeStorageStats)
+async def read_storage_stats(db: Session = Depends(get_db)):
+    """Report stored versus referenced bytes for uploaded resume files."""
+    return await run_db(db, get_storage_stats)
+
+@router.get("/{resume_id}", response_model=schemas.Resume, responses=NOT_MODIFIED)
+async def read_resume(resume_id: int, request: Request, db: Session = Depends(get_db)):
+    """Get a specific resume by ID. Supports ETag and Last-Modified validators."""
+    read_logger.info("Fetching resume with ID: %s", resume_id)
+    key = resume_key(resume_id)
+    if only_if_modified_since(request) and response_cache.peek(key) is None:
+        # Answer date-only revalidation from the timestamp column, not the full row
+        last_modified = await run_db(db, get_resume_last_modified, resume_id)
+        if not_modified_since(request, last_modified):
+            return not_modified(last_modified=last_modified)
+    cached = await read_through(
+        key,
+        lambda: run_db(db, get_resume, resume_id, schema=schemas.Resume, encode=True),
+        last_modified_of=resume_last_modified,
+        # A client that just wrote reads from the primary; don't serve it a replica-filled entry
+        refresh=replicas.is_sticky(request),
+    )
+    if cached is None:
+        raise ResumeNotFoundError(resume_id)
+    return conditional_response(request, cached)
+
+@router.post("/{resume_id}/file", response_model=schemas.Resume, openapi_extra=UPLOAD_BODY)
+async def upload_resume_file(resume_id: int, request: Request,
+                             sha256: str | None = Query(None, pattern="^[0-9a-f]{64}$"),
+                             filename: str | None = None,
+                             db: Session = Depends(get_db)):
+    """
+    Upload the resume document as ``multipart/form-data`` (part ``file``).
+
+    The body is streamed to the content-addressed store and hashed on the way,
+    never held whole in memory; ``file_url`` then points at the stored blob.
+    When ``sha256`` names content that is already stored, the resume is attached
+    to that blob without reading the body (send ``Expect: 100-continue`` to skip
+    the transfer entirely); otherwise the upload must match the digest.
+    """
+    if await run_db(db, get_resume, resume_id) is None:
+        raise ResumeNotFoundError(resume_id)
+    if sha256:
+        blob = await run_db(db, get_blob, sha256)
+        if blob is not None and blob_store.exists(sha256):
+            logger.info("Resume %s upload deduplicated against blob %s", resume_id, sha256)
+            return await run_db(db, attach_resume_file, resume_id, sha256, blob.size,
+                                filename, blob.content_type, schema=schemas.Resume)
+    uploaded = await store_upload(request, blob_store, settings.RESUME_MAX_FILE_BYTES)
+    if sha256 and uploaded.blob.digest != sha256:
+        raise InvalidUploadError(f"Uploaded content has SHA-256 {uploaded.blob.digest}, expected {sha256}.")
+    logger.info("Stored %s byte upload for resume %s as %s", uploaded.blob.size, resume_id, uploaded.blob.digest)
+    return await run_db(
+        db, attach_resume_file, resume_id, uploaded.blob.digest, uploaded.blob.size,
+        filename or uploaded.filename, uploaded.content_type,
+        schema=schemas.Resume,
+    )
+
+@router.get("/{resume_id}/file", response_class=FileResponse, responses=FILE_RESPONSES)
+async def download_resume_file(resume_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Download the stored resume document. Supports ``Range``/``If-Range`` and
+    ``If-None-Match``; the ETag is the content digest.
+    """
+    resume = await run_db(db, get_resume, resume_id, schema=schemas.Resume)
+    if resume is None:
+        raise ResumeNotFoundError(resume_id)
+    digest = blob_store.digest_from_url(resume.file_url)
+    if digest is None or not blob_store.exists(digest):
+        raise ResumeFileNotFoundError(resume_id)
+    etag = f'"{digest}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    # FileResponse answers Range requests with 206 and uses the ASGI pathsend
+    # extension (zero-copy sendfile) when the server offers it
+    return FileResponse(
+        blob_store.path_for(digest),
+        media_type=resume.content_type or "application/octet-stream",
+        filename=resume.file_name,
+        content_disposition_type="inline",
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
+    )
+
+@router.get("/{resume_id}/text", response_model=schemas.ResumeTextStatus)
+async def read_resume_text(resume_id: int, include_text: bool = True, db: Session = Depends(get_db)):
+    """
+    Text extracted from the resume file, with its extraction status. ``pending``
+    means the extraction worker has not processed the current file yet.
+    """
+    extracted = await run_db(db, get_resume_text, resume_id)
+    if extracted is None:
         raise ResumeNotFoundError(resume_id)
-    return db_resume
+    if not include_text:
+        extracted.pop("text", None)
+    return extracted
 
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_resume_endpoint(resume_id: int, db: Session = Depends(get_db)):
+async def delete_resume_endpoint(resume_id: int, db: Session = Depends(get_db)):
     """Delete a resume by ID."""
-    logger.info(f"Deleting resume with ID: {resume_id}")
-    delete_resume(db, resume_id)
+    logger.info("Deleting resume with ID: %s", resume_id)
+    await run_db(db, delete_resume, resume_id)
     return
 
 @router.put("/{resume_id}", response_model=schemas.Resume)
-def update_resume_endpoint(resume_id: int, resume: schemas.ResumeUpdate, db: Session = Depends(get_db)):
+async def update_resume_endpoint(resume_id: int, resume: schemas.ResumeUpdate, db: Session = Depends(get_db)):
     """Update resume metadata."""
-    logger.info(f"Updating resume ID: {resume_id}")
-    return update_resume(db, resume_id, resume)
+    logger.info("Updating resume ID: %s", resume_id)
+    return await run_db(db, update_resume, resume_id, resume, schema=schemas.Resume)
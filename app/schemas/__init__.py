@@ -1,16 +1,51 @@
 """Schema re-exports for easier imports."""
 # Re-export all schemas to maintain compatibility
-from app.schemas.candidate import CandidateBase, CandidateCreate, Candidate, CandidateUpdate
-from app.schemas.resume import ResumeBase, ResumeCreate, Resume, ResumeUpdate
+from app.schemas.candidate import (
+    CandidateBase,
+    CandidateCreate,
+    Candidate,
+    CandidateFields,
+    CandidateNotFound,
+    CandidateUpdate,
+    CandidateBulkItemResult,
+    CandidateBulkResult,
+    CandidateSummary,
+    CandidateDuplicateMatch,
+)
+from app.schemas.resume import (
+    ResumeBase,
+    ResumeCreate,
+    Resume,
+    ResumeNotFound,
+    ResumeUpdate,
+    ResumeStorageStats,
+    ResumeTextStatus,
+    ResumeSearchCandidate,
+    ResumeSearchHit,
+)
+from app.schemas.imports import ImportRowError, ImportResult
 
 __all__ = [
     'CandidateBase', 
     'CandidateCreate', 
     'Candidate', 
+    'CandidateFields',
+    'CandidateNotFound',
     'CandidateUpdate',
+    'CandidateBulkItemResult',
+    'CandidateBulkResult',
+    'CandidateSummary',
+    'CandidateDuplicateMatch',
     'ResumeBase', 
     'ResumeCreate', 
     'Resume', 
-    'ResumeUpdate'
+    'ResumeNotFound',
+    'ResumeUpdate',
+    'ResumeStorageStats',
+    'ResumeTextStatus',
+    'ResumeSearchCandidate',
+    'ResumeSearchHit',
+    'ImportRowError',
+    'ImportResult',
 ]
 
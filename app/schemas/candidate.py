@@ -1,6 +1,6 @@
 """Pydantic schemas for candidates."""
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 # Import Resume schema for relationship
@@ -29,6 +29,37 @@ class Candidate(CandidateBase):
     class Config:
         from_attributes = True  # Updated from orm_mode
 
+def _drop_null_defaults(schema: dict) -> None:
+    # Unselected fields are left out of the response, not sent as null
+    for prop in schema.get("properties", {}).values():
+        prop.pop("default", None)
+
+class CandidateFields(BaseModel):
+    """
+    A candidate as returned by reads accepting ``fields`` and ``include``.
+
+    Without them every field is present. With ``fields`` only the selected
+    fields (and always ``candidate_id``) are; ``resumes`` only appears when
+    requested with ``include=resumes`` (or listed in ``fields``). Fields that
+    were not selected are left out of the response, not sent as null.
+    """
+    candidate_id: int
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[EmailStr] = None
+    phone: str | None = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    resumes: Optional[List[Resume]] = None
+
+    class Config:
+        json_schema_extra = _drop_null_defaults
+
+class CandidateNotFound(BaseModel):
+    """Stands in for a requested ID that does not exist in an ``ids`` lookup."""
+    candidate_id: int
+    not_found: Literal[True]
+
 class CandidateUpdate(BaseModel):
     first_name: str | None = None
     last_name: str | None = None
@@ -36,4 +67,34 @@ class CandidateUpdate(BaseModel):
     phone: str | None = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class CandidateBulkItemResult(BaseModel):
+    """Outcome for one item of a bulk create, in request order."""
+    index: int
+    email: EmailStr
+    status: Literal["created", "conflict"]
+    candidate_id: int | None = None
+    detail: str | None = None
+
+class CandidateBulkResult(BaseModel):
+    created: int
+    conflicts: int
+    results: List[CandidateBulkItemResult]
+
+class CandidateSummary(BaseModel):
+    candidate_id: int
+    first_name: str
+    last_name: str
+    email: str
+    phone: str | None = None
+
+    class Config:
+        from_attributes = True
+
+class CandidateDuplicateMatch(BaseModel):
+    """A possible duplicate of a candidate, as scored by the detection job."""
+    candidate: CandidateSummary
+    score: float
+    reasons: List[str]
+    detected_at: Optional[datetime] = None
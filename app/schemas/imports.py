@@ -0,0 +1,18 @@
+"""Pydantic schemas for bulk file imports."""
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+class ImportRowError(BaseModel):
+    line: int
+    reason: str
+    record: Optional[Dict[str, Any]] = None
+
+class ImportResult(BaseModel):
+    received: int
+    created: int
+    updated: int
+    rejected: int
+    seconds: float
+    rows_per_sec: float
+    errors: List[ImportRowError] = []
+    errors_truncated: bool = False
@@ -1,7 +1,7 @@
 """Pydantic schemas for resumes."""
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Literal, Optional
 
 class ResumeBase(BaseModel):
     title: str
@@ -14,13 +14,56 @@ class Resume(ResumeBase):
     resume_id: int
     candidate_id: int
     uploaded_at: datetime
+    updated_at: Optional[datetime] = None
+    file_name: Optional[str] = None
+    content_type: Optional[str] = None
+    file_size: Optional[int] = None
+    content_hash: Optional[str] = None
 
     class Config:
         from_attributes = True  # Updated from orm_mode
 
+class ResumeNotFound(BaseModel):
+    """Stands in for a requested ID that does not exist in an ``ids`` lookup."""
+    resume_id: int
+    not_found: Literal[True]
+
 class ResumeUpdate(BaseModel):
     title: str | None = None
     file_url: str | None = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ResumeStorageStats(BaseModel):
+    """How much space content-hash deduplication of resume files saves."""
+    resume_files: int
+    blobs: int
+    logical_bytes: int
+    stored_bytes: int
+    saved_bytes: int
+    dedup_ratio: float
+
+class ResumeTextStatus(BaseModel):
+    """Text extraction state of a resume: pending, done, failed or unsupported."""
+    resume_id: int
+    status: str
+    char_count: Optional[int] = None
+    error: Optional[str] = None
+    extracted_at: Optional[datetime] = None
+    text: Optional[str] = None
+
+class ResumeSearchCandidate(BaseModel):
+    candidate_id: int
+    first_name: str
+    last_name: str
+    email: str
+
+class ResumeSearchHit(BaseModel):
+    """A resume matching a keyword search, with its candidate."""
+    resume_id: int
+    candidate_id: int
+    title: str
+    rank: float
+    snippet: Optional[str] = None
+    candidate: ResumeSearchCandidate
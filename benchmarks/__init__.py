@@ -0,0 +1 @@
+"""Performance benchmarks for the Candidate & Resume Management API."""
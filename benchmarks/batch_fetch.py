@@ -0,0 +1,115 @@
+"""
+Compare rendering a list of known candidates with one ``GET /candidates/{id}``
+per ID against a single ``GET /candidates/?ids=...`` batch lookup.
+
+Seeds suite candidates (as ``benchmarks.suite`` does), starts the API in a
+subprocess and, for each round, picks ``--ids`` random existing IDs and fetches
+them three ways: one request at a time, ``--concurrency`` requests in flight
+(what a browser does against one host), and one batch call. Reports per-round
+wall time, requests, bytes received and DB statements (from the server's
+``/metrics``). The response cache is disabled unless ``--cache`` is given, so
+every single GET reaches the database.
+
+Usage:
+    python -m benchmarks.batch_fetch --candidates 100000 --ids 200 --rounds 20
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import subprocess
+import time
+
+import httpx
+from sqlalchemy import select
+
+from app.core.database import engine
+from app.models import Candidate
+from benchmarks.load import percentile, run_server
+from benchmarks.suite import SUITE_DOMAIN, seed, statement_totals, statements_per_request
+
+
+async def fetch_singles(client: httpx.AsyncClient, ids: list, concurrency: int) -> int:
+    """GET every candidate with at most ``concurrency`` in flight; returns bytes received."""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def fetch(candidate_id: int) -> int:
+        async with limit:
+            response = await client.get(f"/candidates/{candidate_id}")
+            response.raise_for_status()
+            return len(response.content)
+
+    return sum(await asyncio.gather(*(fetch(candidate_id) for candidate_id in ids)))
+
+
+async def fetch_batch(client: httpx.AsyncClient, ids: list) -> int:
+    response = await client.get("/candidates/", params={"ids": ",".join(map(str, ids))})
+    response.raise_for_status()
+    return len(response.content)
+
+
+async def run_mode(base_url: str, mode: str, id_sets: list, concurrency: int) -> dict:
+    wall, received = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        await client.get("/health")  # open a connection outside the timed rounds
+        with httpx.Client(base_url=base_url) as scraper:
+            before = statement_totals(scraper)
+        for ids in id_sets:
+            started = time.perf_counter()
+            if mode == "batch":
+                received += await fetch_batch(client, ids)
+            else:
+                received += await fetch_singles(client, ids, 1 if mode == "single_sequential" else concurrency)
+            wall.append(time.perf_counter() - started)
+        with httpx.Client(base_url=base_url) as scraper:
+            after = statement_totals(scraper)
+    routes = {("GET", "/candidates/")} if mode == "batch" else {("GET", "/candidates/{candidate_id}")}
+    per_request = statements_per_request(before, after, routes)
+    requests_per_round = 1 if mode == "batch" else len(id_sets[0])
+    return {
+        "requests_per_round": requests_per_round,
+        "round_p50_ms": round(statistics.median(wall) * 1000, 2),
+        "round_p95_ms": round(percentile(wall, 95) * 1000, 2),
+        "bytes_per_round": received // len(id_sets),
+        "statements_per_round": None if per_request is None else round(per_request * requests_per_round, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100_000, help="Seeded candidates")
+    parser.add_argument("--resumes-per-candidate", type=float, default=2.0)
+    parser.add_argument("--no-seed", action="store_true", help="Use the suite rows already in the database")
+    parser.add_argument("--ids", type=int, default=200, help="Candidates rendered per round")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=6, help="Single GETs in flight (browser per-host limit)")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache enabled")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if not args.no_seed:
+        seed(args.candidates, args.resumes_per_candidate, duplicate_rate=0.0)
+    with engine.connect() as conn:
+        candidate_ids = conn.execute(
+            select(Candidate.candidate_id).where(Candidate.email.like(f"%@{SUITE_DOMAIN}"))
+        ).scalars().all()
+    rng = random.Random(0)
+    id_sets = [rng.sample(candidate_ids, args.ids) for _ in range(args.rounds)]
+
+    env = {} if args.cache else {"CACHE_ENABLED": "false"}
+    with run_server(port=args.port, env=env, stdout=subprocess.DEVNULL) as base_url:
+        results = {mode: asyncio.run(run_mode(base_url, mode, id_sets, args.concurrency))
+                   for mode in ("single_sequential", "single_concurrent", "batch")}
+
+    print(json.dumps({"ids_per_round": args.ids, "rounds": args.rounds, "concurrency": args.concurrency,
+                      "cache": args.cache, "results": results}, indent=2))
+    print(f"\n{'mode':>18} {'requests':>9} {'p50 ms':>9} {'p95 ms':>9} {'KB':>8} {'statements':>11}")
+    for mode, row in results.items():
+        print(f"{mode:>18} {row['requests_per_round']:>9} {row['round_p50_ms']:>9} {row['round_p95_ms']:>9} "
+              f"{row['bytes_per_round'] // 1024:>8} {row['statements_per_round'] or '-':>11}")
+
+
+if __name__ == "__main__":
+    main()
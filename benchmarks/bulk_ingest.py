@@ -0,0 +1,65 @@
+"""
+Compare rows/sec of ``POST /candidates/`` (one row per request) with
+``POST /candidates/bulk`` (batched, set-based inserts).
+
+Usage:
+    python -m benchmarks.bulk_ingest --single 2000 --bulk 50000 --batch 1000
+"""
+import argparse
+import json
+import time
+import uuid
+
+import httpx
+
+from benchmarks.load import run_server
+
+
+def make_rows(count: int, tag: str) -> list:
+    return [
+        {
+            "first_name": "Bulk",
+            "last_name": f"Row{n}",
+            "email": f"bulk_bench_{tag}_{n}@example.com",
+            "phone": f"{n:010d}",
+        }
+        for n in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--single", type=int, default=2000, help="Rows sent one per request")
+    parser.add_argument("--bulk", type=int, default=50000, help="Rows sent through /candidates/bulk")
+    parser.add_argument("--batch", type=int, default=1000, help="Items per bulk request")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    tag = uuid.uuid4().hex[:8]
+    with run_server(port=args.port) as base_url, httpx.Client(base_url=base_url, timeout=300.0) as client:
+        rows = make_rows(args.single, f"{tag}s")
+        started = time.perf_counter()
+        for row in rows:
+            client.post("/candidates/", json=row).raise_for_status()
+        single_elapsed = time.perf_counter() - started
+
+        rows = make_rows(args.bulk, f"{tag}b")
+        created = 0
+        started = time.perf_counter()
+        for start in range(0, len(rows), args.batch):
+            response = client.post("/candidates/bulk", json=rows[start:start + args.batch])
+            response.raise_for_status()
+            created += response.json()["created"]
+        bulk_elapsed = time.perf_counter() - started
+
+    single_rps = args.single / single_elapsed
+    bulk_rps = created / bulk_elapsed
+    print(json.dumps({
+        "single": {"rows": args.single, "seconds": round(single_elapsed, 2), "rows_per_sec": round(single_rps, 1)},
+        "bulk": {"rows": created, "seconds": round(bulk_elapsed, 2), "rows_per_sec": round(bulk_rps, 1)},
+        "speedup": round(bulk_rps / single_rps, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
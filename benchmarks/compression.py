@@ -0,0 +1,87 @@
+"""
+Compare response compression settings: bytes on the wire and CPU per response.
+
+Encodes a ``GET /candidates/?limit=1000`` page with nested resumes (built in
+memory, as in ``benchmarks.serialization``) and compresses it with every
+available encoding at several levels, both in one shot (regular responses)
+and as a stream of flushed chunks (how exports are sent). brotli and zstd are
+only measured when their packages are installed.
+
+Usage:
+    python -m benchmarks.compression --page-size 1000 --resumes 3 --chunk-rows 100
+"""
+import argparse
+import json
+import time
+
+from app import schemas
+from app.core.compression import COMPRESSORS
+from app.core.serialization import dumps, row_serializer
+from benchmarks.serialization import make_page
+
+LEVELS = {"gzip": (1, 4, 6, 9), "br": (1, 4, 6, 11), "zstd": (1, 3, 6, 19)}
+
+
+def cpu_us(fn, rounds: int) -> float:
+    fn()  # warm up
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return round(best * 1e6, 1)
+
+
+def one_shot(factory, level: int, body: bytes) -> bytes:
+    return factory(level).finish(body)
+
+
+def streamed(factory, level: int, chunks: list) -> bytes:
+    compressor = factory(level)
+    out = [compressor.compress(chunk) for chunk in chunks]
+    out.append(compressor.finish())
+    return b"".join(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--resumes", type=int, default=3)
+    parser.add_argument("--chunk-rows", type=int, default=100, help="NDJSON rows per streamed chunk")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    to_dict = row_serializer(schemas.Candidate)
+    rows = [to_dict(candidate) for candidate in make_page(args.page_size, args.resumes)]
+    body = dumps(rows)
+    lines = [dumps(row) + b"\n" for row in rows]
+    chunks = [b"".join(lines[i:i + args.chunk_rows]) for i in range(0, len(lines), args.chunk_rows)]
+
+    results = []
+    for encoding, factory in COMPRESSORS.items():
+        for level in LEVELS[encoding]:
+            page = one_shot(factory, level, body)
+            stream = streamed(factory, level, chunks)
+            results.append({
+                "encoding": encoding,
+                "level": level,
+                "page_bytes": len(page),
+                "page_ratio": round(len(body) / len(page), 1),
+                "page_cpu_us": cpu_us(lambda: one_shot(factory, level, body), args.rounds),
+                "stream_bytes": len(stream),
+                "stream_cpu_us": cpu_us(lambda: streamed(factory, level, chunks), args.rounds),
+            })
+
+    print(json.dumps({
+        "page_size": args.page_size,
+        "resumes_per_candidate": args.resumes,
+        "identity_page_bytes": len(body),
+        "identity_stream_bytes": sum(map(len, chunks)),
+        "stream_chunks": len(chunks),
+        "available": list(COMPRESSORS),
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Compare the sync (threadpool) and async (AsyncSession/asyncpg) database modes.
+
+Starts the API once per mode with ``DB_ASYNC_MODE`` toggled and drives a read-heavy
+mix (``GET /candidates/{id}`` and ``GET /candidates/``) at increasing client counts,
+reporting requests/sec and p99 latency per level.
+
+Usage:
+    python -m benchmarks.db_modes --concurrency 50 100 250 500 --duration 15
+"""
+import argparse
+import asyncio
+import json
+
+import httpx
+
+from benchmarks.load import drive, run_server
+
+
+def seed(base_url: str, count: int) -> list:
+    """Create ``count`` candidates through the API and return their IDs."""
+    ids = []
+    with httpx.Client(base_url=base_url, timeout=30.0) as client:
+        for n in range(count):
+            response = client.post("/candidates/", json={
+                "first_name": "Bench",
+                "last_name": f"Mode{n}",
+                "email": f"bench_mode_{n}@example.com",
+                "phone": "5550000000",
+            })
+            if response.status_code == 201:
+                ids.append(response.json()["candidate_id"])
+        if not ids:
+            ids = [c["candidate_id"] for c in client.get("/candidates/", params={"limit": count}).json()]
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 100, 250, 500])
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds measured per level")
+    parser.add_argument("--seed", type=int, default=200, help="Candidates to create before running")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results = {}
+    for mode, flag in (("sync", "false"), ("async", "true")):
+        with run_server(port=args.port, env={"DB_ASYNC_MODE": flag}) as base_url:
+            ids = seed(base_url, args.seed)
+
+            def make_request(i):
+                if i % 10 == 0:
+                    return ("GET", "/candidates/", {"params": {"limit": 20}})
+                return ("GET", f"/candidates/{ids[i % len(ids)]}")
+
+            results[mode] = {
+                str(level): asyncio.run(drive(base_url, make_request, level, args.duration))
+                for level in args.concurrency
+            }
+
+    print(json.dumps(results, indent=2))
+    print(f"\n{'clients':>8} {'sync rps':>10} {'async rps':>10} {'sync p99':>10} {'async p99':>10}")
+    for level in args.concurrency:
+        s, a = results["sync"][str(level)], results["async"][str(level)]
+        print(f"{level:>8} {s['rps']:>10} {a['rps']:>10} {s['p99_ms']:>9}ms {a['p99_ms']:>9}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Stream a full candidate export and sample the server's RSS while it runs.
+
+Memory should stay flat however many rows are exported, because rows are read
+through a server-side cursor and written out batch by batch.
+
+Usage:
+    python -m benchmarks.export_memory --rows 5000000 --format ndjson --include-resumes
+"""
+import argparse
+import json
+import time
+
+import httpx
+
+from benchmarks.load import rss_kb, start_server
+from benchmarks.seed import seed_candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--include-resumes", action="store_true")
+    parser.add_argument("--resumes-per-candidate", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    seed_candidates(args.rows, resumes_per_candidate=args.resumes_per_candidate)
+    samples = []
+    with start_server(port=args.port) as (process, base_url):
+        baseline = rss_kb(process.pid)
+        params = {"format": args.format, "include_resumes": str(args.include_resumes).lower()}
+        started = time.perf_counter()
+        exported_bytes = 0
+        lines = 0
+        last_sample = 0.0
+        with httpx.stream("GET", f"{base_url}/candidates/export", params=params, timeout=None) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                exported_bytes += len(chunk)
+                lines += chunk.count(b"\n")
+                now = time.perf_counter() - started
+                if now - last_sample >= 0.5:
+                    samples.append((round(now, 1), rss_kb(process.pid)))
+                    last_sample = now
+        elapsed = time.perf_counter() - started
+
+    peak = max((rss for _, rss in samples), default=baseline)
+    print(json.dumps({
+        "lines": lines,
+        "megabytes": round(exported_bytes / 1e6, 1),
+        "seconds": round(elapsed, 1),
+        "lines_per_sec": round(lines / elapsed, 1),
+        "rss_baseline_mb": round(baseline / 1024, 1),
+        "rss_peak_mb": round(peak / 1024, 1),
+        "rss_samples_mb": [(t, round(rss / 1024, 1)) for t, rss in samples],
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
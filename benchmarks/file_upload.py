@@ -0,0 +1,122 @@
+"""
+Upload and download large resume files concurrently and sample server RSS.
+
+Each client uploads its own ``--size-mb`` file (distinct bytes, so every upload
+is hashed and stored) to ``POST /resumes/{id}/file``, then downloads it back.
+Peak RSS should stay near the baseline: uploads are streamed to disk in chunks
+and downloads are served from the file, never buffered whole.
+
+Usage:
+    python -m benchmarks.file_upload --size-mb 50 --concurrency 8
+"""
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from benchmarks.load import rss_kb, start_server
+
+
+def make_files(directory: str, count: int, size: int) -> list:
+    """``count`` files of ``size`` bytes that differ in their first block."""
+    block = os.urandom(1024 * 1024)
+    paths = []
+    for n in range(count):
+        path = os.path.join(directory, f"resume_{n}.pdf")
+        with open(path, "wb") as f:
+            f.write(uuid.uuid4().bytes)
+            written = 16
+            while written < size:
+                chunk = block[: size - written]
+                f.write(chunk)
+                written += len(chunk)
+        paths.append(path)
+    return paths
+
+
+def create_resumes(base_url: str, count: int) -> list:
+    with httpx.Client(base_url=base_url) as client:
+        candidate = client.post("/candidates/", json={
+            "first_name": "Upload",
+            "last_name": "Bench",
+            "email": f"upload_{uuid.uuid4().hex[:12]}@example.com",
+        }).json()
+        return [
+            client.post("/resumes/", json={
+                "candidate_id": candidate["candidate_id"],
+                "title": f"Upload bench {n}",
+                "file_url": "pending",
+            }).json()["resume_id"]
+            for n in range(count)
+        ]
+
+
+def transfer(base_url: str, resume_id: int, path: str) -> tuple:
+    """Upload then download one file; returns (upload_seconds, download_seconds)."""
+    with httpx.Client(base_url=base_url, timeout=None) as client:
+        started = time.perf_counter()
+        with open(path, "rb") as f:
+            response = client.post(f"/resumes/{resume_id}/file",
+                                   files={"file": (os.path.basename(path), f, "application/pdf")})
+        response.raise_for_status()
+        uploaded = time.perf_counter() - started
+
+        started = time.perf_counter()
+        with client.stream("GET", f"/resumes/{resume_id}/file") as response:
+            response.raise_for_status()
+            for _ in response.iter_bytes(1024 * 1024):
+                pass
+        return uploaded, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    size = args.size_mb * 1024 * 1024
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = make_files(workdir, args.concurrency, size)
+        env = {"RESUME_STORAGE_DIR": os.path.join(workdir, "store")}
+        with start_server(port=args.port, env=env) as (process, base_url):
+            resume_ids = create_resumes(base_url, args.concurrency)
+            baseline = rss_kb(process.pid)
+            samples = []
+            done = threading.Event()
+
+            def sample():
+                while not done.wait(0.2):
+                    samples.append(rss_kb(process.pid))
+
+            sampler = threading.Thread(target=sample, daemon=True)
+            sampler.start()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                timings = list(pool.map(lambda job: transfer(base_url, *job), zip(resume_ids, paths)))
+            elapsed = time.perf_counter() - started
+            done.set()
+            sampler.join()
+
+    total_mb = size * args.concurrency / 1e6
+    upload_seconds = max(t[0] for t in timings)
+    print(json.dumps({
+        "files": args.concurrency,
+        "file_mb": round(size / 1e6, 1),
+        "upload_mb_per_sec": round(total_mb / upload_seconds, 1),
+        "download_mb_per_sec": round(total_mb / max(t[1] for t in timings), 1),
+        "seconds": round(elapsed, 1),
+        "rss_baseline_mb": round(baseline / 1024, 1),
+        "rss_peak_mb": round(max(samples, default=baseline) / 1024, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Compare OFFSET and keyset (cursor) page latency at shallow and deep pages.
+
+Seeds a few million candidates, then times ``get_candidates`` for page 1 and a
+deep page using ``skip`` and using ``after``. Keyset latency should stay flat
+while OFFSET grows with the page number.
+
+Usage:
+    python -m benchmarks.keyset_pagination --rows 3000000 --pages 1 100 1000 10000
+"""
+import argparse
+import json
+import statistics
+import time
+
+from app.core.database import SessionLocal
+from app.crud.candidate import get_candidates
+from app.models.candidate import Candidate
+from benchmarks.seed import seed_candidates
+
+
+def time_call(fn, repeat: int) -> float:
+    """Median wall time of ``fn`` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    seed_candidates(args.rows)
+    results = {}
+    db = SessionLocal()
+    try:
+        for page in args.pages:
+            skip = (page - 1) * args.limit
+            # Resolve the keyset boundary once, outside the timed section.
+            boundary = (
+                db.query(Candidate.candidate_id)
+                .order_by(Candidate.candidate_id)
+                .offset(skip - 1)
+                .limit(1)
+                .scalar()
+                if skip
+                else None
+            )
+            results[page] = {
+                "offset_ms": time_call(lambda: get_candidates(db, skip=skip, limit=args.limit), args.repeat),
+                "keyset_ms": time_call(lambda: get_candidates(db, limit=args.limit, after=boundary), args.repeat),
+            }
+            db.expunge_all()
+    finally:
+        db.close()
+
+    print(json.dumps(results, indent=2))
+    print(f"\n{'page':>8} {'offset ms':>12} {'keyset ms':>12}")
+    for page, row in results.items():
+        print(f"{page:>8} {row['offset_ms']:>12} {row['keyset_ms']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Shared helpers for driving a running API server with concurrent HTTP clients."""
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the ``pct`` percentile (0-100) of ``samples`` using nearest-rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """Build the standard result record (latencies in milliseconds)."""
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+async def drive(base_url: str, make_request: Callable[[int], tuple], concurrency: int,
+                duration: float, warmup: float = 1.0) -> Dict[str, float]:
+    """
+    Run ``concurrency`` clients in a closed loop for ``duration`` seconds.
+
+    ``make_request(i)`` returns ``(method, path)`` or ``(method, path, kwargs)`` for
+    the i-th request issued by a client.
+    """
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        start = time.perf_counter()
+        record_from = start + warmup
+        stop_at = record_from + duration
+
+        async def worker(worker_id: int):
+            nonlocal errors
+            i = worker_id
+            while True:
+                now = time.perf_counter()
+                if now >= stop_at:
+                    return
+                spec = make_request(i)
+                method, path = spec[0], spec[1]
+                kwargs = spec[2] if len(spec) > 2 else {}
+                try:
+                    response = await client.request(method, path, **kwargs)
+                    ok = response.status_code < 500
+                except httpx.HTTPError:
+                    ok = False
+                done = time.perf_counter()
+                if now >= record_from:
+                    if ok:
+                        latencies.append(done - now)
+                    else:
+                        errors += 1
+                i += concurrency
+
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+
+    return summarize(latencies, errors, duration)
+
+
+def wait_for_server(base_url: str, timeout: float = 30.0) -> None:
+    """Block until ``GET /health`` answers or ``timeout`` expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server at {base_url} did not become healthy within {timeout}s")
+
+
+@contextmanager
+def start_server(port: int = 8765, env: Optional[Dict[str, str]] = None, workers: int = 1,
+                 stdout: Optional[int] = None):
+    """
+    Start ``uvicorn app.main:app`` in a subprocess; yields ``(process, base_url)``.
+
+    ``stdout`` is passed to ``Popen`` (e.g. ``subprocess.DEVNULL`` to discard
+    application logs); by default the server shares this process's stdout.
+    """
+    server_env = dict(os.environ)
+    server_env.update(env or {})
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=server_env,
+        stdout=stdout,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_for_server(base_url)
+        yield process, base_url
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+@contextmanager
+def run_server(port: int = 8765, env: Optional[Dict[str, str]] = None, workers: int = 1,
+               stdout: Optional[int] = None):
+    """Start ``uvicorn app.main:app`` in a subprocess with extra environment variables."""
+    with start_server(port, env, workers, stdout) as (_, base_url):
+        yield base_url
+
+
+def rss_kb(pid: int) -> int:
+    """Resident set size of ``pid`` in KiB (Linux ``/proc``)."""
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
@@ -0,0 +1,55 @@
+"""
+Compare GET /candidates/{id} throughput with synchronous and queued logging.
+
+Starts the API twice: once logging the old way (text lines written to stdout
+and the log file on the request thread, every read logged) and once with the
+defaults (records queued to a background writer as JSON, read logs sampled).
+Drives the same closed-loop load against both and reports requests/sec and
+latency percentiles. Server stdout goes to a file in both runs, like a
+container log.
+
+Usage:
+    python -m benchmarks.logging_throughput --concurrency 50 --duration 15
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+
+from benchmarks.db_modes import seed
+from benchmarks.load import drive, run_server
+
+MODES = {
+    "sync": {"LOG_QUEUE_ENABLED": "false", "LOG_FORMAT": "text", "LOG_READ_SAMPLE_RATE": "1"},
+    "queued": {"LOG_QUEUE_ENABLED": "true", "LOG_FORMAT": "json"},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=15.0, help="Seconds measured per mode")
+    parser.add_argument("--seed", type=int, default=200, help="Candidates to create before running")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for mode, env in MODES.items():
+            env = {**env, "LOG_FILE": os.path.join(workdir, f"{mode}.log")}
+            with open(os.path.join(workdir, f"{mode}.stdout"), "wb") as stdout, \
+                    run_server(port=args.port, env=env, stdout=stdout.fileno()) as base_url:
+                ids = seed(base_url, args.seed)
+                results[mode] = asyncio.run(drive(
+                    base_url, lambda i: ("GET", f"/candidates/{ids[i % len(ids)]}"), args.concurrency, args.duration,
+                ))
+
+    print(json.dumps(results, indent=2))
+    sync, queued = results["sync"], results["queued"]
+    print(f"\nrps {sync['rps']} -> {queued['rps']} ({queued['rps'] / sync['rps'] - 1:+.1%}), "
+          f"p99 {sync['p99_ms']}ms -> {queued['p99_ms']}ms")
+
+
+if __name__ == "__main__":
+    main()
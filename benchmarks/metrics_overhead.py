@@ -0,0 +1,87 @@
+"""
+Measure the per-request cost of the metrics middleware and DB statement hooks.
+
+Drives a minimal ASGI app in-process (no sockets, so only the instrumentation
+is timed) with and without ``MetricsMiddleware``, then executes ``SELECT 1``
+on an in-memory SQLite engine with and without ``instrument_engine``. Reports
+microseconds added per request and per statement; the budget is < 50 us per
+request.
+
+Usage:
+    python -m benchmarks.metrics_overhead --requests 200000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from sqlalchemy import create_engine, text
+
+from app.core.metrics import MetricsMiddleware, RequestStats, current_request, instrument_engine
+
+
+class Route:
+    path = "/candidates/{candidate_id}"
+
+
+async def endpoint(scope, receive, send):
+    scope["route"] = Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+async def drive(app, requests: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/candidates/1"}
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+def time_statements(conn, statements: int) -> float:
+    query = text("SELECT 1")
+    token = current_request.set(RequestStats())
+    try:
+        start = time.perf_counter()
+        for _ in range(statements):
+            conn.execute(query)
+        return time.perf_counter() - start
+    finally:
+        current_request.reset(token)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--statements", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=5, help="Alternating runs per variant; the fastest counts")
+    args = parser.parse_args()
+
+    plain_engine, timed_engine = create_engine("sqlite://"), create_engine("sqlite://")
+    instrument_engine(timed_engine)
+    bare = wrapped = plain_sql = timed_sql = float("inf")
+    with plain_engine.connect() as plain_conn, timed_engine.connect() as timed_conn:
+        for _ in range(args.rounds):
+            bare = min(bare, asyncio.run(drive(endpoint, args.requests)))
+            wrapped = min(wrapped, asyncio.run(drive(MetricsMiddleware(endpoint), args.requests)))
+            plain_sql = min(plain_sql, time_statements(plain_conn, args.statements))
+            timed_sql = min(timed_sql, time_statements(timed_conn, args.statements))
+
+    print(json.dumps({
+        "requests": args.requests,
+        "middleware_us_per_request": round((wrapped - bare) / args.requests * 1e6, 2),
+        "statements": args.statements,
+        "db_hooks_us_per_statement": round((timed_sql - plain_sql) / args.statements * 1e6, 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Measure resume keyword-search latency over ~1M resumes with extracted text.
+
+Seeds candidates with resumes, gives every benchmark resume a synthetic text
+drawn from a skewed skill vocabulary (so terms range from rare to common),
+then times ``search_resumes`` for random AND / OR / NOT / phrase queries and
+reports p50/p95/p99. On PostgreSQL the GIN index on the generated tsvector
+keeps this far from a sequential scan.
+
+Usage:
+    python -m benchmarks.resume_search --resumes 1000000 --queries 300
+"""
+import argparse
+import json
+import random
+import time
+
+from sqlalchemy import insert, select
+
+from app.core.database import SessionLocal, engine
+from app.core.text_extraction import DONE
+from app.crud.resume_search import search_resumes
+from app.models import Candidate, Resume, ResumeText
+from benchmarks.load import percentile
+from benchmarks.seed import BENCH_EMAIL_PATTERN, seed_candidates
+
+SKILLS = ("python java go rust kubernetes docker terraform aws gcp azure postgres mysql redis kafka spark "
+          "airflow react typescript django fastapi flask graphql grpc linux ansible jenkins pandas numpy "
+          "pytorch tensorflow scala kotlin swift elixir haskell clojure cobol fortran erlang").split()
+FILLER = ("led built designed shipped owned team project platform service data pipeline system "
+          "customers scale reliability migration performance mentoring delivery").split()
+# Zipf-like weights: the first skills appear in many resumes, the last in very few
+WEIGHTS = [1 / (rank + 1) for rank in range(len(SKILLS))]
+
+
+def resume_text(rng: random.Random, words: int) -> str:
+    skills = rng.choices(SKILLS, weights=WEIGHTS, k=max(words // 8, 3))
+    body = [rng.choice(FILLER) for _ in range(words - len(skills))] + skills
+    rng.shuffle(body)
+    return " ".join(body)
+
+
+def seed_texts(rng: random.Random, words: int, batch: int = 10_000) -> None:
+    """Give every benchmark resume without extracted text a synthetic one."""
+    started = time.perf_counter()
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(Resume.resume_id, Resume.file_url)
+                .join(Candidate, Candidate.candidate_id == Resume.candidate_id)
+                .outerjoin(ResumeText, ResumeText.resume_id == Resume.resume_id)
+                .where(Candidate.email.like(BENCH_EMAIL_PATTERN), ResumeText.resume_id.is_(None))
+                .limit(batch)
+            ).all()
+            if not rows:
+                break
+            texts = [resume_text(rng, words) for _ in rows]
+            conn.execute(insert(ResumeText), [
+                {"resume_id": resume_id, "source": file_url, "status": DONE, "text": text, "char_count": len(text)}
+                for (resume_id, file_url), text in zip(rows, texts)
+            ])
+        print(f"  seeded text for {len(rows)} resumes")
+    print(f"Text seeding finished in {time.perf_counter() - started:.1f}s")
+
+
+def make_queries(rng: random.Random, count: int) -> list:
+    queries = []
+    for _ in range(count):
+        a, b, c = rng.sample(SKILLS, 3)
+        queries.append(rng.choice([
+            f"{a} {b}",
+            f"{a} AND {b}",
+            f"{a} OR {b}",
+            f"{a} {b} -{c}",
+            f'"{rng.choice(FILLER)} {rng.choice(FILLER)}" {a}',
+            a,
+        ]))
+    return queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=1_000_000)
+    parser.add_argument("--resumes-per-candidate", type=int, default=2)
+    parser.add_argument("--words", type=int, default=120)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    seed_candidates(args.resumes // args.resumes_per_candidate, resumes_per_candidate=args.resumes_per_candidate)
+    seed_texts(rng, args.words)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ANALYZE resume_texts")
+
+    queries = make_queries(rng, args.queries)
+    latencies = []
+    hits = 0
+    db = SessionLocal()
+    try:
+        for q in queries[:10]:
+            search_resumes(db, q, limit=args.limit)
+        for q in queries:
+            started = time.perf_counter()
+            hits += len(search_resumes(db, q, limit=args.limit))
+            latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        db.close()
+
+    print(json.dumps({
+        "resumes": args.resumes,
+        "queries": len(latencies),
+        "avg_hits": round(hits / len(latencies), 1),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
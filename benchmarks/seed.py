@@ -0,0 +1,66 @@
+"""Bulk seeding of benchmark data straight through the sync engine."""
+import time
+
+from sqlalchemy import text
+
+from app.core.database import Base, engine
+from app.models import Candidate, Resume  # noqa: F401  (register tables)
+
+BENCH_EMAIL_PATTERN = "bench_%@example.com"
+
+# Set-based generators per dialect; rows are numbered so reruns are idempotent.
+CANDIDATE_SQL = {
+    "postgresql": """
+        INSERT INTO candidates (first_name, last_name, email, phone)
+        SELECT 'Bench' || (g % 997), 'Row' || g, 'bench_' || g || '@example.com',
+               lpad((g % 10000000000)::text, 10, '0')
+        FROM generate_series(:start, :stop) AS g
+        ON CONFLICT (email) DO NOTHING
+    """,
+    "sqlite": """
+        WITH RECURSIVE g(n) AS (SELECT :start UNION ALL SELECT n + 1 FROM g WHERE n < :stop)
+        INSERT OR IGNORE INTO candidates (first_name, last_name, email, phone, created_at)
+        SELECT 'Bench' || (n % 997), 'Row' || n, 'bench_' || n || '@example.com',
+               printf('%010d', n), CURRENT_TIMESTAMP
+        FROM g
+    """,
+}
+
+RESUME_SQL = """
+    INSERT INTO resumes (candidate_id, title, file_url, uploaded_at)
+    SELECT c.candidate_id, 'Bench Resume ' || {slot}, 'http://example.com/bench/' || c.candidate_id || '_' || {slot} || '.pdf',
+           CURRENT_TIMESTAMP
+    FROM candidates c
+    WHERE c.email LIKE :pattern
+      AND (SELECT count(*) FROM resumes r WHERE r.candidate_id = c.candidate_id) < {slot}
+"""
+
+
+def seed_candidates(count: int, resumes_per_candidate: int = 0, batch: int = 500_000) -> None:
+    """Ensure ``count`` benchmark candidates (and optionally resumes) exist."""
+    Base.metadata.create_all(bind=engine)
+    dialect = engine.dialect.name
+    if dialect not in CANDIDATE_SQL:
+        raise RuntimeError(f"Benchmark seeding is not implemented for '{dialect}'")
+
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        existing = conn.execute(
+            text("SELECT count(*) FROM candidates WHERE email LIKE :pattern"),
+            {"pattern": BENCH_EMAIL_PATTERN},
+        ).scalar()
+    for start in range(existing + 1, count + 1, batch):
+        stop = min(start + batch - 1, count)
+        with engine.begin() as conn:
+            conn.execute(text(CANDIDATE_SQL[dialect]), {"start": start, "stop": stop})
+        print(f"  seeded candidates {start}..{stop}")
+
+    for slot in range(1, resumes_per_candidate + 1):
+        with engine.begin() as conn:
+            conn.execute(text(RESUME_SQL.format(slot=slot)), {"pattern": BENCH_EMAIL_PATTERN})
+
+    with engine.begin() as conn:
+        if dialect == "postgresql":
+            conn.execute(text("ANALYZE candidates"))
+            conn.execute(text("ANALYZE resumes"))
+    print(f"Seeding finished in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,468 @@
+"""
+Throughput and latency of every API route, with a baseline regression check.
+
+Seeds a realistic data set through the ORM models (candidates with 0-4
+resumes each, a share of near-duplicate people, duplicate detection run on
+top), starts the API in a subprocess and drives each route of
+``app/routers`` for ``--duration`` seconds at every ``--concurrency`` level,
+then a weighted read-heavy mix of routes. Each result has RPS, p50/p95/p99
+latency and the DB statements per request, taken from the server's own
+``/metrics`` histograms.
+
+The report is JSON (stdout, or ``--output``). With ``--baseline`` each result is
+compared to the stored one and the run fails (exit code 1) when RPS drops, or
+p95/p99 grow, by more than ``--threshold``, or a route needs more statements
+per request. ``--save-baseline`` stores the report as the new baseline.
+
+Works against whatever ``DATABASE_URL`` points at (local PostgreSQL or SQLite).
+
+Usage:
+    python -m benchmarks.suite --candidates 100000 --concurrency 1 16 64 --duration 10
+    python -m benchmarks.suite --routes "GET /candidates" --baseline benchmarks/baseline.json
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import asyncio
+import bisect
+import json
+import platform
+import random
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import httpx
+from sqlalchemy import func, insert, select
+
+from app.core.database import Base, engine
+from app.core.pagination import encode_cursor
+from app.models import Candidate, Resume
+from app.routers import candidates as candidates_router, resumes as resumes_router
+from benchmarks.load import drive, run_server
+
+SUITE_DOMAIN = "suite.example.com"
+SCRATCH_DOMAIN = "suite-scratch.example.com"
+
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David",
+               "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas",
+               "Sarah", "Charles", "Karen", "Priya", "Wei", "Fatima", "Olga", "Kenji", "Aisha"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+              "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor",
+              "Moore", "Jackson", "Martin", "Patel", "Nguyen", "Kim", "Okafor", "Novak", "Tanaka"]
+TITLES = ["Software Engineer", "Senior Data Scientist", "Product Manager", "DevOps Engineer",
+          "Backend Developer", "Frontend Developer", "QA Analyst", "Engineering Manager", "UX Designer"]
+PHONE_FORMATS = ["{a}{b}{c}", "{a}-{b}-{c}", "({a}) {b}-{c}", "+1 {a} {b} {c}", "{a}.{b}.{c}"]
+SEARCH_TERMS = ["smith", "jon", "patel", "garcia", "mary", "555", "nguyen", "tanaka", "okafor", "jessica"]
+TEXT_TERMS = ["python", "kubernetes", "sql", "react", "leadership", "aws"]
+
+# Default weights of the mixed run: mostly reads, some writes
+DEFAULT_MIX = {
+    "GET /candidates/{candidate_id}": 35,
+    "GET /candidates/": 20,
+    "GET /candidates/search": 10,
+    "GET /resumes/{resume_id}": 15,
+    "GET /resumes/": 5,
+    "GET /candidates/{candidate_id}/possible-duplicates": 3,
+    "POST /candidates/": 4,
+    "PUT /candidates/{candidate_id}": 4,
+    "POST /resumes/": 4,
+}
+
+
+def _phone(rng: random.Random) -> str:
+    digits = f"{rng.randrange(200, 999)}{rng.randrange(10**7):07d}"
+    return rng.choice(PHONE_FORMATS).format(a=digits[:3], b=digits[3:6], c=digits[6:])
+
+
+def _typo(value: str, rng: random.Random) -> str:
+    if len(value) < 3:
+        return value
+    i = rng.randrange(1, len(value) - 1)
+    return value[:i] + value[i + 1] + value[i] + value[i + 2:]
+
+
+def candidate_rows(start: int, stop: int, duplicate_rate: float, rng: random.Random) -> List[dict]:
+    rows = []
+    for n in range(start, stop):
+        if rows and rng.random() < duplicate_rate:
+            # Same person again: a typo in the name, a reformatted phone, another email
+            original = rng.choice(rows)
+            first, last = _typo(original["first_name"], rng), original["last_name"]
+            digits = re.sub(r"\D", "", original["phone"])[-10:]
+            phone = rng.choice(PHONE_FORMATS).format(a=digits[:3], b=digits[3:6], c=digits[6:])
+        else:
+            first, last, phone = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), _phone(rng)
+        rows.append({
+            "first_name": first,
+            "last_name": last,
+            "email": f"{first}.{last}.{n}@{SUITE_DOMAIN}".lower(),
+            "phone": phone,
+        })
+    return rows
+
+
+def resume_rows(candidate_ids: List[int], average: float, rng: random.Random) -> List[dict]:
+    rows = []
+    for candidate_id in candidate_ids:
+        for slot in range(rng.randint(0, round(average * 2))):
+            title = rng.choice(TITLES)
+            rows.append({
+                "candidate_id": candidate_id,
+                "title": f"{title} CV {slot + 1}",
+                "file_url": f"https://files.example.com/{candidate_id}/{slot}.pdf",
+            })
+    return rows
+
+
+def seed(count: int, resumes_per_candidate: float, duplicate_rate: float, batch: int = 5000) -> bool:
+    """Ensure ``count`` suite candidates (with resumes) exist; True when rows were added."""
+    Base.metadata.create_all(bind=engine)
+    with engine.connect() as conn:
+        existing = conn.execute(
+            select(func.count()).select_from(Candidate).where(Candidate.email.like(f"%@{SUITE_DOMAIN}"))
+        ).scalar()
+    rng = random.Random(existing)
+    started = time.perf_counter()
+    for start in range(existing, count, batch):
+        stop = min(start + batch, count)
+        with engine.begin() as conn:
+            ids = conn.execute(insert(Candidate).returning(Candidate.candidate_id),
+                               candidate_rows(start, stop, duplicate_rate, rng)).scalars().all()
+            resumes = resume_rows(ids, resumes_per_candidate, rng)
+            if resumes:
+                conn.execute(insert(Resume), resumes)
+        print(f"  seeded candidates {start + 1}..{stop}", file=sys.stderr)
+    if existing >= count:
+        return False
+    print(f"Seeding finished in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return True
+
+
+def scratch_candidates(count: int, tag: str) -> List[int]:
+    """Throwaway candidates for the delete scenarios (and owners of throwaway resumes)."""
+    rows = [{"first_name": "Scratch", "last_name": f"Row{n}", "email": f"{tag}.{n}@{SCRATCH_DOMAIN}"}
+            for n in range(count)]
+    with engine.begin() as conn:
+        ids = conn.execute(insert(Candidate).returning(Candidate.candidate_id), rows).scalars().all()
+    return list(ids)
+
+
+def scratch_resumes(candidate_ids: List[int], count: int) -> List[int]:
+    rows = [{"candidate_id": candidate_ids[n % len(candidate_ids)], "title": f"Scratch {n}",
+             "file_url": f"https://files.example.com/scratch/{n}.pdf"} for n in range(count)]
+    with engine.begin() as conn:
+        return list(conn.execute(insert(Resume).returning(Resume.resume_id), rows).scalars().all())
+
+
+@dataclass
+class Context:
+    """IDs the scenarios draw from, loaded once after seeding."""
+    candidate_ids: List[int]
+    resume_ids: List[int]
+    file_resume_ids: List[int] = field(default_factory=list)
+    scratch_candidate_ids: List[int] = field(default_factory=list)
+    scratch_resume_ids: List[int] = field(default_factory=list)
+    run: str = field(default_factory=lambda: f"{int(time.time())}")
+
+    @classmethod
+    def load(cls) -> "Context":
+        with engine.connect() as conn:
+            candidate_ids = conn.execute(
+                select(Candidate.candidate_id).where(Candidate.email.like(f"%@{SUITE_DOMAIN}"))
+            ).scalars().all()
+            resume_ids = conn.execute(
+                select(Resume.resume_id).join(Candidate).where(Candidate.email.like(f"%@{SUITE_DOMAIN}"))
+            ).scalars().all()
+        if not candidate_ids or not resume_ids:
+            raise RuntimeError("No seeded data; run without --no-seed first")
+        return cls(list(candidate_ids), list(resume_ids))
+
+
+def _pop(ids: List[int]) -> int:
+    # Once the scratch rows are used up, deletes hit missing IDs (404s)
+    return ids.pop() if ids else 0
+
+
+def _document(rng: random.Random, size: int = 32 * 1024) -> bytes:
+    words = [rng.choice(TEXT_TERMS + TITLES) for _ in range(size // 8)]
+    return b"%PDF-1.4\n" + " ".join(words).encode()[:size]
+
+
+def _ndjson(rows: List[dict]) -> bytes:
+    return b"".join(json.dumps(row).encode() + b"\n" for row in rows)
+
+
+# One request builder per route: (context, request number, rng) -> (method, path[, kwargs])
+Scenario = Callable[[Context, int, random.Random], tuple]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "GET /candidates/": lambda ctx, i, rng: (
+        "GET", "/candidates/", {"params": {"limit": 100, "after": encode_cursor(rng.choice(ctx.candidate_ids))}}),
+    "GET /candidates/search": lambda ctx, i, rng: (
+        "GET", "/candidates/search", {"params": {"q": rng.choice(SEARCH_TERMS)}}),
+    "GET /candidates/export": lambda ctx, i, rng: ("GET", "/candidates/export"),
+    "GET /candidates/{candidate_id}": lambda ctx, i, rng: (
+        "GET", f"/candidates/{rng.choice(ctx.candidate_ids)}"),
+    "GET /candidates/{candidate_id}/possible-duplicates": lambda ctx, i, rng: (
+        "GET", f"/candidates/{rng.choice(ctx.candidate_ids)}/possible-duplicates"),
+    "GET /resumes/": lambda ctx, i, rng: (
+        "GET", "/resumes/", {"params": {"limit": 100, "after": encode_cursor(rng.choice(ctx.resume_ids))}}),
+    "GET /resumes/search": lambda ctx, i, rng: (
+        "GET", "/resumes/search", {"params": {"q": rng.choice(TEXT_TERMS)}}),
+    "GET /resumes/export": lambda ctx, i, rng: ("GET", "/resumes/export"),
+    "GET /resumes/storage": lambda ctx, i, rng: ("GET", "/resumes/storage"),
+    "GET /resumes/{resume_id}": lambda ctx, i, rng: ("GET", f"/resumes/{rng.choice(ctx.resume_ids)}"),
+    "GET /resumes/{resume_id}/file": lambda ctx, i, rng: (
+        "GET", f"/resumes/{rng.choice(ctx.file_resume_ids)}/file"),
+    "GET /resumes/{resume_id}/text": lambda ctx, i, rng: ("GET", f"/resumes/{rng.choice(ctx.resume_ids)}/text"),
+    "POST /candidates/": lambda ctx, i, rng: ("POST", "/candidates/", {"json": {
+        "first_name": rng.choice(FIRST_NAMES), "last_name": rng.choice(LAST_NAMES),
+        "email": f"new.{ctx.run}.{i}@{SCRATCH_DOMAIN}", "phone": _phone(rng)}}),
+    "POST /candidates/bulk": lambda ctx, i, rng: ("POST", "/candidates/bulk", {"json": [
+        {"first_name": "Bulk", "last_name": f"Row{n}", "email": f"bulk.{ctx.run}.{i}.{n}@{SCRATCH_DOMAIN}"}
+        for n in range(100)]}),
+    "POST /candidates/import": lambda ctx, i, rng: (
+        "POST", "/candidates/import", {"params": {"format": "ndjson"}, "content": _ndjson([
+            {"first_name": "Import", "last_name": f"Row{n}", "email": f"import.{ctx.run}.{i}.{n}@{SCRATCH_DOMAIN}"}
+            for n in range(100)])}),
+    "PUT /candidates/{candidate_id}": lambda ctx, i, rng: (
+        "PUT", f"/candidates/{rng.choice(ctx.candidate_ids)}", {"json": {"phone": _phone(rng)}}),
+    "DELETE /candidates/{candidate_id}": lambda ctx, i, rng: (
+        "DELETE", f"/candidates/{_pop(ctx.scratch_candidate_ids)}"),
+    "POST /resumes/": lambda ctx, i, rng: ("POST", "/resumes/", {"json": {
+        "candidate_id": rng.choice(ctx.candidate_ids), "title": rng.choice(TITLES),
+        "file_url": f"https://files.example.com/new/{ctx.run}/{i}.pdf"}}),
+    "POST /resumes/import": lambda ctx, i, rng: (
+        "POST", "/resumes/import", {"params": {"format": "ndjson"}, "content": _ndjson([
+            {"candidate_id": rng.choice(ctx.candidate_ids), "title": rng.choice(TITLES),
+             "file_url": f"https://files.example.com/import/{ctx.run}/{i}/{n}.pdf"} for n in range(100)])}),
+    "POST /resumes/{resume_id}/file": lambda ctx, i, rng: (
+        "POST", f"/resumes/{rng.choice(ctx.resume_ids)}/file",
+        {"files": {"file": (f"cv-{i}.pdf", _document(rng), "application/pdf")}}),
+    "PUT /resumes/{resume_id}": lambda ctx, i, rng: (
+        "PUT", f"/resumes/{rng.choice(ctx.resume_ids)}", {"json": {"title": rng.choice(TITLES)}}),
+    "DELETE /resumes/{resume_id}": lambda ctx, i, rng: (
+        "DELETE", f"/resumes/{_pop(ctx.scratch_resume_ids)}"),
+}
+
+
+def router_routes() -> List[str]:
+    """``METHOD /path`` for every route of the API routers."""
+    routes = []
+    for prefix, router in (("/candidates", candidates_router.router), ("/resumes", resumes_router.router)):
+        for route in router.routes:
+            routes.extend(f"{method} {prefix}{route.path}" for method in sorted(route.methods))
+    return routes
+
+
+def statement_totals(client: httpx.Client) -> Dict[tuple, List[float]]:
+    """``(method, route) -> [statements sum, request count]`` from the server's /metrics."""
+    totals: Dict[tuple, List[float]] = {}
+    pattern = re.compile(r'^http_request_db_statements_(sum|count)\{method="([^"]+)",route="([^"]+)"\} (\S+)$')
+    for line in client.get("/metrics").text.splitlines():
+        match = pattern.match(line)
+        if match:
+            kind, method, route, value = match.groups()
+            totals.setdefault((method, route), [0.0, 0.0])[kind == "count"] = float(value)
+    return totals
+
+
+def statements_per_request(before: dict, after: dict, keys: Optional[set] = None) -> Optional[float]:
+    statements = requests = 0.0
+    for key, (total, count) in after.items():
+        # The /metrics scrapes themselves are not part of the workload
+        if (keys is not None and key not in keys) or key[1] == "/metrics":
+            continue
+        previous = before.get(key, [0.0, 0.0])
+        statements += total - previous[0]
+        requests += count - previous[1]
+    return round(statements / requests, 2) if requests else None
+
+
+def prepare(ctx: Context, name: str, base_url: str, rng: random.Random, scratch: int) -> None:
+    """Create what a write scenario consumes, outside the measured window."""
+    if name == "DELETE /candidates/{candidate_id}":
+        ctx.scratch_candidate_ids = scratch_candidates(scratch, f"del.{ctx.run}.{rng.random():.6f}")
+    elif name == "DELETE /resumes/{resume_id}":
+        owners = scratch_candidates(max(1, scratch // 10), f"own.{ctx.run}.{rng.random():.6f}")
+        ctx.scratch_resume_ids = scratch_resumes(owners, scratch)
+    elif name == "GET /resumes/{resume_id}/file" and not ctx.file_resume_ids:
+        with httpx.Client(base_url=base_url, timeout=60.0) as client:
+            for resume_id in rng.sample(ctx.resume_ids, min(100, len(ctx.resume_ids))):
+                response = client.post(f"/resumes/{resume_id}/file",
+                                       files={"file": ("cv.pdf", _document(rng), "application/pdf")})
+                if response.status_code == 200:
+                    ctx.file_resume_ids.append(resume_id)
+
+
+def measure(base_url: str, make_request: Callable[[int], tuple], routes: Optional[set],
+            concurrency: int, duration: float, warmup: float) -> dict:
+    with httpx.Client(base_url=base_url, timeout=30.0) as client:
+        before = statement_totals(client)
+        result = asyncio.run(drive(base_url, make_request, concurrency, duration, warmup))
+        after = statement_totals(client)
+    result["db_statements_per_request"] = statements_per_request(before, after, routes)
+    result["concurrency"] = concurrency
+    return result
+
+
+def run_scenarios(base_url: str, ctx: Context, names: List[str], mix: Dict[str, int], args) -> dict:
+    results = {}
+    for name in names:
+        method, route = name.split(" ", 1)
+        for concurrency in args.concurrency:
+            rng = random.Random(f"{name}@{concurrency}")
+            prepare(ctx, name, base_url, rng, args.scratch)
+            scenario = SCENARIOS[name]
+            results[f"{name} @{concurrency}"] = measure(
+                base_url, lambda i: scenario(ctx, i, rng), {(method, route)},
+                concurrency, args.duration, args.warmup,
+            )
+            print(f"  {name} @{concurrency}: {results[f'{name} @{concurrency}']['rps']} rps", file=sys.stderr)
+
+    if mix:
+        names_in_mix = list(mix)
+        cumulative = []
+        total = 0
+        for name in names_in_mix:
+            total += mix[name]
+            cumulative.append(total)
+
+        def make_mixed(i: int) -> tuple:
+            rng = random.Random(i)
+            name = names_in_mix[bisect.bisect_right(cumulative, rng.randrange(total))]
+            return SCENARIOS[name](ctx, i, rng)
+
+        for concurrency in args.concurrency:
+            results[f"mix @{concurrency}"] = measure(base_url, make_mixed, None,
+                                                     concurrency, args.duration, args.warmup)
+            print(f"  mix @{concurrency}: {results[f'mix @{concurrency}']['rps']} rps", file=sys.stderr)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[dict]:
+    """Results that regressed against ``baseline`` beyond ``threshold`` (a fraction)."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if previous is None:
+            continue
+        problems = []
+        if previous["rps"] and current["rps"] < previous["rps"] * (1 - threshold):
+            problems.append(f"rps {previous['rps']} -> {current['rps']}")
+        for metric in ("p95_ms", "p99_ms"):
+            if previous[metric] and current[metric] > previous[metric] * (1 + threshold):
+                problems.append(f"{metric} {previous[metric]} -> {current[metric]}")
+        before, after = previous.get("db_statements_per_request"), current.get("db_statements_per_request")
+        # Statement counts are deterministic; allow for rounding and mixed-route sampling noise
+        if before is not None and after is not None and after > before + 0.5:
+            problems.append(f"db_statements_per_request {before} -> {after}")
+        if problems:
+            regressions.append({"result": key, "problems": problems})
+    return regressions
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """``"GET /candidates/=5,POST /candidates/=1"`` -> weights."""
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.rpartition("=")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=100_000, help="Seeded candidates")
+    parser.add_argument("--resumes-per-candidate", type=float, default=2.0, help="Average (0 to 2x per candidate)")
+    parser.add_argument("--duplicate-rate", type=float, default=0.02, help="Share of near-duplicate candidates")
+    parser.add_argument("--no-seed", action="store_true", help="Use the data already in the database")
+    parser.add_argument("--routes", nargs="*", default=None,
+                        help="Only routes containing one of these substrings (e.g. 'GET /candidates')")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16], help="Client counts per route")
+    parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds per route and level")
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help='Weighted mixed run, e.g. "GET /candidates/{candidate_id}=8,POST /candidates/=1"')
+    parser.add_argument("--no-mix", action="store_true")
+    parser.add_argument("--scratch", type=int, default=20_000, help="Rows created for each delete scenario")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="Compare against this stored report")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed relative regression")
+    parser.add_argument("--save-baseline", help="Also store this run's report as a baseline here")
+    args = parser.parse_args()
+
+    unknown = [name for name in list(args.mix) if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown routes in --mix: {', '.join(unknown)}")
+    names = [name for name in SCENARIOS
+             if not args.routes or any(fragment in name for fragment in args.routes)]
+    # Reads first; writes change the data, and deletes go last
+    names.sort(key=lambda name: (not name.startswith("GET"), name.startswith("DELETE")))
+
+    if not args.no_seed and seed(args.candidates, args.resumes_per_candidate, args.duplicate_rate):
+        from scripts.find_duplicates import run as find_duplicates
+        find_duplicates()
+    ctx = Context.load()
+
+    with run_server(port=args.port, workers=args.workers, stdout=subprocess.DEVNULL) as base_url:
+        results = run_scenarios(base_url, ctx, names, {} if args.no_mix else args.mix, args)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "commit": git_commit(),
+            "dialect": engine.dialect.name,
+            "python": platform.python_version(),
+            "candidates": len(ctx.candidate_ids),
+            "resumes": len(ctx.resume_ids),
+            "duration": args.duration,
+            "workers": args.workers,
+        },
+        "results": results,
+        "unbenchmarked_routes": [route for route in router_routes() if route not in SCENARIOS],
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(results, baseline, args.threshold)
+        report["comparison"] = {
+            "baseline": args.baseline,
+            "baseline_commit": baseline.get("meta", {}).get("commit"),
+            "threshold": args.threshold,
+            "regressions": regressions,
+        }
+        if baseline.get("meta", {}).get("dialect") != engine.dialect.name:
+            report["comparison"]["warning"] = "Baseline was recorded against a different database"
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as baseline_file:
+            baseline_file.write(text + "\n")
+    if regressions:
+        print(f"{len(regressions)} result(s) regressed beyond {args.threshold:.0%}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
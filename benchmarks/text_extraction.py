@@ -0,0 +1,151 @@
+"""
+Measure resume text-extraction throughput as the process pool grows.
+
+Writes a mix of PDF, DOCX and TXT resumes to a temp directory, points resumes
+at them, then extracts everything with 1, 2, 4, ... workers up to the core
+count and reports files/sec for each pool size. Parsing is CPU-bound, so
+throughput should scale close to linearly with the number of cores.
+
+Usage:
+    python -m benchmarks.text_extraction --files 2000 --pages 5
+"""
+import argparse
+import io
+import json
+import os
+import random
+import tempfile
+import zipfile
+
+from sqlalchemy import delete, insert, select
+
+from app.core.config import settings
+from app.core.database import Base, SessionLocal, engine
+from app.crud.extraction import extract_pending, extraction_pool
+from app.models import Candidate, Resume, ResumeText
+
+WORDS = ("python engineer data sql fastapi backend cloud lead team design api "
+         "postgres kubernetes testing product analytics mentor delivery").split()
+
+
+def paragraph(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def make_pdf(lines_per_page: list) -> bytes:
+    """Minimal PDF with one Helvetica text page per entry of ``lines_per_page``."""
+    page_count = len(lines_per_page)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (b" ".join(b"%d 0 R" % (3 + 2 * n) for n in range(page_count)), page_count),
+    ]
+    for n, lines in enumerate(lines_per_page):
+        text = " T* ".join(f"({line}) Tj" for line in lines)
+        content = f"BT /F1 10 Tf 12 TL 40 760 Td {text} ET".encode()
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+                       b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (4 + 2 * n, font_id))
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = io.BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx(paragraphs: list) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{p}</w:t></w:r></w:p>" for p in paragraphs)
+    document = ('<?xml version="1.0" encoding="UTF-8"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                f"<w:body>{body}</w:body></w:document>")
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def write_files(directory: str, count: int, pages: int, rng: random.Random) -> list:
+    paths = []
+    for n in range(count):
+        lines = [[paragraph(rng) for _ in range(50)] for _ in range(pages)]
+        kind = ("pdf", "docx", "txt")[n % 3]
+        if kind == "pdf":
+            content = make_pdf(lines)
+        elif kind == "docx":
+            content = make_docx([line for page in lines for line in page])
+        else:
+            content = "\n".join(line for page in lines for line in page).encode()
+        path = os.path.join(directory, f"resume_{n}.{kind}")
+        with open(path, "wb") as f:
+            f.write(content)
+        paths.append(path)
+    return paths
+
+
+def create_resumes(paths: list) -> list:
+    with engine.begin() as conn:
+        candidate_id = conn.execute(
+            insert(Candidate).values(first_name="Extract", last_name="Bench",
+                                     email=f"extract_{os.getpid()}_{random.random()}@example.com")
+            .returning(Candidate.candidate_id)
+        ).scalar_one()
+        conn.execute(insert(Resume), [
+            {"candidate_id": candidate_id, "title": "Extraction bench", "file_url": path} for path in paths
+        ])
+        return conn.execute(select(Resume.resume_id).where(Resume.candidate_id == candidate_id)).scalars().all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        help="Pool sizes to try (default: powers of two up to the core count)")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({min(2 ** n, cores) for n in range(cores.bit_length() + 1)})
+    Base.metadata.create_all(bind=engine)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        settings.TEXT_EXTRACTION_LOCAL_ROOT = workdir
+        paths = write_files(workdir, args.files, args.pages, random.Random(7))
+        resume_ids = create_resumes(paths)
+        # Clear any unrelated backlog so each run times only the benchmark files
+        with extraction_pool() as pool:
+            db = SessionLocal()
+            try:
+                extract_pending(db, pool, batch_size=args.batch_size)
+            finally:
+                db.close()
+        for workers in worker_counts:
+            with engine.begin() as conn:
+                conn.execute(delete(ResumeText).where(ResumeText.resume_id.in_(resume_ids)))
+            with extraction_pool(workers) as pool:
+                db = SessionLocal()
+                try:
+                    report = extract_pending(db, pool, batch_size=args.batch_size)
+                finally:
+                    db.close()
+            results[workers] = report.to_dict()
+
+    print(json.dumps({"cores": cores, "files": args.files, "pages": args.pages, "runs": results}, indent=2))
+    print(f"\n{'workers':>8} {'files/sec':>12} {'speedup':>8}")
+    base = results[worker_counts[0]]["files_per_sec"] or 1
+    for workers, report in results.items():
+        print(f"{workers:>8} {report['files_per_sec']:>12} {report['files_per_sec'] / base:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Initial schema: candidates and resumes.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "candidates",
+        sa.Column("candidate_id", sa.Integer(), primary_key=True),
+        sa.Column("first_name", sa.String(), nullable=False),
+        sa.Column("last_name", sa.String(), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("phone", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_candidates_candidate_id", "candidates", ["candidate_id"])
+    op.create_index("ix_candidates_email", "candidates", ["email"], unique=True)
+
+    op.create_table(
+        "resumes",
+        sa.Column("resume_id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "candidate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.candidate_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("file_url", sa.String(), nullable=False),
+        sa.Column("uploaded_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_resumes_resume_id", "resumes", ["resume_id"])
+
+
+def downgrade():
+    op.drop_table("resumes")
+    op.drop_table("candidates")
@@ -0,0 +1,36 @@
+"""Add pg_trgm GIN indexes for candidate search (PostgreSQL only).
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_candidates_first_name_trgm": "(first_name gin_trgm_ops)",
+    "ix_candidates_last_name_trgm": "(last_name gin_trgm_ops)",
+    "ix_candidates_email_trgm": "(email gin_trgm_ops)",
+    "ix_candidates_full_name_trgm": "((first_name || ' ' || last_name) gin_trgm_ops)",
+    "ix_candidates_phone_digits_trgm": "((regexp_replace(phone, '[^0-9]', '', 'g')) gin_trgm_ops)",
+}
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, expression in INDEXES.items():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON candidates USING gin {expression}")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for name in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
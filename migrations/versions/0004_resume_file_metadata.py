@@ -0,0 +1,26 @@
+"""Add resume file metadata for uploads to the blob store.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("resumes", sa.Column("file_name", sa.String(), nullable=True))
+    op.add_column("resumes", sa.Column("content_type", sa.String(), nullable=True))
+    op.add_column("resumes", sa.Column("file_size", sa.BigInteger(), nullable=True))
+
+
+def downgrade():
+    op.drop_column("resumes", "file_size")
+    op.drop_column("resumes", "content_type")
+    op.drop_column("resumes", "file_name")
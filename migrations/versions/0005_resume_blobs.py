@@ -0,0 +1,54 @@
+"""Deduplicate resume files by content hash.
+
+Adds the resume_blobs table (one row per distinct stored file) and
+resumes.content_hash, backfilled from blob:// file URLs.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+# len("blob://sha256/") + 1
+DIGEST_OFFSET = 15
+
+
+def upgrade():
+    op.create_table(
+        "resume_blobs",
+        sa.Column("digest", sa.String(64), primary_key=True),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("content_type", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    with op.batch_alter_table("resumes") as batch_op:
+        batch_op.add_column(sa.Column("content_hash", sa.String(64), nullable=True))
+        batch_op.create_foreign_key("fk_resumes_content_hash", "resume_blobs", ["content_hash"], ["digest"])
+        batch_op.create_index("ix_resumes_content_hash", ["content_hash"])
+
+    op.execute(f"""
+        INSERT INTO resume_blobs (digest, size, content_type)
+        SELECT substr(file_url, {DIGEST_OFFSET}), max(coalesce(file_size, 0)), max(content_type)
+        FROM resumes
+        WHERE file_url LIKE 'blob://sha256/%'
+        GROUP BY substr(file_url, {DIGEST_OFFSET})
+    """)
+    op.execute(f"""
+        UPDATE resumes SET content_hash = substr(file_url, {DIGEST_OFFSET})
+        WHERE file_url LIKE 'blob://sha256/%'
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table("resumes") as batch_op:
+        batch_op.drop_index("ix_resumes_content_hash")
+        batch_op.drop_constraint("fk_resumes_content_hash", type_="foreignkey")
+        batch_op.drop_column("content_hash")
+    op.drop_table("resume_blobs")
@@ -0,0 +1,37 @@
+"""Add resume_texts for extracted resume text.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "resume_texts",
+        sa.Column(
+            "resume_id",
+            sa.Integer(),
+            sa.ForeignKey("resumes.resume_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("source", sa.String(), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("char_count", sa.Integer(), nullable=True),
+        sa.Column("error", sa.String(), nullable=True),
+        sa.Column("extracted_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_resume_texts_source", "resume_texts", ["source"])
+
+
+def downgrade():
+    op.drop_table("resume_texts")
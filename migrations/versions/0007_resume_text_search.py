@@ -0,0 +1,30 @@
+"""Add a GIN-indexed tsvector over resume text for keyword search (PostgreSQL only).
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17
+"""
+from alembic import op
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(
+        "ALTER TABLE resume_texts ADD COLUMN IF NOT EXISTS search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english'::regconfig, coalesce(text, ''))) STORED"
+    )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_resume_texts_search_vector ON resume_texts USING gin (search_vector)")
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_resume_texts_search_vector")
+    op.execute("ALTER TABLE resume_texts DROP COLUMN IF EXISTS search_vector")
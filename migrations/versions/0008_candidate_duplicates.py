@@ -0,0 +1,40 @@
+"""Add candidate_duplicates for the fuzzy duplicate-detection job.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "candidate_duplicates",
+        sa.Column(
+            "candidate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.candidate_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "duplicate_id",
+            sa.Integer(),
+            sa.ForeignKey("candidates.candidate_id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("score", sa.Float(), nullable=False),
+        sa.Column("reasons", sa.String(), nullable=False, server_default=""),
+        sa.Column("detected_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_candidate_duplicates_duplicate_id", "candidate_duplicates", ["duplicate_id"])
+
+
+def downgrade():
+    op.drop_table("candidate_duplicates")
@@ -1,4 +1,8 @@
-"""Script to create database tables."""
+"""Script to create database tables and bring the schema up to date."""
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
 from app.core.database import Base, engine
 from app.core.logger import logger
 
@@ -6,14 +10,32 @@ from app.core.logger import logger
 from app.models.candidate import Candidate
 from app.models.resume import Resume
 
+# Revision matching the tables created before migrations were introduced
+PRE_MIGRATIONS_REVISION = "0001"
+
 def create_tables():
-    """Create all database tables."""
+    """
+    Create all database tables.
+
+    A fresh database is created from the models and stamped at the latest
+    migration; an existing one is migrated to it (databases created before
+    migrations existed are first stamped at the initial revision).
+    """
     try:
-        Base.metadata.create_all(bind=engine)
+        config = Config("alembic.ini")
+        existing = set(inspect(engine).get_table_names())
+        if "alembic_version" in existing:
+            command.upgrade(config, "head")
+        elif "candidates" in existing:
+            command.stamp(config, PRE_MIGRATIONS_REVISION)
+            command.upgrade(config, "head")
+        else:
+            Base.metadata.create_all(bind=engine)
+            command.stamp(config, "head")
         logger.info("Tables created successfully!")
         print("Tables created successfully!")
     except Exception as e:
-        logger.error(f"Error creating tables: {str(e)}")
+        logger.error("Error creating tables: %s", e)
         print(f"Error creating tables: {str(e)}")
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""
+Extract plain text from resume files into the resume_texts table.
+
+Only resumes that were never extracted, or whose file changed since, are
+processed. Parsing runs in a process pool (one worker per core by default), so
+it never competes with the API's event loop or request threadpool; identical
+content (same content_hash) is parsed once.
+
+Examples:
+    python -m scripts.extract_text
+    python -m scripts.extract_text --workers 8 --watch 30
+"""
+import argparse
+import time
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.crud.extraction import extract_pending, extraction_pool
+
+def run(workers=None, batch_size=200, watch=None):
+    """Process pending resumes once, or every ``watch`` seconds until interrupted."""
+    with extraction_pool(workers) as pool:
+        while True:
+            db = SessionLocal()
+            try:
+                summary = extract_pending(db, pool, batch_size=batch_size).to_dict()
+            except Exception as e:
+                logger.error("Text extraction failed: %s", e)
+                raise
+            finally:
+                db.close()
+            if summary["processed"] or not watch:
+                print(
+                    f"Extracted {summary['processed']} resumes ({summary['reused']} reused) "
+                    f"in {summary['seconds']}s ({summary['files_per_sec']} files/sec): {summary['statuses']}"
+                )
+            if not watch:
+                return summary
+            time.sleep(watch)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract text from pending resume files")
+    parser.add_argument("--workers", type=int, default=settings.TEXT_EXTRACTION_WORKERS or None,
+                        help="Process pool size (default: one per core)")
+    parser.add_argument("--batch-size", type=int, default=settings.TEXT_EXTRACTION_BATCH_SIZE)
+    parser.add_argument("--watch", type=float, help="Keep polling for new resumes every N seconds")
+    args = parser.parse_args()
+    try:
+        run(args.workers, args.batch_size, args.watch)
+    except KeyboardInterrupt:
+        pass
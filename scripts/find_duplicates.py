@@ -0,0 +1,39 @@
+"""
+Find likely duplicate candidates and store them for /candidates/{id}/possible-duplicates.
+
+Candidates are only compared when they share a blocking key (normalized phone,
+phonetic last name + first initial, or email mailbox name), and each block is
+scored in one vectorized pass, so a full run stays in the minutes range for
+millions of candidates. Each run replaces the previous results.
+
+Examples:
+    python -m scripts.find_duplicates
+    python -m scripts.find_duplicates --threshold 0.85
+"""
+import argparse
+
+from app.core.database import SessionLocal
+from app.core.logger import logger
+from app.crud.duplicates import detect_duplicates
+
+def run(threshold=0.8):
+    db = SessionLocal()
+    try:
+        report = detect_duplicates(db, threshold=threshold)
+    except Exception as e:
+        logger.error("Duplicate detection failed: %s", e)
+        raise
+    finally:
+        db.close()
+    print(
+        f"Scored {report['candidates']} candidates in {report['seconds']}s "
+        f"(load {report['load_seconds']}s, scoring {report['score_seconds']}s): "
+        f"{report['pairs']} possible duplicate pairs"
+    )
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find likely duplicate candidates")
+    parser.add_argument("--threshold", type=float, default=0.8, help="Minimum pair score (0-1) to keep")
+    args = parser.parse_args()
+    run(args.threshold)
@@ -0,0 +1,66 @@
+"""
+Script to bulk import candidates or resumes from a CSV or NDJSON file.
+
+The file is read lazily and processed in chunks (validate, stage, merge, commit),
+so memory use depends on --chunk-size, not on the size of the file.
+
+Examples:
+    python -m scripts.import_data candidates candidates.csv --errors rejected.csv
+    python -m scripts.import_data resumes resumes.ndjson --chunk-size 10000
+"""
+import argparse
+import csv
+import json
+from pathlib import Path
+
+from app.core.logger import logger
+from app.crud.importer import IMPORTERS, import_stream
+
+def import_file(kind, path, fmt=None, chunk_size=5000, errors_path=None, on_conflict="skip"):
+    """Import ``path`` and write rejected rows to ``errors_path`` (CSV) if given."""
+    path = Path(path)
+    fmt = fmt or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+    options = {"on_conflict": on_conflict} if kind == "candidates" else {}
+
+    error_file = open(errors_path, "w", newline="") if errors_path else None
+    error_writer = csv.writer(error_file) if error_file else None
+    if error_writer:
+        error_writer.writerow(["line", "reason", "record"])
+
+    def on_reject(line_no, reason, record):
+        if error_writer:
+            error_writer.writerow([line_no, reason, json.dumps(record, default=str) if record else ""])
+
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as stream:
+            report = import_stream(kind, stream, fmt, chunk_size, on_reject, **options)
+    except Exception as e:
+        logger.error("Error importing %s: %s", path, e)
+        print(f"Error importing {path}: {str(e)}")
+        raise
+    finally:
+        if error_file:
+            error_file.close()
+
+    summary = report.to_dict()
+    print(
+        f"Imported {kind} from {path}: {summary['created']} created, {summary['updated']} updated, "
+        f"{summary['rejected']} rejected of {summary['received']} rows "
+        f"in {summary['seconds']}s ({summary['rows_per_sec']} rows/sec)"
+    )
+    if errors_path and summary["rejected"]:
+        print(f"Rejected rows written to {errors_path}")
+    return summary
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import candidates or resumes from CSV/NDJSON")
+    parser.add_argument("kind", choices=sorted(IMPORTERS))
+    parser.add_argument("path", help="CSV (with header) or NDJSON file")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--errors", dest="errors_path", help="Write rejected rows to this CSV file")
+    parser.add_argument("--on-conflict", choices=["skip", "update"], default="skip",
+                        help="What to do with candidates whose email already exists")
+
+    args = parser.parse_args()
+    import_file(args.kind, args.path, args.format, args.chunk_size, args.errors_path, args.on_conflict)
@@ -10,7 +10,7 @@ def seed_data():
         db = SessionLocal()
         
         # Check if data already exists
-        if db.query(Candidate).count() > 0:
+        if db.query(Candidate.candidate_id).limit(1).first() is not None:
             logger.warning("Database already contains data. Seeding skipped.")
             print("Database already contains data. Seeding skipped.")
             return
@@ -71,7 +71,7 @@ def seed_data():
         print("Database seeded successfully!")
         
     except Exception as e:
-        logger.error(f"Error seeding database: {str(e)}")
+        logger.error("Error seeding database: %s", e)
         print(f"Error seeding database: {str(e)}")
     finally:
         db.close()
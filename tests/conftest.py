@@ -0,0 +1,37 @@
+"""Shared test fixtures."""
+import pytest
+from sqlalchemy import event
+
+from app.core import database
+
+
+class QueryCounter:
+    """Collects every SQL statement sent to the database while attached."""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+
+
+@pytest.fixture
+def query_counter():
+    """Count statements executed through SQLAlchemy via ``before_cursor_execute``."""
+    engines = [database.engine]
+    if database.async_engine is not None:
+        engines.append(database.async_engine.sync_engine)
+
+    counter = QueryCounter()
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    for engine in engines:
+        event.remove(engine, "before_cursor_execute", counter)
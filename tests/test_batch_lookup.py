@@ -0,0 +1,69 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+
+client = TestClient(app)
+
+MISSING_ID = 2_000_000_000
+
+def create_candidates(count: int) -> list[int]:
+    token = uuid.uuid4().hex[:8]
+    ids = []
+    for n in range(count):
+        candidate_id = client.post("/candidates/", json={
+            "first_name": "Batch", "last_name": f"Lookup{n}", "email": f"batch_{token}_{n}@example.com"
+        }).json()["candidate_id"]
+        client.post("/resumes/", json={
+            "candidate_id": candidate_id, "title": f"CV {n}", "file_url": f"http://example.com/{token}_{n}.pdf"
+        })
+        ids.append(candidate_id)
+    return ids
+
+def test_lookup_keeps_request_order_and_marks_missing(query_counter):
+    first, second, third = create_candidates(3)
+    requested = [third, MISSING_ID, first, second, first]
+    query_counter.reset()
+    response = client.get("/candidates/", params={"ids": ",".join(map(str, requested))})
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["candidate_id"] for item in body] == requested
+    assert body[1] == {"candidate_id": MISSING_ID, "not_found": True}
+    assert body[0]["last_name"] == "Lookup2" and body[0]["resumes"][0]["title"] == "CV 2"
+    assert body[4] == body[2]
+    # One candidate query and one batched resume query, whatever the number of IDs
+    selects = [s for s in query_counter.statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 2
+    assert "ETag" in response.headers and "X-Next-Cursor" not in response.headers
+
+def test_lookup_with_fields_and_repeated_params():
+    first, _ = create_candidates(2)
+    response = client.get(f"/candidates/?ids={first}&ids={MISSING_ID}&fields=last_name")
+    assert response.json() == [
+        {"last_name": "Lookup0", "candidate_id": first},
+        {"candidate_id": MISSING_ID, "not_found": True},
+    ]
+
+def test_lookup_rejects_bad_requests(monkeypatch):
+    assert client.get("/candidates/", params={"ids": "1,two"}).status_code == 400
+    response = client.get("/candidates/", params={"ids": "1", "limit": 10})
+    assert response.status_code == 400
+    assert "limit" in response.json()["detail"]
+    monkeypatch.setattr(settings, "BATCH_MAX_IDS", 3)
+    assert client.get("/candidates/", params={"ids": "1,2,3,4"}).status_code == 400
+    assert client.get("/candidates/", params={"ids": ""}).json() == []
+
+def test_resume_lookup():
+    candidate_id = create_candidates(1)[0]
+    resume_id = client.get(f"/candidates/{candidate_id}").json()["resumes"][0]["resume_id"]
+    body = client.get("/resumes/", params={"ids": f"{MISSING_ID},{resume_id}"}).json()
+    assert body[0] == {"resume_id": MISSING_ID, "not_found": True}
+    assert body[1]["resume_id"] == resume_id and body[1]["candidate_id"] == candidate_id
+
+def test_openapi_describes_not_found_markers():
+    paths = client.get("/openapi.json").json()["paths"]
+    items = paths["/candidates/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["items"]
+    assert {"$ref": "#/components/schemas/CandidateNotFound"} in items["anyOf"]
+    assert any(param["name"] == "ids" for param in paths["/resumes/"]["get"]["parameters"])
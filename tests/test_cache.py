@@ -0,0 +1,74 @@
+import uuid
+from fastapi.testclient import TestClient
+
+from app.core.cache import TTLCache
+from app.main import app
+
+client = TestClient(app)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_lru_eviction():
+    cache = TTLCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" becomes most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_expiry():
+    clock = FakeClock()
+    cache = TTLCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+def test_invalidation_fences_in_flight_loads():
+    cache = TTLCache(max_entries=10, ttl_seconds=60)
+    generation = cache.generation
+    cache.invalidate("a")  # a write lands while the read is loading
+    cache.set("a", "stale", generation)
+    assert cache.get("a") is None
+
+def test_candidate_reads_are_cached_and_invalidated_by_resume_writes():
+    email = f"cache_{uuid.uuid4().hex[:8]}@example.com"
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Cache",
+        "last_name": "Me",
+        "email": email
+    }).json()["candidate_id"]
+
+    assert client.get(f"/candidates/{candidate_id}").json()["resumes"] == []
+    hits_before = client.get("/health/cache").json()["hits"]
+    assert client.get(f"/candidates/{candidate_id}").status_code == 200
+    assert client.get("/health/cache").json()["hits"] == hits_before + 1
+
+    resume_id = client.post("/resumes/", json={
+        "candidate_id": candidate_id,
+        "title": "Cached Resume",
+        "file_url": "http://example.com/cached.pdf"
+    }).json()["resume_id"]
+    resumes = client.get(f"/candidates/{candidate_id}").json()["resumes"]
+    assert [r["resume_id"] for r in resumes] == [resume_id]
+
+    client.put(f"/resumes/{resume_id}", json={"title": "Renamed"})
+    assert client.get(f"/resumes/{resume_id}").json()["title"] == "Renamed"
+    assert client.get(f"/candidates/{candidate_id}").json()["resumes"][0]["title"] == "Renamed"
+
+    client.delete(f"/resumes/{resume_id}")
+    assert client.get(f"/resumes/{resume_id}").status_code == 404
+    assert client.get(f"/candidates/{candidate_id}").json()["resumes"] == []
@@ -152,3 +152,156 @@ def test_update_candidate_duplicate_email():
     response_data = update_response.json()
     assert "message" in response_data
     assert response_data["message"] == "Email already registered."
+
+def test_update_candidate_skips_the_read(query_counter):
+    """An update is one UPDATE ... RETURNING plus one batched resume query."""
+    import uuid
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Single",
+        "last_name": "Statement",
+        "email": f"single_update_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()["candidate_id"]
+    client.post("/resumes/", json={
+        "candidate_id": candidate_id, "title": "Kept Resume", "file_url": "http://example.com/kept.pdf"
+    })
+
+    query_counter.reset()
+    response = client.put(f"/candidates/{candidate_id}", json={"first_name": "Changed"})
+    assert response.status_code == 200
+    assert response.json()["resumes"][0]["title"] == "Kept Resume"
+    statements = [s.lstrip().split()[0].upper() for s in query_counter.statements]
+    assert statements.count("UPDATE") == 1
+    assert statements.count("SELECT") == 1
+
+    assert client.put(f"/candidates/{candidate_id}", json={}).json()["first_name"] == "Changed"
+
+def test_list_candidates_query_count_is_constant(query_counter):
+    """Listing candidates must not lazy-load resumes once per row (N+1)."""
+    import uuid
+    for n in range(3):
+        candidate_response = client.post("/candidates/", json={
+            "first_name": "Query",
+            "last_name": f"Count{n}",
+            "email": f"query_count_{uuid.uuid4().hex[:8]}@example.com"
+        })
+        client.post("/resumes/", json={
+            "candidate_id": candidate_response.json()["candidate_id"],
+            "title": "Counted Resume",
+            "file_url": "http://example.com/counted.pdf"
+        })
+
+    query_counter.reset()
+    small_page = client.get("/candidates/?limit=2")
+    small_page_count = query_counter.count
+
+    query_counter.reset()
+    large_page = client.get("/candidates/?limit=50")
+    large_page_count = query_counter.count
+
+    assert small_page.status_code == 200
+    assert large_page.status_code == 200
+    assert len(large_page.json()) > len(small_page.json())
+    assert small_page_count == large_page_count
+    assert large_page_count <= 2
+
+def test_get_candidate_query_count(query_counter):
+    """A single candidate and its resumes load in a fixed number of statements."""
+    import uuid
+    candidate_response = client.post("/candidates/", json={
+        "first_name": "Single",
+        "last_name": "Count",
+        "email": f"single_count_{uuid.uuid4().hex[:8]}@example.com"
+    })
+    candidate_id = candidate_response.json()["candidate_id"]
+    for n in range(3):
+        client.post("/resumes/", json={
+            "candidate_id": candidate_id,
+            "title": f"Resume {n}",
+            "file_url": f"http://example.com/resume{n}.pdf"
+        })
+
+    query_counter.reset()
+    response = client.get(f"/candidates/{candidate_id}")
+    assert response.status_code == 200
+    assert len(response.json()["resumes"]) == 3
+    assert query_counter.count <= 2
+
+def test_candidates_cursor_pagination():
+    """Keyset pages follow X-Next-Cursor and match the offset-based listing."""
+    import uuid
+    for n in range(3):
+        client.post("/candidates/", json={
+            "first_name": "Cursor",
+            "last_name": f"Page{n}",
+            "email": f"cursor_{uuid.uuid4().hex[:8]}@example.com"
+        })
+
+    first_page = client.get("/candidates/?limit=2")
+    assert first_page.status_code == 200
+    cursor = first_page.headers["X-Next-Cursor"]
+    assert 'rel="next"' in first_page.headers["Link"]
+
+    second_page = client.get(f"/candidates/?limit=2&after={cursor}")
+    assert second_page.status_code == 200
+    offset_page = client.get("/candidates/?skip=2&limit=2")
+    assert second_page.json() == offset_page.json()
+
+    first_ids = [c["candidate_id"] for c in first_page.json()]
+    second_ids = [c["candidate_id"] for c in second_page.json()]
+    assert max(first_ids) < min(second_ids)
+
+def test_candidates_invalid_cursor():
+    response = client.get("/candidates/?after=not-a-cursor")
+    assert response.status_code == 400
+    assert "cursor" in response.json()["detail"].lower()
+
+def test_bulk_create_candidates_reports_conflicts():
+    """Bulk create inserts new rows and reports duplicates per item instead of failing."""
+    import uuid
+    existing_email = f"bulk_existing_{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/candidates/", json={
+        "first_name": "Already",
+        "last_name": "Here",
+        "email": existing_email
+    })
+    new_email = f"bulk_new_{uuid.uuid4().hex[:8]}@example.com"
+    other_email = f"bulk_other_{uuid.uuid4().hex[:8]}@example.com"
+
+    response = client.post("/candidates/bulk", json=[
+        {"first_name": "New", "last_name": "One", "email": new_email},
+        {"first_name": "Dup", "last_name": "Existing", "email": existing_email},
+        {"first_name": "Other", "last_name": "One", "email": other_email, "phone": "5551234567"},
+        {"first_name": "Dup", "last_name": "InBatch", "email": new_email.upper()},
+    ])
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["conflicts"] == 2
+    statuses = [(r["index"], r["status"]) for r in data["results"]]
+    assert statuses == [(0, "created"), (1, "conflict"), (2, "created"), (3, "conflict")]
+
+    created_id = data["results"][2]["candidate_id"]
+    get_response = client.get(f"/candidates/{created_id}")
+    assert get_response.status_code == 200
+    assert get_response.json()["email"] == other_email
+    assert get_response.json()["phone"] == "5551234567"
+
+def test_bulk_create_candidates_rejects_invalid_items():
+    response = client.post("/candidates/bulk", json=[
+        {"first_name": "", "last_name": "Invalid", "email": "not-an-email"}
+    ])
+    assert response.status_code == 422
+
+def test_create_candidate_single_statement(query_counter):
+    """Create is one INSERT ... ON CONFLICT ... RETURNING, with no pre-check or refresh."""
+    import uuid
+    query_counter.reset()
+    response = client.post("/candidates/", json={
+        "first_name": "One",
+        "last_name": "Trip",
+        "email": f"one_trip_{uuid.uuid4().hex[:8]}@example.com"
+    })
+    assert response.status_code == 201
+    assert response.json()["resumes"] == []
+    assert response.json()["created_at"] is not None
+    assert query_counter.count == 1
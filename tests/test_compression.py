@@ -0,0 +1,84 @@
+import asyncio
+import gzip
+import uuid
+import zlib
+
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, available_encodings, negotiate_encoding
+from app.main import app
+
+client = TestClient(app)
+
+def create_candidates(count: int) -> str:
+    token = uuid.uuid4().hex[:8]
+    client.post("/candidates/bulk", json=[
+        {"first_name": "Squeeze", "last_name": f"Row{n}", "email": f"gz_{token}_{n}@example.com"}
+        for n in range(count)
+    ])
+    return f"gz_{token}_"
+
+def test_negotiate_encoding():
+    available = ("zstd", "br", "gzip")
+    assert negotiate_encoding("gzip, deflate", available) == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br", available) == "br"
+    assert negotiate_encoding("br;q=0.8, gzip;q=0.8", available) == "br"
+    assert negotiate_encoding("*", available) == "zstd"
+    assert negotiate_encoding("*, zstd;q=0", available) == "br"
+    assert negotiate_encoding("identity", available) is None
+    assert negotiate_encoding("gzip;q=0", ("gzip",)) is None
+    assert available_encodings("zstd, br, gzip")[-1] == "gzip"
+
+def test_large_list_is_gzipped():
+    email = create_candidates(20)
+    plain = client.get("/candidates/", params={"email": email}, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    response = client.get("/candidates/", params={"email": email}, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert int(response.headers["content-length"]) < len(plain.content)
+    assert response.content == plain.content
+    # Compressed representations carry a weak validator that still revalidates
+    assert response.headers["etag"] == f"W/{plain.headers['etag']}"
+    revalidated = client.get("/candidates/", params={"email": email},
+                             headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+
+def test_small_responses_are_not_compressed():
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+def test_streamed_export_is_gzipped():
+    create_candidates(5)
+    plain = client.get("/candidates/export", headers={"Accept-Encoding": "identity"})
+    response = client.get("/candidates/export", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.content.splitlines()[:5] == plain.content.splitlines()[:5]
+
+def test_streaming_chunks_are_flushed_incrementally():
+    chunks = [b'{"row": %d, "padding": "%s"}\n' % (n, b"x" * 2000) for n in range(3)]
+
+    async def streaming_app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/x-ndjson")]})
+        for chunk in chunks:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [(b"accept-encoding", b"gzip")]}
+    middleware = CompressionMiddleware(streaming_app, ("gzip",), {"gzip": 6}, minimum_size=1024)
+    asyncio.run(middleware(scope, None, send))
+
+    bodies = [message["body"] for message in sent[1:]]
+    assert len(bodies) == 4
+    # Every flushed chunk decodes to its input without waiting for the rest
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk, body in zip(chunks, bodies):
+        assert decoder.decompress(body) == chunk
+    assert gzip.decompress(b"".join(bodies)) == b"".join(chunks)
@@ -0,0 +1,82 @@
+import uuid
+from fastapi.testclient import TestClient
+
+from app.core.cache import response_cache
+from app.main import app
+
+client = TestClient(app)
+
+def create_candidate_with_resume():
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Etag",
+        "last_name": "Check",
+        "email": f"etag_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()["candidate_id"]
+    resume_id = client.post("/resumes/", json={
+        "candidate_id": candidate_id,
+        "title": "Conditional",
+        "file_url": "http://example.com/conditional.pdf"
+    }).json()["resume_id"]
+    return candidate_id, resume_id
+
+def test_candidate_etag_round_trip():
+    candidate_id, _ = create_candidate_with_resume()
+    response = client.get(f"/candidates/{candidate_id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('"') and not etag.startswith("W/")
+
+    not_modified = client.get(f"/candidates/{candidate_id}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    client.put(f"/candidates/{candidate_id}", json={"first_name": "Changed"})
+    modified = client.get(f"/candidates/{candidate_id}", headers={"If-None-Match": etag})
+    assert modified.status_code == 200
+    assert modified.json()["first_name"] == "Changed"
+    assert modified.headers["ETag"] != etag
+
+def test_candidate_etag_changes_when_resume_changes():
+    candidate_id, resume_id = create_candidate_with_resume()
+    etag = client.get(f"/candidates/{candidate_id}").headers["ETag"]
+    client.put(f"/resumes/{resume_id}", json={"title": "Retitled"})
+    response = client.get(f"/candidates/{candidate_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+def test_resume_last_modified():
+    _, resume_id = create_candidate_with_resume()
+    response = client.get(f"/resumes/{resume_id}")
+    last_modified = response.headers["Last-Modified"]
+    assert last_modified.endswith("GMT")
+
+    not_modified = client.get(f"/resumes/{resume_id}", headers={"If-Modified-Since": last_modified})
+    assert not_modified.status_code == 304
+
+    # Without a cached body the check is answered from the timestamp column
+    response_cache.clear()
+    not_modified = client.get(f"/resumes/{resume_id}", headers={"If-Modified-Since": last_modified})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["Last-Modified"] == last_modified
+
+    stale = client.get(f"/resumes/{resume_id}", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})
+    assert stale.status_code == 200
+
+def test_if_none_match_takes_precedence_over_if_modified_since():
+    _, resume_id = create_candidate_with_resume()
+    last_modified = client.get(f"/resumes/{resume_id}").headers["Last-Modified"]
+    response = client.get(f"/resumes/{resume_id}", headers={
+        "If-None-Match": '"something-else"',
+        "If-Modified-Since": last_modified,
+    })
+    assert response.status_code == 200
+
+def test_list_etag():
+    create_candidate_with_resume()
+    response = client.get("/candidates/?limit=5")
+    etag = response.headers["ETag"]
+    assert client.get("/candidates/?limit=5", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/candidates/?limit=6", headers={"If-None-Match": etag}).status_code == 200
+
+    resumes = client.get("/resumes/?limit=5")
+    assert client.get("/resumes/?limit=5", headers={"If-None-Match": resumes.headers["ETag"]}).status_code == 304
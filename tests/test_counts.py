@@ -0,0 +1,49 @@
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.core.cache import count_cache
+from app.crud.counts import Explain
+from app.main import app
+from app.models import Candidate
+
+client = TestClient(app)
+
+def create_candidates(count: int, token: str) -> None:
+    client.post("/candidates/bulk", json=[
+        {"first_name": "Counted", "last_name": f"Row{n}", "email": f"count_{token}_{n}@example.com"}
+        for n in range(count)
+    ])
+
+def test_exact_count_respects_filters_and_is_cached():
+    token = uuid.uuid4().hex[:8]
+    create_candidates(3, token)
+    params = {"email": f"count_{token}_", "limit": 2, "count": "exact"}
+    response = client.get("/candidates/", params=params)
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count"] == "3"
+
+    create_candidates(1, token + "_new")
+    # Served from the count cache until it expires
+    assert client.get("/candidates/", params=params).headers["X-Total-Count"] == "3"
+    count_cache.clear()
+    assert client.get("/candidates/", params=params).headers["X-Total-Count"] == "4"
+
+def test_estimated_count_is_exact_off_postgresql():
+    token = uuid.uuid4().hex[:8]
+    create_candidates(2, token)
+    response = client.get("/candidates/", params={"email": f"count_{token}_", "count": "estimated"})
+    assert response.headers["X-Total-Count"] == "2"
+    total = client.get("/resumes/", params={"count": "estimated", "limit": 1}).headers["X-Total-Count"]
+    assert int(total) >= 0
+
+def test_count_is_opt_in():
+    assert "X-Total-Count" not in client.get("/candidates/", params={"limit": 1}).headers
+    assert client.get("/candidates/", params={"count": "approximate"}).status_code == 422
+    assert client.get("/candidates/", params={"ids": "1", "count": "exact"}).status_code == 400
+
+def test_estimate_uses_the_postgresql_planner():
+    sql = str(Explain(select(Candidate.candidate_id)).compile(dialect=postgresql.dialect()))
+    assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT candidates.candidate_id")
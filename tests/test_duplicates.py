@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.core.dedup import CandidateRecord, find_duplicate_pairs, normalize_phone, soundex
+from app.crud import duplicates
+from app.crud.duplicates import detect_duplicates
+from app.main import app
+
+client = TestClient(app)
+
+def test_blocking_helpers():
+    assert normalize_phone("+1 (555) 123-4567") == normalize_phone("555.123.4567") == "5551234567"
+    assert normalize_phone("12-34") is None
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Smith") == soundex("Smyth")
+
+def test_trigram_hashing_is_stable_across_processes():
+    code = "from app.core.dedup import _trigrams; print(_trigrams('Jonathan Smith'))"
+    outputs = {
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                       env={**os.environ, "PYTHONHASHSEED": seed}).stdout.strip().splitlines()[-1]
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+
+def test_find_duplicate_pairs_scores_fuzzy_matches():
+    records = [
+        CandidateRecord(1, "John", "Smith", "john.smith@gmail.com", "(555) 123-4567"),
+        CandidateRecord(2, "Jon", "Smith", "jsmith@work.com", "555.123.4567"),
+        CandidateRecord(3, "John", "Smyth", "john.smith+jobs@yahoo.com", None),
+        CandidateRecord(4, "Jane", "Smith", "jane.s@example.com", "555-000-1111"),
+        CandidateRecord(5, "Alice", "Wong", "alice@example.com", None),
+    ]
+    pairs = {(p.candidate_id, p.duplicate_id): p for p in find_duplicate_pairs(records, threshold=0.75)}
+    assert {(1, 2), (1, 3)} <= set(pairs)
+    assert "phone" in pairs[(1, 2)].reasons
+    assert "email" in pairs[(1, 3)].reasons
+    assert all((a, b) not in pairs for a, b in [(1, 4), (4, 5), (1, 5)])
+    assert all(0 <= p.score <= 1.0001 for p in pairs.values())
+
+def create_candidate(first_name, last_name, email, phone=None):
+    return client.post("/candidates/", json={
+        "first_name": first_name, "last_name": last_name, "email": email, "phone": phone
+    }).json()
+
+def test_possible_duplicates_endpoint():
+    tag = uuid.uuid4().hex[:8]
+    digits = str(uuid.uuid4().int)[:10]
+    phone = f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    original = create_candidate(f"Zelda{tag}", "Quorrin", f"zelda.{tag}@example.com", phone)
+    duplicate = create_candidate(f"Zelda{tag}", "Quorin", f"zq{tag}@other.com", digits)
+    unrelated = create_candidate("Unrelated", f"Person{tag}", f"nobody{tag}@example.com")
+
+    db = SessionLocal()
+    try:
+        report = detect_duplicates(db)
+    finally:
+        db.close()
+    assert report["candidates"] >= 3
+
+    matches = client.get(f"/candidates/{original['candidate_id']}/possible-duplicates").json()
+    assert [m["candidate"]["candidate_id"] for m in matches] == [duplicate["candidate_id"]]
+    assert "phone" in matches[0]["reasons"]
+    assert 0.8 <= matches[0]["score"] <= 1.0001
+
+    reverse = client.get(f"/candidates/{duplicate['candidate_id']}/possible-duplicates").json()
+    assert [m["candidate"]["candidate_id"] for m in reverse] == [original["candidate_id"]]
+    assert client.get(f"/candidates/{unrelated['candidate_id']}/possible-duplicates").json() == []
+    assert client.get(f"/candidates/{original['candidate_id']}/possible-duplicates?min_score=1").json() == []
+    assert client.get("/candidates/999999/possible-duplicates").status_code == 404
+
+def test_candidate_deleted_mid_run_is_skipped(monkeypatch):
+    tag = uuid.uuid4().hex[:8]
+    digits = str(uuid.uuid4().int)[:10]
+    kept = create_candidate(f"Yorick{tag}", "Vantablack", f"yorick.{tag}@example.com", digits)
+    deleted = create_candidate(f"Yorick{tag}", "Vantablak", f"yv{tag}@other.com", digits)
+
+    def find_then_delete(records, threshold):
+        pairs = find_duplicate_pairs(records, threshold)
+        assert client.delete(f"/candidates/{deleted['candidate_id']}").status_code == 204
+        return pairs
+
+    monkeypatch.setattr(duplicates, "find_duplicate_pairs", find_then_delete)
+    db = SessionLocal()
+    try:
+        report = detect_duplicates(db)
+    finally:
+        db.close()
+    assert report["stale_pairs"] >= 1
+    assert client.get(f"/candidates/{kept['candidate_id']}/possible-duplicates").json() == []
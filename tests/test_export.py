@@ -0,0 +1,68 @@
+import csv
+import io
+import json
+import uuid
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+def create_candidate(resume_count=0):
+    email = f"export_{uuid.uuid4().hex[:8]}@example.com"
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Export",
+        "last_name": "Me",
+        "email": email,
+        "phone": "5551112222"
+    }).json()["candidate_id"]
+    resume_ids = [
+        client.post("/resumes/", json={
+            "candidate_id": candidate_id,
+            "title": f"Export Resume {n}",
+            "file_url": f"http://example.com/export{n}.pdf"
+        }).json()["resume_id"]
+        for n in range(resume_count)
+    ]
+    return candidate_id, email, resume_ids
+
+def test_export_candidates_ndjson():
+    candidate_id, email, _ = create_candidate()
+    response = client.get("/candidates/export?format=ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    ids = [record["candidate_id"] for record in records]
+    assert ids == sorted(ids)
+    exported = next(record for record in records if record["candidate_id"] == candidate_id)
+    assert exported["email"] == email
+    assert "resumes" not in exported
+
+def test_export_candidates_with_resumes_ndjson():
+    candidate_id, _, resume_ids = create_candidate(resume_count=2)
+    empty_id, _, _ = create_candidate()
+    response = client.get("/candidates/export?format=ndjson&include_resumes=true")
+    records = {json.loads(line)["candidate_id"]: json.loads(line) for line in response.text.splitlines()}
+    assert [r["resume_id"] for r in records[candidate_id]["resumes"]] == resume_ids
+    assert records[empty_id]["resumes"] == []
+
+def test_export_candidates_csv():
+    candidate_id, email, resume_ids = create_candidate(resume_count=2)
+    response = client.get("/candidates/export?format=csv&include_resumes=true")
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = [row for row in csv.DictReader(io.StringIO(response.text)) if row["candidate_id"] == str(candidate_id)]
+    assert [row["resume_id"] for row in rows] == [str(rid) for rid in resume_ids]
+    assert rows[0]["email"] == email
+    assert rows[0]["resume_title"] == "Export Resume 0"
+
+def test_export_resumes():
+    _, _, resume_ids = create_candidate(resume_count=1)
+    response = client.get("/resumes/export?format=csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert str(resume_ids[0]) in {row["resume_id"] for row in rows}
+
+    ndjson = client.get("/resumes/export")
+    assert resume_ids[0] in {json.loads(line)["resume_id"] for line in ndjson.text.splitlines()}
+
+def test_export_rejects_unknown_format():
+    assert client.get("/candidates/export?format=xml").status_code == 422
@@ -0,0 +1,146 @@
+import io
+import uuid
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.crud.extraction import extract_pending, extraction_pool, local_path
+from app.main import app
+
+client = TestClient(app)
+
+def make_pdf(text):
+    """Single-page PDF showing ``text`` in Helvetica."""
+    content = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = io.BytesIO(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+def make_docx(text):
+    document = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:body></w:document>'
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return out.getvalue()
+
+@pytest.fixture(scope="module")
+def pool():
+    with extraction_pool(2) as executor:
+        yield executor
+
+@pytest.fixture(autouse=True)
+def local_root(tmp_path, monkeypatch):
+    root = tmp_path / "resumes"
+    root.mkdir()
+    monkeypatch.setattr(settings, "TEXT_EXTRACTION_LOCAL_ROOT", str(root))
+    return root
+
+def run_extraction(pool):
+    db = SessionLocal()
+    try:
+        return extract_pending(db, pool, batch_size=50)
+    finally:
+        db.close()
+
+def create_resume(file_url):
+    candidate = client.post("/candidates/", json={
+        "first_name": "Text",
+        "last_name": "Source",
+        "email": f"text_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()
+    return client.post("/resumes/", json={
+        "candidate_id": candidate["candidate_id"],
+        "title": "Resume",
+        "file_url": file_url
+    }).json()["resume_id"]
+
+def test_extracts_pdf_docx_and_txt(local_root, pool):
+    files = {
+        "cv.pdf": make_pdf("Senior Python Engineer"),
+        "cv.docx": make_docx("Data Scientist with SQL"),
+        "cv.txt": "Backend developer\n\n\nFastAPI".encode(),
+    }
+    resume_ids = {}
+    for name, content in files.items():
+        (local_root / name).write_bytes(content)
+        url = (local_root / name).as_uri() if name.endswith(".pdf") else str(local_root / name)
+        resume_ids[name] = create_resume(url)
+    remote = create_resume("http://example.com/remote.pdf")
+
+    assert client.get(f"/resumes/{remote}/text").json()["status"] == "pending"
+    run_extraction(pool)
+
+    texts = {name: client.get(f"/resumes/{rid}/text").json() for name, rid in resume_ids.items()}
+    assert all(t["status"] == "done" for t in texts.values())
+    assert "Senior Python Engineer" in texts["cv.pdf"]["text"]
+    assert texts["cv.docx"]["text"] == "Data Scientist with SQL"
+    assert texts["cv.txt"]["text"] == "Backend developer\n\nFastAPI"
+    assert texts["cv.txt"]["char_count"] == len(texts["cv.txt"]["text"])
+    assert client.get(f"/resumes/{remote}/text").json()["status"] == "unsupported"
+
+def test_extraction_is_incremental(local_root, pool):
+    first = local_root / "first.txt"
+    first.write_text("First version")
+    resume_id = create_resume(str(first))
+    run_extraction(pool)
+    assert run_extraction(pool).processed == 0
+
+    second = local_root / "second.txt"
+    second.write_text("Second version")
+    client.put(f"/resumes/{resume_id}", json={"file_url": str(second)})
+    assert client.get(f"/resumes/{resume_id}/text").json()["status"] == "pending"
+    assert run_extraction(pool).processed >= 1
+    data = client.get(f"/resumes/{resume_id}/text?include_text=false").json()
+    assert data["status"] == "done"
+    assert data["text"] is None
+
+def test_missing_file_fails_and_unknown_resume_404(local_root, pool):
+    resume_id = create_resume(str(local_root / "missing.pdf"))
+    run_extraction(pool)
+    data = client.get(f"/resumes/{resume_id}/text").json()
+    assert data["status"] == "failed"
+    assert "FileNotFoundError" in data["error"]
+    assert client.get("/resumes/999999/text").status_code == 404
+
+def test_files_outside_local_root_are_not_read(tmp_path, local_root, pool, monkeypatch):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("DATABASE_PASSWORD=hunter2")
+    urls = [str(secret), secret.as_uri(), f"{local_root}/../secret.txt", "/etc/passwd"]
+    (local_root / "link.txt").symlink_to(secret)
+    urls.append(str(local_root / "link.txt"))
+    resume_ids = [create_resume(url) for url in urls]
+    allowed = create_resume(str(local_root / "missing.txt"))
+    run_extraction(pool)
+    for resume_id in resume_ids:
+        data = client.get(f"/resumes/{resume_id}/text").json()
+        assert data["status"] == "unsupported"
+        assert data["text"] is None
+    assert client.get(f"/resumes/{allowed}/text").json()["status"] == "failed"
+
+    # Without a configured root only uploaded blobs are read
+    monkeypatch.setattr(settings, "TEXT_EXTRACTION_LOCAL_ROOT", "")
+    assert local_path(str(local_root / "cv.txt")) is None
+    assert local_path("blob://sha256/" + "0" * 64) is not None
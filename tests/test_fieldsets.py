@@ -0,0 +1,96 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import schemas
+from app.core.exceptions import InvalidFieldSelectionError
+from app.core.fieldsets import parse_fieldset
+from app.main import app
+
+client = TestClient(app)
+
+def parse(fields=None, include=None):
+    return parse_fieldset(fields, include, schemas.Candidate, key="candidate_id", relations=("resumes",))
+
+def create_candidate_with_resume() -> tuple[int, str]:
+    email = f"sparse_{uuid.uuid4().hex[:8]}@example.com"
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Sparse", "last_name": "Fields", "email": email, "phone": "555-0101"
+    }).json()["candidate_id"]
+    client.post("/resumes/", json={
+        "candidate_id": candidate_id, "title": "Sparse CV", "file_url": "http://example.com/sparse.pdf"
+    })
+    return candidate_id, email
+
+def test_parse_fieldset_defaults_to_full_representation():
+    assert parse() == (None, frozenset({"resumes"}), None)
+    assert parse(include="resumes").names is None
+
+def test_parse_fieldset_keeps_key_and_drops_relations():
+    fieldset = parse(fields="email, first_name")
+    assert fieldset.columns == ("first_name", "email", "candidate_id")
+    assert fieldset.include == frozenset()
+    assert fieldset.names == {"first_name", "email", "candidate_id"}
+    assert parse(fields="email", include="resumes").names == {"email", "candidate_id", "resumes"}
+    assert parse(fields="email,resumes").include == {"resumes"}
+    assert parse(include="").names == {
+        "candidate_id", "first_name", "last_name", "email", "phone", "created_at", "updated_at"}
+
+def test_parse_fieldset_rejects_unknown_names():
+    with pytest.raises(InvalidFieldSelectionError):
+        parse(fields="email,password")
+    with pytest.raises(InvalidFieldSelectionError):
+        parse(include="interviews")
+
+def test_list_returns_only_selected_fields(query_counter):
+    candidate_id, email = create_candidate_with_resume()
+    query_counter.reset()
+    response = client.get("/candidates/", params={"email": email, "fields": "email,phone"})
+    assert response.status_code == 200
+    assert response.json() == [{"email": email, "phone": "555-0101", "candidate_id": candidate_id}]
+    # One projected SELECT; the resume query never runs
+    selects = [s for s in query_counter.statements if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "first_name" not in selects[0] and "resumes" not in selects[0]
+
+def test_list_include_resumes_with_fields():
+    candidate_id, email = create_candidate_with_resume()
+    body = client.get("/candidates/", params={"email": email, "fields": "first_name",
+                                              "include": "resumes"}).json()
+    assert set(body[0]) == {"candidate_id", "first_name", "resumes"}
+    assert body[0]["resumes"][0]["title"] == "Sparse CV"
+
+def test_list_without_params_is_unchanged():
+    candidate_id, email = create_candidate_with_resume()
+    full = client.get("/candidates/", params={"email": email}).json()
+    assert full[0]["resumes"][0]["title"] == "Sparse CV"
+    assert client.get("/candidates/", params={"email": email, "include": "resumes"}).json() == full
+    no_resumes = client.get("/candidates/", params={"email": email, "include": ""}).json()
+    assert no_resumes == [{key: value for key, value in full[0].items() if key != "resumes"}]
+
+def test_single_candidate_fields_and_etag():
+    candidate_id, email = create_candidate_with_resume()
+    response = client.get(f"/candidates/{candidate_id}", params={"fields": "last_name"})
+    assert response.json() == {"candidate_id": candidate_id, "last_name": "Fields"}
+    again = client.get(f"/candidates/{candidate_id}", params={"fields": "last_name"},
+                       headers={"If-None-Match": response.headers["etag"]})
+    assert again.status_code == 304
+    # The cached full representation is unaffected by sparse reads
+    assert client.get(f"/candidates/{candidate_id}").json()["resumes"][0]["title"] == "Sparse CV"
+
+def test_unknown_field_is_a_bad_request():
+    response = client.get("/candidates/", params={"fields": "email,salary"})
+    assert response.status_code == 400
+    assert "salary" in response.json()["detail"]
+    assert client.get("/candidates/1", params={"include": "notes"}).status_code == 400
+
+def test_openapi_describes_sparse_candidates():
+    spec = app.openapi()
+    operation = spec["paths"]["/candidates/{candidate_id}"]["get"]
+    assert {param["name"] for param in operation["parameters"]} >= {"fields", "include"}
+    schema_ref = operation["responses"]["200"]["content"]["application/json"]["schema"]["$ref"]
+    assert schema_ref.endswith("/CandidateFields")
+    fields_schema = spec["components"]["schemas"]["CandidateFields"]
+    assert fields_schema["required"] == ["candidate_id"]
+    assert "default" not in fields_schema["properties"]["email"]
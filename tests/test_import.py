@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.crud.importer import _Importer, copy_csv_line
+from app.main import app
+
+client = TestClient(app)
+
+def test_import_candidates_csv_reports_rejected_rows():
+    tag = uuid.uuid4().hex[:8]
+    existing = f"import_existing_{tag}@example.com"
+    client.post("/candidates/", json={"first_name": "Already", "last_name": "Here", "email": existing})
+
+    body = "\n".join([
+        "first_name,last_name,email,phone",
+        f"Ada,Lovelace,import_ada_{tag}@example.com,5550001111",
+        f"Dup,Existing,{existing},",
+        "Bad,Email,not-an-email,",
+        f"Grace,Hopper,IMPORT_ADA_{tag}@example.com,",
+        f"Alan,Turing,import_alan_{tag}@example.com,",
+    ]) + "\n"
+    response = client.post("/candidates/import", content=body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["received"] == 5
+    assert data["created"] == 2
+    assert data["rejected"] == 3
+    reasons = {error["line"]: error["reason"] for error in data["errors"]}
+    assert reasons[3] == "Email already registered."
+    assert "email" in reasons[4]
+    assert reasons[5] == "Duplicate email in file."
+
+    exported = client.get("/candidates/export?format=ndjson").text.splitlines()
+    imported = [json.loads(line) for line in exported if f"import_ada_{tag}" in line]
+    assert imported[0]["phone"] == "5550001111"
+
+def test_import_candidates_update_on_conflict():
+    email = f"import_update_{uuid.uuid4().hex[:8]}@example.com"
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Old", "last_name": "Name", "email": email
+    }).json()["candidate_id"]
+    client.get(f"/candidates/{candidate_id}")  # warm the cache
+
+    body = json.dumps({"first_name": "New", "last_name": "Name", "email": email}) + "\n"
+    response = client.post("/candidates/import?format=ndjson&on_conflict=update", content=body)
+    assert response.json()["updated"] == 1
+    assert client.get(f"/candidates/{candidate_id}").json()["first_name"] == "New"
+
+def test_import_resumes_rejects_missing_candidates():
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Resume", "last_name": "Import",
+        "email": f"import_resume_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()["candidate_id"]
+    lines = [
+        {"candidate_id": candidate_id, "title": "Imported", "file_url": "http://example.com/imported.pdf"},
+        {"candidate_id": 987654321, "title": "Orphan", "file_url": "http://example.com/orphan.pdf"},
+        {"title": "Missing candidate_id", "file_url": "http://example.com/missing.pdf"},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines) + "\nnot json\n"
+    response = client.post("/resumes/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+    data = response.json()
+    assert data["created"] == 1
+    assert data["rejected"] == 3
+    assert [r["title"] for r in client.get(f"/candidates/{candidate_id}").json()["resumes"]] == ["Imported"]
+
+def test_import_requires_known_format():
+    response = client.post("/candidates/import", content="x", headers={"Content-Type": "application/octet-stream"})
+    assert response.status_code == 415
+
+def test_copy_csv_line_keeps_text_that_looks_like_null():
+    line = copy_csv_line(["\\N", None, "", 'say "hi"', "tab\there\nnew line", "C:\\path", 7])
+    assert line == '"\\N",,"","say ""hi""","tab\there\nnew line","C:\\path","7"\n'
+    assert next(csv.reader(io.StringIO(line))) == ["\\N", "", "", 'say "hi"', "tab\there\nnew line", "C:\\path", "7"]
+
+def test_importer_requires_merge():
+    with pytest.raises(TypeError):
+        _Importer(None, chunk_size=10, on_reject=None)
@@ -0,0 +1,72 @@
+import json
+import logging
+import queue
+
+from app.core.logger import DroppingQueueHandler, JsonFormatter, SampledLogger
+
+class CountingStr:
+    """Argument that records whether it was ever formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "value"
+
+def make_logger(name, handler):
+    test_logger = logging.getLogger(f"test-logging.{name}")
+    test_logger.handlers = [handler]
+    test_logger.propagate = False
+    test_logger.setLevel(logging.INFO)
+    return test_logger
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, "Fetched %s rows", (3,), None)
+    record.sample_rate = 0.5
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "Fetched 3 rows"
+    assert entry["level"] == "INFO"
+    assert entry["sample_rate"] == 0.5
+
+def test_queue_handler_defers_formatting():
+    handler = DroppingQueueHandler(queue.Queue())
+    arg = CountingStr()
+    make_logger("defer", handler).info("Got %s", arg)
+    record = handler.queue.get_nowait()
+    assert arg.formatted == 0
+    assert record.getMessage() == "Got value"
+
+def test_queue_handler_drops_when_full():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    test_logger = make_logger("drop", handler)
+    for n in range(3):
+        test_logger.info("message %s", n)
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 2
+
+def test_sampled_logger_never_samples_warnings():
+    handler = DroppingQueueHandler(queue.Queue())
+    sampled = SampledLogger(make_logger("sampled", handler), rate=0.0)
+    sampled.info("dropped")
+    sampled.warning("kept")
+    assert [handler.queue.get_nowait().getMessage()] == ["kept"]
+    assert handler.queue.empty()
+
+def test_sampled_records_carry_rate():
+    handler = DroppingQueueHandler(queue.Queue())
+    SampledLogger(make_logger("rate", handler), rate=1.0).info("kept %s", 1)
+    record = handler.queue.get_nowait()
+    assert record.sample_rate == 1.0
+    assert record.funcName == "test_sampled_records_carry_rate"
+
+def test_sampled_logger_accepts_caller_extra_and_stacklevel():
+    handler = DroppingQueueHandler(queue.Queue())
+    sampled = SampledLogger(make_logger("extra", handler), rate=1.0)
+    sampled.info("kept", extra={"route": "/candidates"})
+    sampled.error("failed", extra={"route": "/resumes"}, stacklevel=1)
+    info, error = handler.queue.get_nowait(), handler.queue.get_nowait()
+    assert (info.route, info.sample_rate) == ("/candidates", 1.0)
+    assert info.funcName == "test_sampled_logger_accepts_caller_extra_and_stacklevel"
+    assert error.route == "/resumes" and not hasattr(error, "sample_rate")
+    assert error.funcName == "error"
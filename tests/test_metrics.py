@@ -0,0 +1,53 @@
+import uuid
+from fastapi.testclient import TestClient
+
+from app.core.metrics import Histogram, UNMATCHED_ROUTE, render_histogram, request_db_statements, request_latency
+from app.main import app
+
+client = TestClient(app)
+
+def test_histogram_exposition_format():
+    histogram = Histogram((0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(3)
+    lines = []
+    render_histogram(lines, "demo_seconds", histogram, 'route="/x"')
+    assert lines == [
+        'demo_seconds_bucket{route="/x",le="0.1"} 1',
+        'demo_seconds_bucket{route="/x",le="1"} 1',
+        'demo_seconds_bucket{route="/x",le="+Inf"} 2',
+        'demo_seconds_sum{route="/x"} 3.05',
+        'demo_seconds_count{route="/x"} 2',
+    ]
+
+def test_requests_labeled_by_route_template_with_db_work():
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Metric",
+        "last_name": "Labels",
+        "email": f"metrics_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()["candidate_id"]
+    route = "/candidates/{candidate_id}"
+    latency = request_latency.labels("GET", route, 404)
+    statements = request_db_statements.labels("GET", route)
+    count_before, statements_before = latency.snapshot()["count"], statements.snapshot()["sum"]
+
+    client.delete(f"/candidates/{candidate_id}")
+    assert client.get(f"/candidates/{candidate_id}").status_code == 404
+
+    assert latency.snapshot()["count"] == count_before + 1
+    assert statements.snapshot()["sum"] > statements_before
+
+def test_unmatched_paths_share_one_label():
+    client.get(f"/no-such-path/{uuid.uuid4().hex}")
+    assert request_latency.labels("GET", UNMATCHED_ROUTE, 404).snapshot()["count"] >= 1
+
+def test_metrics_endpoint_prometheus_text():
+    client.get("/health")
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in body
+    assert "http_requests_in_flight 1" in body
+    assert 'db_pool_checked_out{engine="sync"}' in body
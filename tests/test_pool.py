@@ -0,0 +1,68 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from app.core.config import settings
+from app.core.pool import Histogram, instrument_pool, engine_options, pool_status
+from app.main import app
+
+client = TestClient(app)
+
+def make_engine(tmp_path, monkeypatch, **overrides):
+    for name, value in overrides.items():
+        monkeypatch.setattr(settings, name, value)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **engine_options(url))
+    instrument_pool(engine)
+    return engine
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 10))
+    for value in (0.5, 5, 50):
+        histogram.observe(value)
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == {"1": 1, "10": 2, "+Inf": 3}
+    assert snapshot["count"] == 3
+
+def test_pool_settings_applied(tmp_path, monkeypatch):
+    engine = make_engine(tmp_path, monkeypatch, DB_POOL_SIZE=3, DB_MAX_OVERFLOW=2)
+    status = pool_status(engine)
+    assert status["size"] == 3
+    assert status["max_overflow"] == 2
+
+def test_checkout_timeout_counted(tmp_path, monkeypatch):
+    engine = make_engine(tmp_path, monkeypatch, DB_POOL_SIZE=1, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.05)
+    with engine.connect():
+        assert pool_status(engine)["checked_out"] == 1
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    status = pool_status(engine)
+    assert status["checkout_timeouts"] == 1
+    assert status["idle"] == 1
+    assert status["checkout_wait_ms"]["count"] == 2
+
+def test_idle_connections_pinged(tmp_path, monkeypatch):
+    engine = make_engine(tmp_path, monkeypatch, DB_POOL_PRE_PING="idle", DB_POOL_PING_IDLE_SECONDS=0)
+    for _ in range(3):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    status = pool_status(engine)
+    assert status["checkouts"] == 3
+    assert status["connects"] == 1
+    # The first checkout gets a brand-new connection, which is never pinged
+    assert status["idle_pings"] == 2
+
+def test_unknown_pre_ping_strategy_rejected(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING", "sometimes")
+    with pytest.raises(ValueError):
+        engine_options("sqlite:///pool.db")
+
+def test_health_db_reports_pool():
+    client.get("/candidates/")
+    response = client.get("/health/db")
+    assert response.status_code == 200
+    pools = response.json()
+    # Requests use the async engine's pool when DB_ASYNC_MODE is on
+    status = pools.get("async", pools["sync"])
+    assert status["checkouts"] >= 1
+    assert {"checked_out", "idle", "overflow", "checkout_wait_ms"} <= status.keys()
@@ -0,0 +1,113 @@
+import asyncio
+import random
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app import main
+from app.core import database
+from app.core.database import Base, build_async_engine, build_engine, get_async_database_url
+from app.core.replicas import PRIMARY_COOKIE, ReadYourWritesMiddleware, Replica, ReplicaSet
+from app.main import app
+from app.models import Candidate
+from app.routers import candidates as candidates_router
+
+client = TestClient(app)
+
+def make_replica(name: str, url: str) -> Replica:
+    async_engine = build_async_engine(get_async_database_url(url)) if database.async_engine is not None else None
+    return Replica(name, build_engine(url), async_engine)
+
+@pytest.fixture
+def replica_db(tmp_path, monkeypatch):
+    """A second SQLite database standing in for a replica, holding one candidate the primary lacks."""
+    replica = make_replica("replica1", f"sqlite:///{tmp_path / 'replica.db'}")
+    Base.metadata.create_all(replica.engine)
+    candidate_id = random.randint(10**8, 10**9)
+    with Session(replica.engine) as db:
+        db.add(Candidate(candidate_id=candidate_id, first_name="Only", last_name="OnReplica",
+                         email=f"replica_{candidate_id}@example.com"))
+        db.commit()
+    replicas = ReplicaSet([replica])
+    monkeypatch.setattr(database, "replicas", replicas)
+    monkeypatch.setattr(candidates_router, "replicas", replicas)
+    monkeypatch.setattr(main, "replicas", replicas)
+    return replicas, candidate_id
+
+def test_reads_use_replica_and_writes_use_primary(replica_db):
+    replicas, candidate_id = replica_db
+    response = client.get(f"/candidates/{candidate_id}")
+    assert response.status_code == 200
+    assert response.json()["last_name"] == "OnReplica"
+    assert client.get("/candidates/", params={"email": f"replica_{candidate_id}@"}).json()[0]["first_name"] == "Only"
+    update = client.put(f"/candidates/{candidate_id}", json={"first_name": "Changed"})
+    assert update.status_code == 404
+
+def test_sticky_client_reads_primary(replica_db):
+    replicas, candidate_id = replica_db
+    params = {"email": f"replica_{candidate_id}@"}
+    sticky = TestClient(app, cookies={PRIMARY_COOKIE: str(time.time() + 60)})
+    assert sticky.get("/candidates/", params=params).json() == []
+    assert sticky.get(f"/candidates/{candidate_id}").status_code == 404
+    expired = TestClient(app, cookies={PRIMARY_COOKIE: str(time.time() - 1)})
+    assert len(expired.get("/candidates/", params=params).json()) == 1
+
+def test_unhealthy_replica_leaves_rotation(replica_db, tmp_path):
+    replicas, candidate_id = replica_db
+    broken = make_replica("replica2", f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+    replicas.replicas.append(broken)
+    replicas.check_all()
+    assert not broken.healthy and broken.last_error
+    assert replicas.replicas[0].healthy
+    assert {replicas.choose().name for _ in range(4)} == {"replica1"}
+
+    replicas.replicas[0].mark_down("maintenance")
+    assert replicas.choose() is None
+    # Every replica is down: reads fall back to the primary
+    assert client.get("/candidates/", params={"email": f"replica_{candidate_id}@"}).json() == []
+    replicas.check_all()
+    assert replicas.replicas[0].healthy
+
+def test_routing_strategies(tmp_path):
+    first = Replica("a", build_engine(f"sqlite:///{tmp_path / 'a.db'}"))
+    second = Replica("b", build_engine(f"sqlite:///{tmp_path / 'b.db'}"))
+    round_robin = ReplicaSet([first, second])
+    assert [round_robin.choose().name for _ in range(4)] == ["a", "b", "a", "b"]
+
+    least = ReplicaSet([first, second], strategy="least_connections")
+    with first.engine.connect():
+        assert {least.choose().name for _ in range(4)} == {"b"}
+    with pytest.raises(ValueError):
+        ReplicaSet([first], strategy="random")
+
+def test_writes_set_read_your_writes_cookie():
+    async def endpoint(scope, receive, send):
+        status = 201 if scope["path"] == "/ok" else 409
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    def cookies_for(method: str, path: str) -> list:
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": method, "path": path, "headers": []}
+        asyncio.run(ReadYourWritesMiddleware(endpoint, sticky_seconds=5)(scope, None, send))
+        return [value for name, value in sent[0]["headers"] if name == b"set-cookie"]
+
+    before = time.time()
+    cookie = cookies_for("POST", "/ok")[0].decode()
+    until = float(cookie.split(";")[0].split("=")[1])
+    # The timestamp is written with millisecond precision
+    assert cookie.startswith(f"{PRIMARY_COOKIE}=") and before + 5 - 0.001 <= until <= time.time() + 5 + 0.001
+    assert cookies_for("GET", "/ok") == []
+    assert cookies_for("POST", "/conflict") == []
+
+def test_health_db_reports_replicas(replica_db):
+    replicas, _ = replica_db
+    body = client.get("/health/db").json()
+    assert body["replica1"]["healthy"] is True
+    assert "checked_out" in body["replica1"]
@@ -0,0 +1,148 @@
+import hashlib
+import os
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.storage import blob_store
+from app.main import app
+
+client = TestClient(app)
+
+@pytest.fixture(autouse=True)
+def isolated_store(tmp_path, monkeypatch):
+    monkeypatch.setattr(blob_store, "root", tmp_path)
+    return tmp_path
+
+def create_resume():
+    candidate = client.post("/candidates/", json={
+        "first_name": "File",
+        "last_name": "Owner",
+        "email": f"file_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()
+    return client.post("/resumes/", json={
+        "candidate_id": candidate["candidate_id"],
+        "title": "Resume",
+        "file_url": "http://example.com/resume.pdf"
+    }).json()
+
+def upload(resume_id, content, filename="cv.pdf", content_type="application/pdf"):
+    return client.post(f"/resumes/{resume_id}/file", files={"file": (filename, content, content_type)})
+
+def test_upload_stores_content_addressed_blob():
+    resume = create_resume()
+    content = os.urandom(300_000)
+    digest = hashlib.sha256(content).hexdigest()
+
+    response = upload(resume["resume_id"], content)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["file_url"] == f"blob://sha256/{digest}"
+    assert data["file_name"] == "cv.pdf"
+    assert data["content_type"] == "application/pdf"
+    assert data["file_size"] == len(content)
+    assert blob_store.path_for(digest).read_bytes() == content
+    assert list(blob_store.tmp_dir.iterdir()) == []
+
+    # The metadata read reflects the upload, not a stale cached copy
+    assert client.get(f"/resumes/{resume['resume_id']}").json()["file_url"] == data["file_url"]
+
+def test_download_full_and_range():
+    resume = create_resume()
+    content = os.urandom(10_000)
+    upload(resume["resume_id"], content)
+
+    response = client.get(f"/resumes/{resume['resume_id']}/file")
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == f'"{hashlib.sha256(content).hexdigest()}"'
+
+    partial = client.get(f"/resumes/{resume['resume_id']}/file", headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.content == content[100:200]
+    assert partial.headers["content-range"] == f"bytes 100-199/{len(content)}"
+
+    cached = client.get(f"/resumes/{resume['resume_id']}/file", headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+def test_download_without_stored_file():
+    resume = create_resume()
+    assert client.get(f"/resumes/{resume['resume_id']}/file").status_code == 404
+    assert client.get("/resumes/999999/file").status_code == 404
+
+def test_upload_rejects_bad_requests(monkeypatch):
+    resume = create_resume()
+    assert upload(999999, b"data").status_code == 404
+
+    response = client.post(f"/resumes/{resume['resume_id']}/file", content=b"raw", headers={"Content-Type": "application/pdf"})
+    assert response.status_code == 415
+
+    response = client.post(f"/resumes/{resume['resume_id']}/file", files={"other": ("a.txt", b"x", "text/plain")})
+    assert response.status_code == 400
+
+    monkeypatch.setattr(settings, "RESUME_MAX_FILE_BYTES", 1000)
+    # Rejected from Content-Length, and while streaming once the limit is crossed
+    for size in (200_000, 5_000):
+        assert upload(resume["resume_id"], os.urandom(size)).status_code == 413
+    assert list(blob_store.tmp_dir.iterdir()) == []
+
+def test_truncated_upload_leaves_no_temp_file():
+    resume = create_resume()
+    body = (b'--xyz\r\nContent-Disposition: form-data; name="file"; filename="cv.pdf"\r\n'
+            b"Content-Type: application/pdf\r\n\r\n" + os.urandom(2000))
+    response = client.post(f"/resumes/{resume['resume_id']}/file", content=body,
+                           headers={"Content-Type": "multipart/form-data; boundary=xyz"})
+    assert response.status_code == 400
+    assert list(blob_store.tmp_dir.iterdir()) == []
+    assert client.get(f"/resumes/{resume['resume_id']}").json()["content_hash"] is None
+
+def test_duplicate_uploads_share_one_blob():
+    content = os.urandom(50_000)
+    digest = hashlib.sha256(content).hexdigest()
+    before = client.get("/resumes/storage").json()
+
+    first, second = create_resume(), create_resume()
+    assert upload(first["resume_id"], content).json()["content_hash"] == digest
+    assert upload(second["resume_id"], content, filename="copy.pdf").json()["content_hash"] == digest
+    assert len(list(blob_store.root.glob("*/*/*"))) == 1
+
+    after = client.get("/resumes/storage").json()
+    assert after["blobs"] == before["blobs"] + 1
+    assert after["resume_files"] == before["resume_files"] + 2
+    assert after["stored_bytes"] - before["stored_bytes"] == len(content)
+    assert after["saved_bytes"] - before["saved_bytes"] == len(content)
+
+def test_known_digest_attaches_without_upload():
+    content = os.urandom(20_000)
+    digest = hashlib.sha256(content).hexdigest()
+    upload(create_resume()["resume_id"], content)
+
+    resume = create_resume()
+    response = client.post(f"/resumes/{resume['resume_id']}/file?sha256={digest}&filename=again.pdf")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["content_hash"] == digest
+    assert data["file_size"] == len(content)
+    assert data["file_name"] == "again.pdf"
+    assert client.get(f"/resumes/{resume['resume_id']}/file").content == content
+
+def test_unknown_digest_requires_matching_upload():
+    resume = create_resume()
+    content = os.urandom(1_000)
+    wrong = hashlib.sha256(b"other").hexdigest()
+    assert client.post(f"/resumes/{resume['resume_id']}/file?sha256={wrong}").status_code == 415
+    response = client.post(f"/resumes/{resume['resume_id']}/file?sha256={wrong}",
+                           files={"file": ("cv.pdf", content, "application/pdf")})
+    assert response.status_code == 400
+
+def test_changing_file_url_detaches_blob():
+    resume = create_resume()
+    upload(resume["resume_id"], os.urandom(1_000))
+    data = client.put(f"/resumes/{resume['resume_id']}", json={"file_url": "http://example.com/new.pdf"}).json()
+    assert data["content_hash"] is None
+    assert data["file_size"] is None
+    assert client.get(f"/resumes/{resume['resume_id']}/file").status_code == 404
@@ -0,0 +1,72 @@
+import uuid
+
+from fastapi.testclient import TestClient
+
+from app.core.database import SessionLocal
+from app.core.text_extraction import DONE, FAILED, Extraction
+from app.crud.extraction import save_extractions
+from app.crud.resume_search import parse_search_query
+from app.main import app
+
+client = TestClient(app)
+
+def create_resume_with_text(text, status=DONE):
+    candidate = client.post("/candidates/", json={
+        "first_name": "Search",
+        "last_name": "Text",
+        "email": f"search_{uuid.uuid4().hex[:8]}@example.com"
+    }).json()
+    resume = client.post("/resumes/", json={
+        "candidate_id": candidate["candidate_id"],
+        "title": "Engineer",
+        "file_url": f"/tmp/{uuid.uuid4().hex}.txt"
+    }).json()
+    db = SessionLocal()
+    try:
+        extraction = Extraction(status, text=text if status == DONE else None)
+        save_extractions(db, [(resume["resume_id"], resume["file_url"], extraction)])
+    finally:
+        db.close()
+    return resume
+
+def search(q):
+    response = client.get("/resumes/search", params={"q": q})
+    assert response.status_code == 200
+    return response.json()
+
+def test_parse_search_query():
+    assert parse_search_query("Kubernetes AND Go") == [[(False, "kubernetes"), (False, "go")]]
+    assert parse_search_query('python OR "machine learning" -php') == [
+        [(False, "python")],
+        [(False, "machine learning"), (True, "php")],
+    ]
+    assert parse_search_query("-php") == []
+
+def test_boolean_search_ranks_and_joins_candidate():
+    tag = uuid.uuid4().hex[:8]
+    both = create_resume_with_text(f"Platform engineer: kube{tag} clusters and golang{tag} services.")
+    only_kube = create_resume_with_text(f"Ops work with kube{tag} only.")
+    only_go = create_resume_with_text(f"Backend in golang{tag}.")
+
+    hits = search(f"kube{tag} AND golang{tag}")
+    assert [h["resume_id"] for h in hits] == [both["resume_id"]]
+    assert hits[0]["candidate"]["candidate_id"] == both["candidate_id"]
+    assert f"kube{tag}" in hits[0]["snippet"]
+
+    hits = search(f"kube{tag} OR golang{tag}")
+    ids = [h["resume_id"] for h in hits]
+    assert ids[0] == both["resume_id"]
+    assert set(ids) == {both["resume_id"], only_kube["resume_id"], only_go["resume_id"]}
+
+    hits = search(f"kube{tag} -golang{tag}")
+    assert [h["resume_id"] for h in hits] == [only_kube["resume_id"]]
+
+def test_phrase_and_failed_extractions():
+    tag = uuid.uuid4().hex[:8]
+    phrase = create_resume_with_text(f"Applied machine learning{tag} research.")
+    create_resume_with_text(f"Learning{tag} machine shop tools.")
+    create_resume_with_text(None, status=FAILED)
+
+    hits = search(f'"machine learning{tag}"')
+    assert [h["resume_id"] for h in hits] == [phrase["resume_id"]]
+    assert client.get("/resumes/search?q=").status_code == 422
@@ -144,3 +144,51 @@ def test_update_nonexistent_resume():
     })
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
+
+def test_resumes_cursor_pagination_walks_all_rows():
+    """Following X-Next-Cursor visits every resume exactly once, in ID order."""
+    candidate_response = client.post("/candidates/", json={
+        "first_name": "Resume",
+        "last_name": "Cursor",
+        "email": f"resume_cursor_{uuid.uuid4().hex[:8]}@example.com"
+    })
+    candidate_id = candidate_response.json()["candidate_id"]
+    for n in range(3):
+        client.post("/resumes/", json={
+            "candidate_id": candidate_id,
+            "title": f"Cursor Resume {n}",
+            "file_url": f"http://example.com/cursor{n}.pdf"
+        })
+
+    seen = []
+    response = client.get("/resumes/?limit=2")
+    while True:
+        assert response.status_code == 200
+        seen.extend(r["resume_id"] for r in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = client.get(f"/resumes/?limit=2&after={cursor}")
+
+    assert seen == sorted(set(seen))
+    all_resumes = client.get("/resumes/?limit=100000").json()
+    assert seen == [r["resume_id"] for r in all_resumes]
+
+def test_create_resume_single_statement(query_counter):
+    """Resume create relies on the foreign key instead of looking up the candidate first."""
+    candidate_response = client.post("/candidates/", json={
+        "first_name": "Resume",
+        "last_name": "OneTrip",
+        "email": f"resume_one_trip_{uuid.uuid4().hex[:8]}@example.com"
+    })
+    candidate_id = candidate_response.json()["candidate_id"]
+
+    query_counter.reset()
+    response = client.post("/resumes/", json={
+        "candidate_id": candidate_id,
+        "title": "Single Statement",
+        "file_url": "http://example.com/single.pdf"
+    })
+    assert response.status_code == 201
+    assert response.json()["uploaded_at"] is not None
+    assert query_counter.count == 1
@@ -0,0 +1,62 @@
+import uuid
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.crud.search import _trigram_rank, apply_candidate_filters
+from app.main import app
+from app.models import Candidate
+
+client = TestClient(app)
+
+def create_candidate(first_name, last_name, phone=None):
+    tag = uuid.uuid4().hex[:8]
+    response = client.post("/candidates/", json={
+        "first_name": first_name,
+        "last_name": last_name,
+        "email": f"{first_name.lower()}.{tag}@example.com",
+        "phone": phone
+    })
+    return response.json()
+
+def test_search_by_partial_name_ranks_exact_first():
+    tag = uuid.uuid4().hex[:6]
+    exact = create_candidate(f"Zed{tag}", "Search")
+    partial = create_candidate(f"Zed{tag}ediah", "Search")
+    response = client.get(f"/candidates/search?q=zed{tag}")
+    assert response.status_code == 200
+    ids = [c["candidate_id"] for c in response.json()]
+    assert ids[:2] == [exact["candidate_id"], partial["candidate_id"]]
+
+def test_search_by_email_and_formatted_phone():
+    tag = uuid.uuid4().hex[:6]
+    number = str(uuid.uuid4().int)[:7]
+    candidate = create_candidate(f"Phone{tag}", "Search", phone=f"(555) {number[:3]}-{number[3:]}")
+    by_email = client.get(f"/candidates/search?q={candidate['email'].split('@')[0]}").json()
+    assert candidate["candidate_id"] in [c["candidate_id"] for c in by_email]
+    by_phone = client.get(f"/candidates/search?q=555{number}").json()
+    assert candidate["candidate_id"] in [c["candidate_id"] for c in by_phone]
+
+def test_search_requires_query():
+    assert client.get("/candidates/search").status_code == 422
+    assert client.get("/candidates/search?q=").status_code == 422
+
+def test_list_candidates_field_filters():
+    tag = uuid.uuid4().hex[:6]
+    match = create_candidate(f"Filter{tag}", "Keep", phone="555-010-1234")
+    create_candidate(f"Filter{tag}", "Drop")
+    response = client.get(f"/candidates/?first_name=filter{tag}&last_name=keep")
+    assert [c["candidate_id"] for c in response.json()] == [match["candidate_id"]]
+    response = client.get(f"/candidates/?first_name=filter{tag}&phone=5550101234")
+    assert [c["candidate_id"] for c in response.json()] == [match["candidate_id"]]
+
+def test_trigram_match_groups_full_name():
+    # SQLite never reaches this path; PostgreSQL binds % tighter than ||
+    condition, _ = _trigram_rank("jon doe", "")
+    sql = str(select(Candidate.candidate_id).where(condition).compile(dialect=postgresql.dialect()))
+    assert "(candidates.first_name || ' ' || candidates.last_name) %" in sql
+
+def test_phone_filter_matches_index_expression():
+    stmt = apply_candidate_filters(select(Candidate.candidate_id), "postgresql", phone="555-12")
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "regexp_replace(candidates.phone, '[^0-9]', '', 'g')" in sql
@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app import schemas
+from app.core.config import settings
+from app.core.serialization import encode, row_serializer
+from app.main import app
+from app.models import Candidate, Resume
+
+client = TestClient(app)
+
+def make_candidate() -> Candidate:
+    created = datetime(2026, 3, 1, 9, 30, 15, 250000, tzinfo=timezone.utc)
+    candidate = Candidate(candidate_id=7, first_name="Zoë", last_name="Fast", email="zoe@example.com",
+                          phone=None, created_at=created, updated_at=None)
+    candidate.resumes = [
+        Resume(resume_id=n, candidate_id=7, title=f"Resume {n}", file_url=f"http://example.com/{n}.pdf",
+               uploaded_at=created, updated_at=datetime(2026, 3, 2), file_size=n * 100)
+        for n in (1, 2)
+    ]
+    return candidate
+
+def test_fast_path_matches_validated_output(monkeypatch):
+    candidate = make_candidate()
+    slow = encode(schemas.Candidate, [candidate])
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = encode(schemas.Candidate, [candidate])
+    assert fast.body == slow.body
+    assert fast.value == [candidate]  # ORM rows are passed through, not validated
+
+def test_row_serializer_follows_schema_fields():
+    data = row_serializer(schemas.Candidate)(make_candidate())
+    assert list(data) == list(schemas.Candidate.model_fields)
+    assert [resume["resume_id"] for resume in data["resumes"]] == [1, 2]
+    assert "candidate" not in data["resumes"][0]
+
+def test_list_endpoint_same_body_on_both_paths(monkeypatch):
+    email = f"fast_{uuid.uuid4().hex[:8]}@example.com"
+    candidate_id = client.post("/candidates/", json={
+        "first_name": "Fast", "last_name": "Path", "email": email
+    }).json()["candidate_id"]
+    client.post("/resumes/", json={
+        "candidate_id": candidate_id, "title": "Fast CV", "file_url": "http://example.com/fast.pdf"
+    })
+    slow = client.get("/candidates/", params={"email": email})
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    fast = client.get("/candidates/", params={"email": email})
+    assert fast.status_code == 200
+    assert fast.content == slow.content
+    assert fast.headers["etag"] == slow.headers["etag"]
+    assert fast.json()[0]["resumes"][0]["title"] == "Fast CV"
+
+def test_openapi_keeps_response_models():
+    spec = app.openapi()
+    response = spec["paths"]["/resumes/{resume_id}"]["get"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"]["$ref"].endswith("/Resume")